@@ -0,0 +1,31 @@
+from tkinter import PhotoImage
+
+_images: dict[str, PhotoImage] = {}
+
+
+def get_image(path: str) -> PhotoImage:
+    """
+    Returns the decoded image for an asset file, loading it from disk only the first time it is requested.
+
+    Frames that show the same logo share one PhotoImage instead of each decoding the PNG again. The cache
+    holds a reference to every image, so Tk does not discard them while they are displayed.
+
+    :param path: Path to the image file.
+    :return: The shared PhotoImage.
+    """
+    image: PhotoImage | None = _images.get(path)
+
+    if image is None:
+        image = PhotoImage(file=path)
+        _images[path] = image
+
+    return image
+
+
+def clear_images() -> None:
+    """
+    Drops every cached image, e.g. before the Tk root they belong to is destroyed.
+
+    :return: None
+    """
+    _images.clear()
@@ -0,0 +1,284 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from typing import BinaryIO, Callable, Iterable
+
+MAGIC = b"SPMBRX\x00\x00"
+FORMAT_VERSION = 1
+DIGEST_BYTES = 20
+# Records are bucketed on the first two digest bytes, which the offset table encodes so records store the rest
+PREFIX_BYTES = 2
+BUCKETS = 1 << (8 * PREFIX_BYTES)
+# Build-time spill files, one per first digest byte; only one of them is loaded and sorted at a time
+SPILL_FILES = 256
+PROGRESS_LINES = 1 << 16
+MAX_COUNT = 0xFFFFFFFF
+
+HEADER = struct.Struct(">8sBQ")
+BOUNDS = struct.Struct(">2Q")
+OFFSET = struct.Struct(">Q")
+RECORD = struct.Struct(f">{DIGEST_BYTES - PREFIX_BYTES}sI")
+SPILL_RECORD = struct.Struct(f">{DIGEST_BYTES}sI")
+TABLE_START = HEADER.size
+RECORDS_START = TABLE_START + (BUCKETS + 1) * OFFSET.size
+
+
+class BreachIndexError(Exception):
+    """
+    Raised when a breach list cannot be parsed or an index file is malformed or truncated.
+    """
+
+
+def password_digest(password: str) -> bytes:
+    """
+    :param password: A plain-text password.
+    :return: Its SHA-1 digest, the key breach lists are published under.
+    """
+    return hashlib.sha1(password.encode("utf-8")).digest()
+
+
+def parse_line(line: bytes) -> tuple[bytes, int] | None:
+    """
+    Parses one line of a breach list in the Have I Been Pwned format, "<SHA-1 hex>:<count>". The count is
+    optional and defaults to 1.
+
+    :param line: The raw line.
+    :return: The digest and breach count, or None for a blank line.
+    :raises BreachIndexError: If the line is not a SHA-1 hash and count.
+    """
+    hex_digest, _, count = line.strip().partition(b":")
+
+    if not hex_digest:
+        return None
+
+    try:
+        digest: bytes = bytes.fromhex(hex_digest.decode("ascii"))
+        times: int = int(count) if count else 1
+
+    except ValueError as error:
+        raise BreachIndexError(f"Not a SHA-1 hash and count: {line[:60]!r}") from error
+
+    if len(digest) != DIGEST_BYTES or times < 0:
+        raise BreachIndexError(f"Not a SHA-1 hash and count: {line[:60]!r}")
+
+    return digest, min(times, MAX_COUNT)
+
+
+def build_index(source: str, path: str, progress: Callable[[int, int], None] | None = None) -> int:
+    """
+    Builds a breach index from a downloaded breach list of SHA-1 hashes, in any order.
+
+    The list is streamed into spill files by first digest byte, then each spill file is sorted on its own and
+    appended to the index, so memory is bounded by the largest spill file (about 1/256 of the list) rather than
+    the list itself. Hashes listed more than once are merged and their counts added. The index is written to
+    a temporary file and renamed over `path`, so an interrupted build leaves any previous index intact.
+
+    :param source: The breach list, one "<SHA-1 hex>:<count>" line per hash.
+    :param path: Where to write the index.
+    :param progress: Optional callable receiving (bytes read, total bytes) while the list is read.
+    :return: The number of distinct hashes indexed.
+    :raises BreachIndexError: If a line of the list cannot be parsed.
+    """
+    total: int = os.path.getsize(source)
+    directory: str = os.path.dirname(os.path.abspath(path))
+
+    with tempfile.TemporaryDirectory(dir=directory) as spill_dir:
+        spills: list[BinaryIO] = [open(os.path.join(spill_dir, f"{first:02x}"), "wb")
+                                  for first in range(SPILL_FILES)]
+
+        try:
+            with open(source, "rb") as file:
+                done: int = 0
+
+                for number, line in enumerate(file, 1):
+                    done += len(line)
+                    record: tuple[bytes, int] | None = parse_line(line)
+
+                    if record is not None:
+                        spills[record[0][0]].write(SPILL_RECORD.pack(*record))
+
+                    if progress is not None and number % PROGRESS_LINES == 0:
+                        progress(done, total)
+        finally:
+            for spill in spills:
+                spill.close()
+
+        with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as output:
+            try:
+                count: int = write_records(output, spill_dir)
+                output.flush()
+                os.fsync(output.fileno())
+
+            except BaseException:
+                output.close()
+                os.unlink(output.name)
+                raise
+
+        os.replace(output.name, path)
+
+    if progress is not None:
+        progress(total, total)
+
+    return count
+
+
+def write_records(output: BinaryIO, spill_dir: str) -> int:
+    """
+    Writes the header, offset table and sorted records of an index from its spill files.
+
+    :param output: The index file, opened for binary writing.
+    :param spill_dir: Directory holding one spill file per first digest byte.
+    :return: The number of records written.
+    """
+    starts: list[int] = [0] * (BUCKETS + 1)
+    count: int = 0
+    output.seek(RECORDS_START)
+
+    for first in range(SPILL_FILES):
+        with open(os.path.join(spill_dir, f"{first:02x}"), "rb") as spill:
+            data: bytes = spill.read()
+
+        records: list[tuple[bytes, int]] = sorted(SPILL_RECORD.iter_unpack(data))
+        del data
+        packed: list[bytes] = []
+        previous: bytes = b""
+
+        for digest, times in records:
+            if digest == previous:
+                suffix, earlier = RECORD.unpack(packed[-1])
+                packed[-1] = RECORD.pack(suffix, min(earlier + times, MAX_COUNT))
+                continue
+
+            starts[int.from_bytes(digest[:PREFIX_BYTES], "big") + 1] += 1
+            packed.append(RECORD.pack(digest[PREFIX_BYTES:], times))
+            previous = digest
+
+        output.write(b"".join(packed))
+        count += len(packed)
+
+    for bucket in range(BUCKETS):
+        starts[bucket + 1] += starts[bucket]
+
+    output.seek(0)
+    output.write(HEADER.pack(MAGIC, FORMAT_VERSION, count))
+    output.write(struct.pack(f">{BUCKETS + 1}Q", *starts))
+    return count
+
+
+class BreachIndex:
+    """
+    Read-only view of a breach index file, memory-mapped so the corpus is never loaded into memory.
+
+    The file holds a header, an offset table giving where each two-byte digest prefix's bucket of records
+    starts, and the records: the rest of each SHA-1 digest with its breach count, sorted. A lookup reads one
+    table entry and binary searches its bucket, so it touches O(log n) pages and the operating system's page
+    cache keeps the hot ones. Lookups never leave the machine.
+
+    :param path: Path to an index written by `build_index`.
+    :raises BreachIndexError: If the file is not a complete breach index.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+
+        with open(path, "rb") as file:
+            try:
+                self._map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                raise BreachIndexError(f"Empty breach index {path}") from error
+
+        try:
+            self._count: int = self._read_header()
+        except BreachIndexError:
+            self._map.close()
+            raise
+
+    def _read_header(self) -> int:
+        """
+        Checks the header and size of the mapped file.
+
+        :return: The number of records in the index.
+        :raises BreachIndexError: If the file is not a complete breach index.
+        """
+        if len(self._map) < RECORDS_START:
+            raise BreachIndexError(f"Not a breach index: {self.path}")
+
+        magic, version, count = HEADER.unpack_from(self._map)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise BreachIndexError(f"Not a breach index: {self.path}")
+
+        if len(self._map) != RECORDS_START + count * RECORD.size:
+            raise BreachIndexError(f"Truncated breach index {self.path}")
+
+        return count
+
+    def __len__(self) -> int:
+        """
+        :return: The number of distinct hashes in the index.
+        """
+        return self._count
+
+    def __enter__(self) -> 'BreachIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps the index file.
+
+        :return: None
+        """
+        self._map.close()
+
+    def count_digest(self, digest: bytes) -> int:
+        """
+        Looks up a SHA-1 digest.
+
+        :param digest: The 20-byte digest.
+        :return: How many times it appears in the breach corpus, or 0 if it does not.
+        """
+        low, high = BOUNDS.unpack_from(self._map, TABLE_START + int.from_bytes(digest[:PREFIX_BYTES], "big")
+                                       * OFFSET.size)
+        suffix: bytes = digest[PREFIX_BYTES:]
+
+        while low < high:
+            middle: int = (low + high) // 2
+            found, times = RECORD.unpack_from(self._map, RECORDS_START + middle * RECORD.size)
+
+            if found == suffix:
+                return times
+
+            if found < suffix:
+                low = middle + 1
+            else:
+                high = middle
+
+        return 0
+
+    def count(self, password: str) -> int:
+        """
+        :param password: A plain-text password.
+        :return: How many times it appears in the breach corpus, or 0 if it does not.
+        """
+        return self.count_digest(password_digest(password))
+
+    def count_many(self, passwords: Iterable[str]) -> list[int]:
+        """
+        Looks up a batch of passwords. Lookups are made in digest order, so they move forward through the file
+        and batches share pages instead of touching them at random.
+
+        :param passwords: Plain-text passwords.
+        :return: The breach count of each password, in the order given.
+        """
+        digests: list[bytes] = [password_digest(password) for password in passwords]
+        counts: list[int] = [0] * len(digests)
+
+        for position in sorted(range(len(digests)), key=digests.__getitem__):
+            counts[position] = self.count_digest(digests[position])
+
+        return counts
@@ -0,0 +1,196 @@
+import codecs
+import csv
+import json
+import os
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, NamedTuple
+from urllib.parse import urlsplit
+
+from Application.Utils.CredentialStore import CredentialStore
+from Application.Utils.VaultSession import VaultSession
+
+IMPORT_BATCH = 1000
+
+# Column names used by this app's exports and by common browser and password-manager CSV exports
+# (Chrome, Firefox, Bitwarden, LastPass, 1Password), checked in order of preference.
+SITE_COLUMNS = ("site", "name", "title", "login_uri", "url", "website", "origin", "hostname")
+URL_COLUMNS = ("login_uri", "url", "website", "origin")
+USERNAME_COLUMNS = ("username", "login_username", "login", "user", "email")
+PASSWORD_COLUMNS = ("password", "login_password")
+
+
+class ImportResult(NamedTuple):
+    """
+    Outcome of a bulk import.
+
+    :param imported: Number of entries written to the store.
+    :param duplicates: Number of rows skipped because their account was already stored or appeared earlier in the file.
+    :param skipped: Number of rows skipped because they had no site or no password.
+    """
+    imported: int
+    duplicates: int
+    skipped: int
+
+
+def site_from_url(url: str) -> str:
+    """
+    Reduces a URL to its host name, e.g. 'https://accounts.google.com/login' -> 'accounts.google.com'.
+
+    :param url: The URL, with or without a scheme.
+    :return: The host name, or the input unchanged if it is not a URL.
+    """
+    if any(char.isspace() for char in url):
+        return url
+
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    return parts.hostname or url
+
+
+def normalize_row(row: dict) -> tuple[str, str, str] | None:
+    """
+    Maps one exported record onto (site, username, password) using the known column names.
+
+    :param row: A record read from a CSV or JSON export.
+    :return: The normalized entry, or None if the record has no site or no password.
+    """
+    fields: dict[str, str] = {str(key).strip().lower(): str(value) for key, value in row.items()
+                              if value is not None}
+    site: str = ""
+
+    for column in SITE_COLUMNS:
+        if fields.get(column, "").strip():
+            value: str = fields[column].strip()
+            site = site_from_url(value) if column in URL_COLUMNS else value
+            break
+
+    username: str = next((fields[column].strip() for column in USERNAME_COLUMNS if fields.get(column)), "")
+    password: str = next((fields[column] for column in PASSWORD_COLUMNS if fields.get(column)), "")
+
+    if not site or not password:
+        return None
+
+    return site, username, password
+
+
+def read_csv(file: BinaryIO) -> Iterator[dict]:
+    """
+    Streams the records of a CSV export that has a header row.
+
+    :param file: The CSV file, opened in binary mode.
+    :return: An iterator of records keyed by column name.
+    """
+    yield from csv.DictReader(codecs.iterdecode(file, "utf-8-sig"))
+
+
+def read_jsonl(file: BinaryIO) -> Iterator[dict]:
+    """
+    Streams the records of a JSON Lines export.
+
+    :param file: The JSON Lines file, opened in binary mode.
+    :return: An iterator of records.
+    """
+    for line in codecs.iterdecode(file, "utf-8"):
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_json(file: BinaryIO) -> Iterator[dict]:
+    """
+    Reads the records of a JSON export.
+
+    Understands this app's export format ({site: [{"username", "password"}, ...]}) and the single-account format
+    of earlier versions ({site: {"username", "password"}}), Bitwarden's JSON export
+    ({"items": [{"name", "login": {...}}]}) and plain lists of records. The standard library cannot stream a
+    single JSON document, so the file is parsed in one go; use CSV or JSON Lines for very large imports.
+
+    :param file: The JSON file, opened in binary mode.
+    :return: An iterator of records.
+    """
+    data = json.loads(file.read().decode("utf-8"))
+
+    if isinstance(data, list):
+        yield from (record for record in data if isinstance(record, dict))
+
+    elif isinstance(data, dict) and isinstance(data.get("items"), list):
+        for item in data["items"]:
+            login: dict = item.get("login") or {}
+            uris: list[dict] = login.get("uris") or [{}]
+            yield {"name": item.get("name"), "username": login.get("username"),
+                   "password": login.get("password"), "login_uri": uris[0].get("uri")}
+
+    elif isinstance(data, dict):
+        for site, accounts in data.items():
+            for creds in accounts if isinstance(accounts, list) else [accounts]:
+                if isinstance(creds, dict):
+                    yield {"site": site, **creds}
+
+
+def read_records(path: Path, file: BinaryIO) -> Iterator[dict]:
+    """
+    Streams the records of an export file, choosing the reader from the file extension.
+
+    :param path: The export file's path (.csv, .jsonl, or .json/.txt).
+    :param file: The export file, opened in binary mode. Its position tells how far the records have been read.
+    :return: An iterator of records.
+    """
+    suffix: str = path.suffix.lower()
+
+    if suffix == ".csv":
+        return read_csv(file)
+
+    if suffix == ".jsonl":
+        return read_jsonl(file)
+
+    return read_json(file)
+
+
+def import_credentials(path: str, store: CredentialStore, session: VaultSession,
+                       progress: Callable[[int, int], None] | None = None,
+                       batch_size: int = IMPORT_BATCH) -> ImportResult:
+    """
+    Imports credentials from an export file into the store in a single transaction.
+
+    Records are streamed from the file and normalized. Records whose site and username are already stored, or
+    that repeat an account seen earlier in the file, are skipped. The rest are encrypted `batch_size` at a time
+    using the session's worker pool. Nothing is committed unless the whole file is processed.
+
+    :param path: The export file to import.
+    :param store: The credential store to import into.
+    :param session: The unlocked vault session used to encrypt the passwords.
+    :param progress: Optional callable receiving (bytes read, file size) after each batch.
+    :param batch_size: Number of records encrypted together.
+    :return: The number of entries imported and skipped.
+    """
+    total: int = os.path.getsize(path)
+    seen: set[tuple[str, str]] = set(store.keys())
+    imported: int = 0
+    duplicates: int = 0
+    skipped: int = 0
+
+    with open(path, "rb") as file, store.transaction():
+        records: Iterator[dict] = read_records(Path(path), file)
+
+        while batch := list(islice(records, batch_size)):
+            entries: list[tuple[str, str, str]] = []
+
+            for record in batch:
+                entry: tuple[str, str, str] | None = normalize_row(record)
+
+                if entry is None:
+                    skipped += 1
+                elif entry[:2] in seen:
+                    duplicates += 1
+                else:
+                    seen.add(entry[:2])
+                    entries.append(entry)
+
+            encrypted: list[str] = session.encrypt_many(password for _, _, password in entries)
+            store.put_many((site, username, token) for (site, username, _), token in zip(entries, encrypted))
+
+            imported += len(entries)
+
+            if progress is not None:
+                progress(file.tell(), total)
+
+    return ImportResult(imported, duplicates, skipped)
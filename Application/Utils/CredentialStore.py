@@ -0,0 +1,712 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from itertools import islice
+from json import JSONDecodeError
+from typing import Iterable, Iterator, NamedTuple
+
+from Application.Utils.LoggingController import log_error_and_method
+
+SCHEMA_VERSION = 2
+ITER_BATCH = 500
+
+
+class Entry(NamedTuple):
+    """
+    One stored account.
+
+    :param entry_id: Stable identifier of the entry, kept when any of its fields change.
+    :param site: The website the account is for.
+    :param username: The username or email of the account.
+    :param password: The encrypted password.
+    :param tags: The entry's tags, sorted.
+    :param notes: Free-text notes.
+    :param created: When the entry was created, in seconds since the epoch.
+    :param modified: When the entry was last changed, in seconds since the epoch.
+    """
+    entry_id: int
+    site: str
+    username: str
+    password: str
+    tags: tuple[str, ...]
+    notes: str
+    created: float
+    modified: float
+
+
+class CredentialStore(ABC):
+    """
+    Storage backend for encrypted credentials, keyed by site and username, so a site can hold several accounts.
+
+    Backends only ever see encrypted passwords; encryption and decryption stay with the vault session.
+    Every mutation outside a `transaction()` block is committed on its own.
+    """
+
+    @abstractmethod
+    def get(self, site: str, username: str | None = None) -> dict[str, str] | None:
+        """
+        Looks up the credentials stored for an account.
+
+        :param site: The website to look up.
+        :param username: The account to look up, or None for the site's first account by username.
+        :return: A dictionary with the username and encrypted password, or None if the account is not stored.
+        """
+
+    @abstractmethod
+    def put(self, site: str, username: str, password: str) -> None:
+        """
+        Inserts or replaces the credentials stored for an account. An account is identified by its site and
+        username, so a new username on a stored site adds a second account.
+
+        :param site: The website to associate with the credentials.
+        :param username: The username or email to store.
+        :param password: The encrypted password to store.
+        :return: None
+        """
+
+    def put_many(self, entries: Iterable[tuple[str, str, str]]) -> None:
+        """
+        Inserts or replaces several accounts in one transaction.
+
+        :param entries: (site, username, encrypted password) tuples.
+        :return: None
+        """
+        with self.transaction():
+            for site, username, password in entries:
+                self.put(site, username, password)
+
+    def get_many(self, sites: Iterable[str]) -> dict[str, dict[str, str]]:
+        """
+        Looks up the credentials stored for several sites.
+
+        :param sites: The websites to look up.
+        :return: A dictionary mapping each stored site to the username and encrypted password of its first
+                 account by username. Sites that are not stored are left out.
+        """
+        found: dict[str, dict[str, str]] = {}
+
+        for site in sites:
+            creds: dict[str, str] | None = self.get(site)
+
+            if creds is not None:
+                found[site] = creds
+
+        return found
+
+    @abstractmethod
+    def delete(self, site: str, username: str | None = None) -> int:
+        """
+        Removes the credentials stored for an account, or for every account on a site.
+
+        :param site: The website to remove.
+        :param username: The account to remove, or None to remove every account on the site.
+        :return: The number of accounts removed.
+        """
+
+    def delete_many(self, sites: Iterable[str]) -> int:
+        """
+        Removes every account on several sites in one transaction.
+
+        :param sites: The websites to remove.
+        :return: The number of accounts removed.
+        """
+        with self.transaction():
+            return sum(self.delete(site) for site in sites)
+
+    @abstractmethod
+    def items(self) -> Iterator[tuple[str, dict[str, str]]]:
+        """
+        Iterates over every stored account, ordered by site and then username.
+
+        :return: An iterator of (site, {"username": ..., "password": ...}) pairs.
+        """
+
+    def sites(self) -> Iterator[str]:
+        """
+        Iterates over every stored site name once, ordered by site.
+
+        :return: An iterator of site names.
+        """
+        last: str | None = None
+
+        for site, _ in self.items():
+            if site != last:
+                yield site
+                last = site
+
+    def keys(self) -> Iterator[tuple[str, str]]:
+        """
+        Iterates over the site and username of every stored account, in the same order as `items()`.
+
+        :return: An iterator of (site, username) pairs.
+        """
+        return ((site, creds["username"]) for site, creds in self.items())
+
+    def page(self, offset: int, limit: int) -> list[tuple[str, dict[str, str]]]:
+        """
+        Returns a slice of the entries, in the same order as `items()`.
+
+        :param offset: Number of entries to skip.
+        :param limit: Maximum number of entries to return.
+        :return: A list of (site, {"username": ..., "password": ...}) pairs.
+        """
+        return list(islice(self.items(), offset, offset + limit))
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        :return: The number of stored accounts.
+        """
+
+    @abstractmethod
+    @contextmanager
+    def transaction(self) -> Iterator['CredentialStore']:
+        """
+        Groups several mutations so they are committed together, or not at all if an exception is raised.
+
+        :return: A context manager yielding the store.
+        """
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the backend.
+
+        :return: None
+        """
+
+
+class EntryStore(CredentialStore):
+    """
+    Credential store with the normalized entry model: each account is an `Entry` with a stable ID, tags, notes
+    and timestamps, and entries can be found by site, username or tag through secondary indexes.
+    """
+
+    @abstractmethod
+    def get_entry(self, entry_id: int) -> Entry | None:
+        """
+        :param entry_id: The entry to look up.
+        :return: The entry, or None if it does not exist.
+        """
+
+    @abstractmethod
+    def find(self, site: str | None = None, username: str | None = None, tag: str | None = None) -> list[Entry]:
+        """
+        Finds the entries matching every criterion given. Each criterion is an exact match served by an index,
+        so the cost grows with the number of matches rather than the size of the vault.
+
+        :param site: Only entries for this site.
+        :param username: Only entries with this username.
+        :param tag: Only entries with this tag.
+        :return: The matching entries, ordered by site and then username.
+        """
+
+    @abstractmethod
+    def entries(self) -> Iterator[Entry]:
+        """
+        Iterates over every entry with its tags and notes, in the same order as `items()`.
+
+        :return: An iterator of entries.
+        """
+
+    @abstractmethod
+    def add_entry(self, site: str, username: str, password: str, tags: Iterable[str] = (), notes: str = "",
+                  created: float | None = None) -> int:
+        """
+        Inserts or replaces an account with its tags and notes. Replacing an account keeps its ID and
+        creation time.
+
+        :param site: The website the account is for.
+        :param username: The username or email of the account.
+        :param password: The encrypted password.
+        :param tags: The entry's tags.
+        :param notes: Free-text notes.
+        :param created: When a new entry was created, e.g. when restoring a backup, or None for now.
+        :return: The ID of the entry.
+        """
+
+    @abstractmethod
+    def update_entry(self, entry_id: int, site: str | None = None, username: str | None = None,
+                     password: str | None = None, tags: Iterable[str] | None = None,
+                     notes: str | None = None) -> bool:
+        """
+        Changes the given fields of an entry and updates its modification time. Fields left as None are kept.
+
+        :param entry_id: The entry to change.
+        :param site: The new site.
+        :param username: The new username.
+        :param password: The new encrypted password.
+        :param tags: The new tags, replacing the old ones.
+        :param notes: The new notes.
+        :return: True if the entry was changed, False if it does not exist.
+        :raises sqlite3.IntegrityError: If another entry already holds the new site and username.
+        """
+
+    @abstractmethod
+    def delete_entry(self, entry_id: int) -> bool:
+        """
+        :param entry_id: The entry to remove.
+        :return: True if the entry was removed, False if it does not exist.
+        """
+
+    @abstractmethod
+    def tags(self) -> list[str]:
+        """
+        :return: Every tag in use, sorted.
+        """
+
+
+class JsonCredentialStore(CredentialStore):
+    """
+    Legacy backend that keeps the whole vault in a single JSON file.
+
+    The file maps each site to one account, so storing a second username for a site replaces the first.
+    Every committed mutation rewrites the entire file, so it is only suited to small vaults and to reading
+    existing Creds.json files during migration. It cannot hold the normalized entry model.
+
+    :param path: Path to the JSON credentials file.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self._data: dict[str, dict[str, str]] = self._load()
+        self._depth: int = 0
+        self._lock: threading.RLock = threading.RLock()
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        """
+        Reads the credentials file.
+
+        :return: The stored entries, or an empty dictionary if the file is missing or invalid.
+        """
+        try:
+            with open(file=self.path, mode='r') as data_file:
+                return json.load(data_file)
+
+        except (FileNotFoundError, JSONDecodeError) as error:
+            log_error_and_method(error)
+            return {}
+
+    def _save(self) -> None:
+        """
+        Writes the entries back to the credentials file unless a transaction is still open. The entries go to a
+        temporary file that is fsynced and renamed over the original, so a crash never leaves a half-written file.
+
+        :return: None
+        """
+        if self._depth:
+            return None
+
+        temp_path: str = f"{self.path}.tmp"
+
+        try:
+            with open(file=temp_path, mode='w') as data_file:
+                json.dump(self._data, data_file, indent=4)
+                data_file.flush()
+                os.fsync(data_file.fileno())
+
+            os.replace(temp_path, self.path)
+
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return None
+
+    def get(self, site: str, username: str | None = None) -> dict[str, str] | None:
+        creds: dict[str, str] | None = self._data.get(site)
+
+        if creds is None or username not in (None, creds["username"]):
+            return None
+
+        return dict(creds)
+
+    def put(self, site: str, username: str, password: str) -> None:
+        with self._lock:
+            self._data[site] = {"username": username, "password": password}
+            self._save()
+
+    def delete(self, site: str, username: str | None = None) -> int:
+        with self._lock:
+            if self.get(site, username) is None:
+                return 0
+
+            del self._data[site]
+            self._save()
+            return 1
+
+    def items(self) -> Iterator[tuple[str, dict[str, str]]]:
+        for site in sorted(self._data):
+            yield site, dict(self._data[site])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @contextmanager
+    def transaction(self) -> Iterator['JsonCredentialStore']:
+        with self._lock:
+            snapshot: dict[str, dict[str, str]] | None = dict(self._data) if self._depth == 0 else None
+            self._depth += 1
+
+            try:
+                yield self
+
+            except BaseException:
+                self._depth -= 1
+                if snapshot is not None:
+                    self._data = snapshot
+                raise
+
+            self._depth -= 1
+            self._save()
+
+
+ENTRY_COLUMNS = "id, site, username, password, notes, created, modified"
+UPSERT = ("INSERT INTO entries (site, username, password, created, modified) VALUES (?, ?, ?, ?, ?) "
+          "ON CONFLICT(site, username) DO UPDATE SET password = excluded.password, modified = excluded.modified")
+
+
+class SqliteCredentialStore(EntryStore):
+    """
+    Backend that keeps credentials in an SQLite database with one row per account.
+
+    Entries are keyed by an integer ID and unique on (site, username). That unique index also serves lookups by
+    site, and further indexes serve lookups by username and tag, so single-entry lookups and upserts cost the
+    same regardless of vault size or of how many accounts a site holds. The connection is shared between
+    threads and guarded by a lock.
+
+    Writes go through SQLite's write-ahead log, and each commit is fsynced before it returns. A process killed
+    mid-write, or a power loss, leaves the database at its last committed transaction; an interrupted
+    transaction is rolled back from the log when the database is next opened.
+
+    Databases written with the one-account-per-site schema are migrated to the entry schema on open.
+
+    :param path: Path to the SQLite database file.
+    :param legacy_json: Optional path to a Creds.json file to import the first time the database is created.
+    """
+
+    def __init__(self, path: str, legacy_json: str | None = None):
+        self.path: str = path
+        self._lock: threading.RLock = threading.RLock()
+        self._depth: int = 0
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn: sqlite3.Connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # ASSERT: NORMAL would only sync the log at checkpoints, so a power loss could undo commits already reported
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._create_schema(legacy_json)
+
+    def _create_schema(self, legacy_json: str | None) -> None:
+        """
+        Creates the entry tables on first use, and runs the one-shot Creds.json migration or the migration from
+        the one-account-per-site table.
+
+        :param legacy_json: Optional path to a Creds.json file to migrate.
+        :return: None
+        """
+        version: int = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return None
+
+        with self.transaction():
+            self._conn.execute("CREATE TABLE IF NOT EXISTS entries ("
+                               "id INTEGER PRIMARY KEY, "
+                               "site TEXT NOT NULL, "
+                               "username TEXT NOT NULL, "
+                               "password TEXT NOT NULL, "
+                               "notes TEXT NOT NULL DEFAULT '', "
+                               "created REAL NOT NULL, "
+                               "modified REAL NOT NULL, "
+                               "UNIQUE (site, username))")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entries_by_username ON entries (username, site)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS entry_tags ("
+                               "tag TEXT NOT NULL, "
+                               "entry_id INTEGER NOT NULL REFERENCES entries (id) ON DELETE CASCADE, "
+                               "PRIMARY KEY (tag, entry_id)) WITHOUT ROWID")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entry_tags_by_entry ON entry_tags (entry_id)")
+
+            if version == 1:
+                now: float = time.time()
+                self._conn.execute("INSERT INTO entries (site, username, password, created, modified) "
+                                   "SELECT site, username, password, ?, ? FROM creds ORDER BY site", (now, now))
+                self._conn.execute("DROP TABLE creds")
+
+            elif legacy_json is not None and os.path.exists(legacy_json):
+                self.migrate_from_json(legacy_json)
+
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        return None
+
+    def migrate_from_json(self, json_path: str) -> int:
+        """
+        Copies every entry from a legacy Creds.json file into the database in a single transaction.
+
+        Accounts already present in the database are overwritten.
+
+        :param json_path: Path to the JSON credentials file.
+        :return: The number of entries migrated.
+        """
+        legacy: JsonCredentialStore = JsonCredentialStore(json_path)
+        rows: list[tuple[str, str, str]] = [(site, creds["username"], creds["password"])
+                                            for site, creds in legacy.items()]
+        self.put_many(rows)
+        return len(rows)
+
+    def get(self, site: str, username: str | None = None) -> dict[str, str] | None:
+        with self._lock:
+            if username is None:
+                row = self._conn.execute("SELECT username, password FROM entries WHERE site = ? "
+                                         "ORDER BY username LIMIT 1", (site,)).fetchone()
+            else:
+                row = self._conn.execute("SELECT username, password FROM entries WHERE site = ? AND username = ?",
+                                         (site, username)).fetchone()
+
+        if row is None:
+            return None
+
+        return {"username": row[0], "password": row[1]}
+
+    def get_many(self, sites: Iterable[str]) -> dict[str, dict[str, str]]:
+        found: dict[str, dict[str, str]] = {}
+        sites = iter(sites)
+
+        # One query per chunk instead of one per site, staying under SQLite's bound-parameter limit
+        while chunk := list(islice(sites, ITER_BATCH)):
+            with self._lock:
+                rows: list[tuple[str, str, str]] = self._conn.execute(
+                    f"SELECT site, username, password FROM entries WHERE site IN ({', '.join('?' * len(chunk))}) "
+                    "ORDER BY site, username", chunk).fetchall()
+
+            for site, username, password in rows:
+                found.setdefault(site, {"username": username, "password": password})
+
+        return found
+
+    def put(self, site: str, username: str, password: str) -> None:
+        now: float = time.time()
+
+        with self._lock:
+            self._conn.execute(UPSERT, (site, username, password, now, now))
+
+    def put_many(self, entries: Iterable[tuple[str, str, str]]) -> None:
+        now: float = time.time()
+
+        with self.transaction():
+            self._conn.executemany(UPSERT, ((site, username, password, now, now)
+                                            for site, username, password in entries))
+
+    def delete(self, site: str, username: str | None = None) -> int:
+        with self._lock:
+            if username is None:
+                cursor: sqlite3.Cursor = self._conn.execute("DELETE FROM entries WHERE site = ?", (site,))
+            else:
+                cursor = self._conn.execute("DELETE FROM entries WHERE site = ? AND username = ?", (site, username))
+
+            return cursor.rowcount
+
+    def items(self) -> Iterator[tuple[str, dict[str, str]]]:
+        # Keyset pagination keeps memory flat without holding the lock while the caller consumes rows
+        last_key: tuple[str, str] | None = None
+
+        while True:
+            with self._lock:
+                if last_key is None:
+                    rows: list[tuple[str, str, str]] = self._conn.execute(
+                        "SELECT site, username, password FROM entries ORDER BY site, username LIMIT ?",
+                        (ITER_BATCH,)).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT site, username, password FROM entries WHERE (site, username) > (?, ?) "
+                        "ORDER BY site, username LIMIT ?", (*last_key, ITER_BATCH)).fetchall()
+
+            for site, username, password in rows:
+                yield site, {"username": username, "password": password}
+
+            if len(rows) < ITER_BATCH:
+                return None
+
+            last_key = rows[-1][0], rows[-1][1]
+
+    def sites(self) -> Iterator[str]:
+        with self._lock:
+            rows: list[tuple[str]] = self._conn.execute("SELECT DISTINCT site FROM entries ORDER BY site").fetchall()
+
+        return (row[0] for row in rows)
+
+    def keys(self) -> Iterator[tuple[str, str]]:
+        with self._lock:
+            rows: list[tuple[str, str]] = self._conn.execute(
+                "SELECT site, username FROM entries ORDER BY site, username").fetchall()
+
+        return iter(rows)
+
+    def page(self, offset: int, limit: int) -> list[tuple[str, dict[str, str]]]:
+        with self._lock:
+            rows: list[tuple[str, str, str]] = self._conn.execute(
+                "SELECT site, username, password FROM entries ORDER BY site, username LIMIT ? OFFSET ?",
+                (limit, offset)).fetchall()
+
+        return [(site, {"username": username, "password": password}) for site, username, password in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _entries(self, rows: list[tuple]) -> list[Entry]:
+        """
+        Builds entries from rows of `ENTRY_COLUMNS`, loading their tags in one query.
+
+        :param rows: The entry rows.
+        :return: The entries, in the order of the rows.
+        """
+        tags: dict[int, list[str]] = {}
+        ids: list[int] = [row[0] for row in rows]
+
+        for start in range(0, len(ids), ITER_BATCH):
+            chunk: list[int] = ids[start:start + ITER_BATCH]
+
+            with self._lock:
+                tag_rows: list[tuple[int, str]] = self._conn.execute(
+                    f"SELECT entry_id, tag FROM entry_tags WHERE entry_id IN ({', '.join('?' * len(chunk))}) "
+                    "ORDER BY tag", chunk).fetchall()
+
+            for entry_id, tag in tag_rows:
+                tags.setdefault(entry_id, []).append(tag)
+
+        return [Entry(entry_id, site, username, password, tuple(tags.get(entry_id, ())), notes, created, modified)
+                for entry_id, site, username, password, notes, created, modified in rows]
+
+    def entries(self) -> Iterator[Entry]:
+        last_key: tuple[str, str] | None = None
+
+        while True:
+            with self._lock:
+                if last_key is None:
+                    rows: list[tuple] = self._conn.execute(
+                        f"SELECT {ENTRY_COLUMNS} FROM entries ORDER BY site, username LIMIT ?",
+                        (ITER_BATCH,)).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        f"SELECT {ENTRY_COLUMNS} FROM entries WHERE (site, username) > (?, ?) "
+                        "ORDER BY site, username LIMIT ?", (*last_key, ITER_BATCH)).fetchall()
+
+            yield from self._entries(rows)
+
+            if len(rows) < ITER_BATCH:
+                return None
+
+            last_key = rows[-1][1], rows[-1][2]
+
+    def get_entry(self, entry_id: int) -> Entry | None:
+        with self._lock:
+            row: tuple | None = self._conn.execute(f"SELECT {ENTRY_COLUMNS} FROM entries WHERE id = ?",
+                                                   (entry_id,)).fetchone()
+
+        return self._entries([row])[0] if row is not None else None
+
+    def find(self, site: str | None = None, username: str | None = None, tag: str | None = None) -> list[Entry]:
+        conditions: list[str] = []
+        params: list[str] = []
+
+        for condition, value in (("site = ?", site), ("username = ?", username),
+                                 ("id IN (SELECT entry_id FROM entry_tags WHERE tag = ?)", tag)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        where: str = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            rows: list[tuple] = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM entries{where} ORDER BY site, username", params).fetchall()
+
+        return self._entries(rows)
+
+    def _set_tags(self, entry_id: int, tags: Iterable[str]) -> None:
+        """
+        Replaces the tags of an entry. Must be called inside a transaction.
+
+        :param entry_id: The entry to tag.
+        :param tags: The new tags.
+        :return: None
+        """
+        self._conn.execute("DELETE FROM entry_tags WHERE entry_id = ?", (entry_id,))
+        self._conn.executemany("INSERT INTO entry_tags (tag, entry_id) VALUES (?, ?)",
+                               ((tag, entry_id) for tag in {tag.strip() for tag in tags} if tag))
+
+    def add_entry(self, site: str, username: str, password: str, tags: Iterable[str] = (), notes: str = "",
+                  created: float | None = None) -> int:
+        now: float = time.time()
+
+        with self.transaction():
+            self._conn.execute("INSERT INTO entries (site, username, password, notes, created, modified) "
+                               "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(site, username) DO UPDATE SET "
+                               "password = excluded.password, notes = excluded.notes, modified = excluded.modified",
+                               (site, username, password, notes, now if created is None else created, now))
+            entry_id: int = self._conn.execute("SELECT id FROM entries WHERE site = ? AND username = ?",
+                                               (site, username)).fetchone()[0]
+            self._set_tags(entry_id, tags)
+
+        return entry_id
+
+    def update_entry(self, entry_id: int, site: str | None = None, username: str | None = None,
+                     password: str | None = None, tags: Iterable[str] | None = None,
+                     notes: str | None = None) -> bool:
+        fields: list[tuple[str, str]] = [(column, value) for column, value in
+                                         (("site", site), ("username", username), ("password", password),
+                                          ("notes", notes)) if value is not None]
+        assignments: str = "".join(f"{column} = ?, " for column, _ in fields)
+
+        with self.transaction():
+            cursor: sqlite3.Cursor = self._conn.execute(
+                f"UPDATE entries SET {assignments}modified = ? WHERE id = ?",
+                [value for _, value in fields] + [time.time(), entry_id])
+
+            if cursor.rowcount == 0:
+                return False
+
+            if tags is not None:
+                self._set_tags(entry_id, tags)
+
+        return True
+
+    def delete_entry(self, entry_id: int) -> bool:
+        with self._lock:
+            return self._conn.execute("DELETE FROM entries WHERE id = ?", (entry_id,)).rowcount > 0
+
+    def tags(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT tag FROM entry_tags ORDER BY tag")]
+
+    @contextmanager
+    def transaction(self) -> Iterator['SqliteCredentialStore']:
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+
+            try:
+                yield self
+
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,17 +1,39 @@
+import csv
 import json
+import logging
 import os
-import re
+import sqlite3
 from datetime import datetime
+from itertools import groupby, islice
+from operator import itemgetter
 from json import JSONDecodeError
 from pathlib import Path
+from typing import Any, Callable, Iterator, TextIO
 
-from cryptography.fernet import Fernet
-import bcrypt
-
+from Application.Utils.BreachIndex import BreachIndexError
+from Application.Utils.CredentialImport import ImportResult
+from Application.Utils.CredentialStore import Entry, EntryStore
+from Application.Utils.KeyDerivation import TARGET_UNLOCK_SECONDS
+from Application.Utils.KeyRotation import RotationResult
 from Application.Utils.LoggingController import log_error_and_method
-
-SETTINGS_FILE = "../.Data/Settings.json"
-CRED_FILE = "../.Data/Creds.json"
+from Application.Utils.PasswordGenerator import (PasswordGenerator, PasswordPolicy, Policy, PolicyError,
+                                                 policy_from_dict)
+from Application.Utils.PasswordStrength import StrengthReport, analyze, analyze_many, missing_requirements
+from Application.Utils.SearchIndex import SiteIndex
+from Application.Utils.SecretBuffer import SecretBuffer
+from Application.Utils.Settings import Settings
+from Application.Utils.Vault import BCRYPT_ROUNDS, ENTRY_BATCH, Vault, hash_password, verify_password
+from Application.Utils.VaultAudit import AuditResult
+from Application.Utils.VaultBackup import BackupError
+from Application.Utils.VaultSession import VaultLockedError, VaultSession
+
+# The application's vault lives next to the Views package it is launched from
+DATA_DIR = "../.Data"
+EXPORT_BATCH = ENTRY_BATCH
+EXPORT_EXTENSIONS = {"json": "txt", "jsonl": "jsonl", "csv": "csv"}
+
+_vault: Vault | None = None
+_generator: PasswordGenerator = PasswordGenerator()
 
 
 def is_password_valid(password: str) -> bool:
@@ -23,128 +45,280 @@ def is_password_valid(password: str) -> bool:
     - At least one number
     - At least one special character
 
+    Only letters, digits and the symbols !@#$%^&* are allowed. `analyze` explains which rule a password fails.
+    Unlike the regex this check replaced, a trailing line break or a non-ASCII digit such as "٣" is rejected as a
+    character outside that set.
+
     :param password: password previously inputted by user
     :return: true if password is valid
     """
-    pattern = r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*])[A-Za-z\d!@#$%^&*]{8,}$"
-    return True if re.match(pattern, password) else False
+    return not missing_requirements(password)
 
 
-def hash_password(password: str) -> str:
+def get_vault() -> Vault:
     """
-    Hashes a password using bcrypt with a generated salt.
+    Returns the application's vault engine, which every helper below delegates to.
 
-    :param password: The plain-text password to hash.
-    :return: A bcrypt-hashed version of the password.
+    :return: The vault for `DATA_DIR`, created on first use.
     """
-    encoded_bytes: bytes = password.encode('utf-8')
-    salt: bytes = bcrypt.gensalt()
-    hashed_password: bytes = bcrypt.hashpw(encoded_bytes, salt)
-    return hashed_password.decode('utf-8')
+    global _vault
+
+    if _vault is None:
+        _vault = Vault(DATA_DIR)
+
+    return _vault
 
 
-def verify_password(password: str, hashed: str) -> bool:
+def set_vault(vault: Vault | None) -> None:
     """
-    Verifies a plain-text password against a previously hashed password using bcrypt.
+    Replaces the vault the helpers delegate to, closing the previous one.
 
-    :param password: The plain-text password to verify.
-    :param hashed: The bcrypt-hashed password to compare against
-    :return: True if the password matches the hash, False otherwise.
+    :param vault: The vault to use from now on, or None to open the default data directory on next use.
+    :return: None
     """
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    global _vault
+
+    if _vault is not None and _vault is not vault:
+        _vault.close()
+
+    _vault = vault
+
+
+def get_settings() -> Settings:
+    """
+    Returns the settings service, loading the settings file on first use.
+
+    :return: The shared settings service.
+    """
+    return get_vault().settings
+
+
+def set_settings(settings: Settings | None) -> None:
+    """
+    Replaces the settings service, saving any changes still pending in the previous one.
+
+    :param settings: The settings service to use from now on, or None to reload the default file on next use.
+    :return: None
+    """
+    get_vault().set_settings(settings)
 
 
 def autofill() -> str | None:
     """
-    Retrieves the autofill setting from the settings configuration file.
+    Retrieves the autofill setting from the settings service.
 
-    Attempts to read the 'autofill' value from 'data/settings.json'. If the key does not exist,
-    the function assumes autofill has not been configured and returns None.
+    If the setting does not exist, the function assumes autofill has not been configured and returns None.
 
     :return: The autofill value as a string, or None if the setting is not defined.
     """
-    try:
-        with open(file=SETTINGS_FILE, mode='r') as data_file:
-            data = json.load(data_file)
-            return data['settings']['autofill']
-    except (FileNotFoundError, KeyError, JSONDecodeError) as error:
-        log_error_and_method(error)
-        # ASSERT: Autofill hasn't been setup yet
-        return None
+    # ASSERT: None means autofill hasn't been setup yet
+    return get_settings().get("settings", "autofill")
 
 
 def create_autofill(username: str) -> bool:
     """
     Sets or updates the 'autofill' setting inside the 'settings' block of the config file.
 
+    The change is served from memory at once and saved to disk shortly after.
+
     :param username: The username to store for autofill.
-    :return: True if successful, False if file not found.
+    :return: True if successful, False if the settings file has not been created yet or cannot be read.
     """
-    try:
-        with open(SETTINGS_FILE, 'r') as data_file:
-            data = json.load(data_file)
-
-        data.setdefault('settings', {})['autofill'] = username
+    settings: Settings = get_settings()
 
-        with open(SETTINGS_FILE, 'w') as data_file:
-            json.dump(data, data_file, indent=4)
-            return True
+    if not settings.exists:
+        log_error_and_method(FileNotFoundError(settings.path))
+        return False
 
-    except (FileNotFoundError, JSONDecodeError) as error:
-        log_error_and_method(error)
+    if settings.load_error is not None:
+        log_error_and_method(settings.load_error)
         return False
 
+    settings.set("settings", "autofill", username)
+    return True
+
+
+def get_store() -> EntryStore:
+    """
+    Returns the credential store, opening the SQLite database on first use.
+
+    The first time the database is created, any existing Creds.json entries are migrated into it.
+
+    :return: The active credential store.
+    """
+    return get_vault().store
+
+
+def set_store(store: EntryStore | None) -> None:
+    """
+    Replaces the active credential store, closing the previous one.
+
+    :param store: The store to use from now on, or None to reopen the default database on next use.
+    :return: None
+    """
+    get_vault().set_store(store)
+
 
 def store_creds(website: str, username: str, pwd: str) -> None:
     """
-    Stores or updates login credentials for a given website in a JSON file.
+    Stores or updates login credentials for a given website in the credential store.
 
-    If the JSON file does not exist or is invalid, it will be created with the provided entry.
-    If the file exists and is valid, the entry will be added or updated.
+    An account is identified by its website and username, so a new username adds another account for the
+    website instead of replacing the stored one. Only that entry is written, so the cost does not grow with the
+    size of the vault.
 
     :param website: The name of the website to associate with the credentials.
     :param username: The username or email to store.
-    :param pwd: The password to store.
+    :param pwd: The encrypted password to store.
     :return: None
     """
+    get_vault().put_many([(website, username, pwd)], encrypted=True)
+
+
+def get_search_index() -> SiteIndex:
+    """
+    Returns the site search index, building it from the credential store the first time it is needed in a session.
+
+    :return: The site search index.
+    """
+    return get_vault().index
+
+
+def search_sites(query: str, limit: int = 10) -> list[str]:
+    """
+    Finds stored sites matching the query, ignoring case: prefix matches first, then ranked fuzzy matches.
+
+    :param query: The text to search for.
+    :param limit: Maximum number of results.
+    :return: Matching site names, best match first.
+    """
+    return get_vault().search(query, limit)
+
+
+def get_password_policy(site: str = "") -> Policy:
+    """
+    Returns the generator policy for a site from the 'password_policies' block of the settings file.
+
+    A rule for "example.com" also covers its subdomains such as "login.example.com"; a "*" rule replaces the
+    default for every other site. Rules that cannot be used are logged and skipped.
+
+    :param site: The site the password is for, or an empty string for the default policy.
+    :return: The most specific usable policy.
+    """
+    settings: Settings = get_settings()
+    labels: list[str] = site.strip().lower().split(".")
+
+    for key in [".".join(labels[start:]) for start in range(len(labels)) if labels[start]] + ["*"]:
+        rule: dict[str, Any] | None = settings.get("password_policies", key)
+
+        if rule is None:
+            continue
+
+        try:
+            return policy_from_dict(rule)
+
+        except (PolicyError, TypeError, OSError) as error:
+            log_error_and_method(error)
+
+    return PasswordPolicy()
+
+
+def generate_passwords(site: str = "", count: int = 1) -> list[str] | None:
+    """
+    Generates passwords following the site's policy, e.g. a single one for the Generate button or thousands
+    for a bulk rotation.
+
+    :param site: The site the passwords are for, selecting its policy.
+    :param count: Number of passwords.
+    :return: The passwords, or None if the policy's word list could not be read.
+    """
     try:
-        with open(file=CRED_FILE, mode='r') as data_file:
-            data: dict = json.load(data_file)
+        return _generator.generate(get_password_policy(site), count)
 
-    except (FileNotFoundError, JSONDecodeError) as error:
+    except OSError as error:
         log_error_and_method(error)
-        with open(file=CRED_FILE, mode='w') as _:
-            data: dict = {}
+        return None
 
-    data[website] = {"username": username, "password": pwd}
 
-    with open(file=CRED_FILE, mode='w') as data_file:
-        json.dump(data, data_file, indent=4)
+def read_legacy_key() -> bytes | None:
+    """
+    Reads the unprotected key file written by earlier versions, so it can be wrapped with the master password.
+
+    :return: The key, or None if there is no legacy key file.
+    """
+    return get_vault().read_legacy_key()
 
 
-def get_encryption_key() -> bytes:
+def save_vault_key(vault_key: bytes, password: str, target_seconds: float = TARGET_UNLOCK_SECONDS) -> None:
     """
-    Retrieves the symmetric encryption key used for encrypting and decrypting credentials.
+    Wraps the vault key with a key derived from the master password and saves it in the settings file.
 
-    If the key file (`../.Data/secret.key`) exists, it loads and returns the key.
-    If the key file is missing, a new Fernet key is generated, saved to the file,
-    and then returned.
+    :param vault_key: The Fernet key that encrypts the stored passwords.
+    :param password: The master password.
+    :param target_seconds: Desired time to derive the key at login.
+    :return: None
+    """
+    get_vault().save_key(vault_key, password, target_seconds)
 
-    :return: A Fernet-compatible encryption key as bytes.
+
+def create_vault(password: str) -> VaultSession:
     """
+    Sets up the master password for a new account and unlocks the vault.
 
-    key_path: str = "../.Data/secret.key"
+    :param password: The new master password.
+    :return: The unlocked vault session.
+    """
+    return get_vault().create(password)
 
+
+def open_vault(password: str) -> bool:
+    """
+    Checks the master password and, if it is correct, unlocks the vault for the rest of the session.
+
+    :param password: The master password entered at login.
+    :return: True if the password is correct and the vault is unlocked, False otherwise.
+    :raises VaultKeyError: If the vault holds entries but its key is missing.
+    """
+    return get_vault().open(password)
+
+
+def is_rotation_pending() -> bool:
+    """
+    :return: True if a key rotation was started and has not finished re-encrypting the vault.
+    """
+    return get_vault().rotation_pending
+
+
+def rotate_vault_key(password: str, progress: Callable[[int, int], None] | None = None) -> RotationResult | None:
+    """
+    Replaces the vault key with a new one and re-encrypts every stored password under it, while the vault
+    stays usable. If a rotation is already pending, it is resumed instead of starting another one.
+
+    :param password: The master password, needed to wrap the new key.
+    :param progress: Optional callable receiving (entries processed, total entries) as the rotation runs.
+    :return: The outcome of the re-encryption, or None if the password is wrong or the rotation failed.
+    """
+    try:
+        return get_vault().rotate_key(password, progress)
+
+    except (OSError, sqlite3.Error, VaultLockedError) as error:
+        log_error_and_method(error)
+        return None
+
+
+def resume_key_rotation(progress: Callable[[int, int], None] | None = None) -> RotationResult | None:
+    """
+    Re-encrypts the entries a pending key rotation has not reached yet, then retires the old key.
+
+    :param progress: Optional callable receiving (entries processed, total entries) as the rotation runs.
+    :return: The outcome of the re-encryption, or None if no rotation is pending or it failed.
+    """
     try:
-        with open(key_path, "rb") as key_file:
-            return key_file.read()
+        return get_vault().resume_rotation(progress)
 
-    except FileNotFoundError as error:
+    except (OSError, sqlite3.Error, VaultLockedError) as error:
         log_error_and_method(error)
-        key: bytes = Fernet.generate_key()
-        with open(key_path, "wb") as key_file:
-            key_file.write(key)
-        return key
+        return None
 
 
 def check_entries(*args) -> bool:
@@ -158,88 +332,300 @@ def check_entries(*args) -> bool:
     return all(field for field in args)
 
 
+def unlock_session(vault_key: bytes) -> VaultSession:
+    """
+    Unlocks the vault session with the vault key.
+
+    Called at login so that every later encrypt/decrypt call reuses the same cipher, and the key
+    derivation is not repeated.
+
+    :param vault_key: The unwrapped vault key.
+    :return: The unlocked vault session.
+    """
+    session: VaultSession = get_session()
+    session.unlock(vault_key)
+    return session
+
+
+def lock_session() -> None:
+    """
+    Locks the vault session, wiping the key held in memory, and drops the site search index.
+
+    :return: None
+    """
+    get_vault().lock()
+
+
+def get_session() -> VaultSession:
+    """
+    Returns the vault session. Cryptographic operations on it raise VaultLockedError until the vault is
+    opened with the master password.
+
+    :return: The vault session.
+    """
+    return get_vault().session
+
+
 def encrypt_password(pwd: str) -> str:
     """
     Encrypts a plain-text password using Fernet symmetric encryption.
 
-    The password is encoded to bytes, encrypted using the Fernet key retrieved
-    by `get_encryption_key()`, and then decoded back to a string for storage.
+    The password is encrypted with the cipher held by the active vault session, so the key
+    is only derived once per session.
 
     :param pwd: The plain-text password to encrypt.
     :return: The encrypted password as a URL-safe base64-encoded string.
     """
-    fernet: Fernet = Fernet(get_encryption_key())
-    return fernet.encrypt(pwd.encode()).decode()
+    return get_session().encrypt(pwd)
 
 
-def decrypt_password(encrypted_pwd: str):
+def decrypt_password(encrypted_pwd: str) -> str:
     """
     Decrypts an encrypted password string using Fernet symmetric encryption.
 
-    The encrypted password string is encoded to bytes, decrypted using the Fernet key
-    retrieved by `get_encryption_key()`, and then decoded back to the original plain-text password.
+    The password is decrypted with the cipher held by the active vault session, so the key
+    is only derived once per session.
 
     :param encrypted_pwd: The encrypted password string to decrypt.
     :return: The original decrypted plain-text password.
     """
-    fernet = Fernet(get_encryption_key())
-    return fernet.decrypt(encrypted_pwd.encode()).decode()
+    return get_session().decrypt(encrypted_pwd)
 
 
-def find_creds(site: str) -> dict[str, str] | None:
+def find_creds(site: str, username: str | None = None) -> dict[str, str] | None:
     """
-    Searches credentials file for credentials matching the given site then returns the credentials if found.
+    Searches the credential store for credentials matching the given site then returns the credentials if found.
     Otherwise, returns None.
 
     :param site: The website to search for credentials.
+    :param username: The account to return, or None for the site's first account by username.
     :return: Username and decrypted password if found for the site. Otherwise, None.
     """
     try:
-        with open(CRED_FILE, mode='r') as data_file:
-            data: dict = json.load(data_file)
-            creds: dict = data[site]
-            creds["password"] = decrypt_password(creds["password"])
-            return creds
+        creds: dict[str, str] | None = get_vault().get_account(site, username)
+
+        if creds is None:
+            raise KeyError(site)
+
+        return creds
+
+    except (KeyError, sqlite3.Error) as error:
+        log_error_and_method(error)
+        return None
+
+
+def find_secret(site: str, secret: SecretBuffer | None = None, username: str | None = None) -> SecretBuffer | None:
+    """
+    Decrypts the password stored for an account into a wipeable buffer, without creating a string copy of it.
+
+    :param site: The website to search for credentials.
+    :param secret: A buffer to reuse, or None to allocate a new one.
+    :param username: The account to decrypt, or None for the site's first account by username.
+    :return: The buffer holding the decrypted password if the account is stored. Otherwise, None.
+    """
+    try:
+        found: SecretBuffer | None = get_vault().get_secret(site, secret, username)
+
+        if found is None:
+            raise KeyError(site)
+
+        return found
+
+    except (KeyError, sqlite3.Error) as error:
+        log_error_and_method(error)
+        return None
+
+
+def find_entries(site: str | None = None, username: str | None = None, tag: str | None = None) -> list[Entry] | None:
+    """
+    Finds every stored account matching the given site, username and tag, without decrypting any passwords.
+
+    :param site: Only accounts for this site.
+    :param username: Only accounts with this username.
+    :param tag: Only accounts with this tag.
+    :return: The matching entries, ordered by site and then username. Returns None if an error occurs.
+    """
+    try:
+        return get_vault().find_entries(site, username, tag)
+
+    except sqlite3.Error as error:
+        log_error_and_method(error)
+        return None
+
+
+def add_entry(site: str, username: str, pwd: str, tags: list[str] | None = None, notes: str = "") -> int | None:
+    """
+    Encrypts and stores an account with its tags and notes, replacing the entry for the same site and username.
+
+    :param site: The website the account is for.
+    :param username: The username or email of the account.
+    :param pwd: The plain-text password.
+    :param tags: The entry's tags.
+    :param notes: Free-text notes.
+    :return: The ID of the entry, or None if it could not be stored.
+    """
+    try:
+        return get_vault().add_entry(site, username, pwd, tags or (), notes)
+
+    except (sqlite3.Error, VaultLockedError) as error:
+        log_error_and_method(error)
+        return None
+
+
+def update_entry(entry_id: int, **fields: Any) -> bool:
+    """
+    Changes fields of a stored account, e.g. `update_entry(entry_id, tags=["work"], notes="Shared login")`.
+
+    :param entry_id: The entry to change.
+    :param fields: New values for any of site, username, password (plain-text), tags and notes.
+    :return: True if the entry was changed, False if it does not exist or the change failed, e.g. because another
+             account already has the new site and username.
+    """
+    try:
+        return get_vault().update_entry(entry_id, **fields)
+
+    except (sqlite3.Error, VaultLockedError) as error:
+        log_error_and_method(error)
+        return False
+
+
+def delete_entry(entry_id: int) -> bool:
+    """
+    Removes one stored account, leaving any other accounts on its site in place.
+
+    :param entry_id: The entry to remove.
+    :return: True if the entry was removed, False otherwise.
+    """
+    try:
+        return get_vault().delete_entry(entry_id)
+
+    except sqlite3.Error as error:
+        log_error_and_method(error)
+        return False
+
+
+def get_all_passwords() -> list[tuple[str, dict[str, str]]] | None:
+    """
+    Loads and decrypts all stored credentials from the credential store.
+
+    Passwords are decrypted as one batch spread over the session's worker pool. Entries that fail to
+    decrypt are logged and left out rather than aborting the whole load.
+
+    :return: One (site, {"username": ..., "password": ...}) pair per stored account, ordered by site and then
+             username, so every account on a site is kept. Returns None if an error occurs.
+    """
+    try:
+        vault: Vault = get_vault()
+        return list(vault.iter_entries(batch_size=max(len(vault.store), 1)))
+
+    except (KeyError, sqlite3.Error) as error:
+        log_error_and_method(error)
+        return None
+
+
+def iter_all_passwords(batch_size: int = EXPORT_BATCH) -> Iterator[tuple[str, dict[str, str]]]:
+    """
+    Streams decrypted credentials out of the credential store one entry at a time.
+
+    Entries are read and decrypted in batches of `batch_size`, so only one batch of plaintext is held at once
+    regardless of vault size. Entries that fail to decrypt are logged and skipped.
+
+    :param batch_size: Number of entries decrypted together.
+    :return: An iterator of (site, {"username": ..., "password": ...}) pairs, ordered by site.
+    """
+    return get_vault().iter_entries(batch_size)
+
+
+def check_password_strength(batch_size: int = EXPORT_BATCH) -> dict[tuple[str, str], StrengthReport] | None:
+    """
+    Scores every stored password in one call.
+
+    Entries are decrypted and scored a batch at a time, so only one batch of plaintext is held at once and the
+    reports keep no whole passwords.
+
+    :param batch_size: Number of entries decrypted and scored together.
+    :return: A dictionary mapping each account's (site, username) to its password's strength report, ordered by
+             site and then username. Returns None if an error occurs.
+    """
+    try:
+        reports: dict[tuple[str, str], StrengthReport] = {}
+        entries: Iterator[tuple[str, dict[str, str]]] = iter_all_passwords(batch_size)
+
+        while batch := list(islice(entries, batch_size)):
+            reports.update(zip([(site, creds["username"]) for site, creds in batch],
+                               analyze_many(creds["password"] for _, creds in batch)))
+
+        return reports
+
+    except (KeyError, sqlite3.Error) as error:
+        log_error_and_method(error)
+        return None
+
+
+def audit_vault(progress: Callable[[int, int], None] | None = None) -> AuditResult | None:
+    """
+    Finds stored passwords that are reused across accounts or weak, in one streaming pass over the vault.
+
+    :param progress: Optional callable receiving (entries audited, total entries) as the audit runs.
+    :return: The reused groups, weak passwords and breached passwords found, or None if an error occurs.
+    """
+    try:
+        return get_vault().audit(progress)
 
-    except (FileNotFoundError, KeyError, JSONDecodeError) as error:
+    except (KeyError, OSError, BreachIndexError, sqlite3.Error) as error:
         log_error_and_method(error)
         return None
 
 
-def get_all_passwords() -> dict[str, dict[str, str]] | None:
+def breach_count(password: str) -> int | None:
     """
-    Loads and decrypts all stored credentials from the credentials file.
+    Looks a password up in the local breach index. Nothing is sent over the network.
 
-    :return: A dictionary where each key is a site name and the value is a dictionary
-             containing the username and decrypted password. Returns None if an error occurs.
+    :param password: The plain-text password.
+    :return: How many times the password appears in the breach corpus, or None if no breach list has been
+             imported or the index cannot be read.
     """
     try:
-        with open(CRED_FILE, mode='r') as data_file:
-            data: dict[str, dict[str, str]] = json.load(data_file)
+        return get_vault().breach_count(password)
 
-        for site in data:
-            data[site]["password"] = decrypt_password(data[site]["password"])
+    except (OSError, BreachIndexError) as error:
+        log_error_and_method(error)
+        return None
 
-        return data
 
-    except (FileNotFoundError, KeyError, JSONDecodeError) as error:
+def import_breach_list(path: str, progress: Callable[[int, int], None] | None = None) -> int | None:
+    """
+    Builds the local breach index from a downloaded list of SHA-1 password hashes, e.g. the Have I Been Pwned
+    "ordered by hash" download, replacing any previous index.
+
+    :param path: The breach list, one "<SHA-1 hex>:<count>" line per hash.
+    :param progress: Optional callable receiving (bytes read, total bytes) as the list is read.
+    :return: The number of distinct hashes indexed, or None if the list could not be imported.
+    """
+    try:
+        count: int = get_vault().import_breaches(path, progress)
+        logging.info(f"Indexed {count} breached password hashes")
+        return count
+
+    except (OSError, BreachIndexError) as error:
         log_error_and_method(error)
         return None
 
 
-def get_unique_filename(base_dir: Path, base_name: str) -> Path:
+def get_unique_filename(base_dir: Path, base_name: str, extension: str = "txt") -> Path:
     """
     Generates a unique filename by appending a timestamp to the base name.
 
     The timestamp is formatted as MMDDYYYY_HHMMSS to ensure uniqueness down to the second.
-    The resulting filename will have a `.txt` extension and be located within the specified base directory.
+    The resulting filename will have the given extension and be located within the specified base directory.
 
     :param base_dir: The directory path where the file will be located.
     :param base_name: The base name for the file, without extension or timestamp.
+    :param extension: The file extension, without the leading dot.
     :return: A Path object representing the full path to the uniquely named file.
     """
     timestamp = datetime.now().strftime("%m%d%Y_%H%M%S")
-    filename = f"{base_name}_{timestamp}.txt"
+    filename = f"{base_name}_{timestamp}.{extension}"
     return base_dir / filename
 
 
@@ -265,29 +651,143 @@ def get_download_path() -> Path:
     return user_downloads if user_downloads.exists() else Path.home()
 
 
-def export_passwords() -> bool:
+def write_json(file: TextIO, entries: Iterator[tuple[str, dict[str, str]]]) -> None:
+    """
+    Writes entries as one indented JSON object keyed by site, holding the list of that site's accounts, one site at
+    a time.
+
+    Entries must be ordered by site, as the store returns them. The output is identical to
+    `json.dumps({site: [credentials, ...]}, indent=4)` without building the whole string.
+
+    :param file: The text file to write to.
+    :param entries: The (site, credentials) pairs to write.
+    :return: None
+    """
+    separator: str = "{\n"
+
+    for site, accounts in groupby(entries, key=itemgetter(0)):
+        body: str = json.dumps([creds for _, creds in accounts], indent=4).replace("\n", "\n    ")
+        file.write(f"{separator}    {json.dumps(site)}: {body}")
+        separator = ",\n"
+
+    file.write("{}" if separator == "{\n" else "\n}")
+
+
+def write_jsonl(file: TextIO, entries: Iterator[tuple[str, dict[str, str]]]) -> None:
+    """
+    Writes entries as JSON Lines, one {"site", "username", "password"} object per line.
+
+    :param file: The text file to write to.
+    :param entries: The (site, credentials) pairs to write.
+    :return: None
+    """
+    for site, creds in entries:
+        file.write(json.dumps({"site": site, **creds}) + "\n")
+
+
+def write_csv(file: TextIO, entries: Iterator[tuple[str, dict[str, str]]]) -> None:
+    """
+    Writes entries as CSV with a site,username,password header row.
+
+    :param file: The text file to write to.
+    :param entries: The (site, credentials) pairs to write.
+    :return: None
+    """
+    writer = csv.writer(file)
+    writer.writerow(["site", "username", "password"])
+
+    for site, creds in entries:
+        writer.writerow([site, creds["username"], creds["password"]])
+
+
+EXPORT_WRITERS = {"json": write_json, "jsonl": write_jsonl, "csv": write_csv}
+
+
+def export_passwords(export_format: str = "json") -> bool:
     """
-    Exports all stored credentials in unencrypted form to a text file in the user's Downloads folder.
+    Exports all stored credentials in unencrypted form to a file in the user's Downloads folder.
 
-    Retrieves all stored credentials, formats them as indented JSON, and writes them to a file named
-    'passwords.txt' in the user's default Downloads directory. If credentials cannot be retrieved or the file
-    cannot be written, logs the error and returns False.
+    Credentials are streamed from the store, decrypted and written one entry at a time, so memory use stays
+    flat regardless of vault size. The file is named 'passwords_<timestamp>' with an extension matching the
+    format: '.txt' for indented JSON, '.jsonl' for JSON Lines and '.csv' for CSV. If credentials cannot be
+    retrieved or the file cannot be written, logs the error, removes any partial file and returns False.
 
-    :return: True if export was successful, False otherwise.
+    :param export_format: One of "json", "jsonl" or "csv".
+    :return: True if export was successful, False otherwise, including for an unknown format.
     """
     download_path: Path = Path(os.path.join(os.path.expanduser('~'), 'Downloads'))
-    file_path = get_unique_filename(download_path, "passwords")
-    creds: dict[str, dict[str, str]] = get_all_passwords()
+    file_path: Path | None = None
+
+    try:
+        file_path = get_unique_filename(download_path, "passwords", EXPORT_EXTENSIONS[export_format])
+
+        with open(download_path / file_path, "w", newline="") as file:
+            EXPORT_WRITERS[export_format](file, iter_all_passwords())
+
+    except (OSError, KeyError, JSONDecodeError, sqlite3.Error) as error:
+        log_error_and_method(error)
+
+        if file_path is not None and os.path.exists(download_path / file_path):
+            os.remove(download_path / file_path)
 
-    if creds is None:
         return False
 
+    return True
+
+
+def backup_vault(path: str) -> bool:
+    """
+    Writes an encrypted, compressed backup of the whole vault to the given path.
+
+    :param path: Where to write the backup file.
+    :return: True if the backup was written, False otherwise.
+    """
     try:
-        with open(download_path / file_path, "w") as file:
-            file.write(json.dumps(creds, indent=4))
+        count: int = get_vault().backup(path)
+        logging.info(f"Backed up {count} entries")
+        return True
 
-    except (FileNotFoundError, KeyError, JSONDecodeError) as error:
+    except (OSError, sqlite3.Error) as error:
         log_error_and_method(error)
         return False
 
-    return True
+
+def restore_vault(path: str) -> bool:
+    """
+    Restores the entries of a vault backup into the credential store, overwriting stored entries with the same site
+    and username.
+
+    Nothing is written unless every chunk of the backup verifies.
+
+    :param path: The backup file to restore.
+    :return: True if the backup was restored, False otherwise.
+    """
+    try:
+        count: int = get_vault().restore(path)
+        logging.info(f"Restored {count} entries")
+        return True
+
+    except (OSError, BackupError, sqlite3.Error) as error:
+        log_error_and_method(error)
+        return False
+
+
+def import_passwords(path: str, progress: Callable[[int, int], None] | None = None) -> ImportResult | None:
+    """
+    Imports credentials from a CSV, JSON Lines or JSON export into the credential store.
+
+    Accounts that are already stored are left unchanged. All new entries are committed in a single transaction.
+
+    :param path: The export file to import.
+    :param progress: Optional callable receiving (bytes read, file size) as the import runs.
+    :return: The number of entries imported and skipped, or None if the import failed.
+    """
+    try:
+        result: ImportResult = get_vault().import_file(path, progress)
+        logging.info(f"Imported {result.imported} entries, skipped {result.duplicates} duplicates "
+                     f"and {result.skipped} incomplete rows")
+        return result
+
+    except (OSError, UnicodeError, JSONDecodeError, csv.Error, sqlite3.Error) as error:
+        log_error_and_method(error)
+        return None
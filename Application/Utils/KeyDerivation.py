@@ -0,0 +1,143 @@
+import base64
+import hashlib
+import math
+import os
+import time
+from typing import NamedTuple
+
+TARGET_UNLOCK_SECONDS = 0.5
+SCRYPT_R = 8
+SCRYPT_P = 1
+MIN_LOG2_N = 14
+MAX_LOG2_N = 18
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+class KdfParams(NamedTuple):
+    """
+    scrypt parameters used to derive the key-wrapping key from the master password.
+
+    Stored next to the wrapped vault key in the settings file, so they can be raised later without
+    invalidating existing vaults.
+
+    :param log2_n: Base-2 logarithm of the scrypt CPU/memory cost. Memory use is 128 * r * 2**log2_n bytes.
+    :param r: scrypt block size.
+    :param p: scrypt parallelization.
+    :param salt: Random salt, URL-safe base64 encoded.
+    """
+    log2_n: int
+    r: int
+    p: int
+    salt: str
+
+
+def new_salt() -> str:
+    """
+    :return: A fresh random salt, URL-safe base64 encoded.
+    """
+    return base64.urlsafe_b64encode(os.urandom(SALT_BYTES)).decode()
+
+
+def derive_key(password: str, params: KdfParams) -> bytearray:
+    """
+    Derives the key-wrapping key from the master password with scrypt.
+
+    :param password: The master password.
+    :param params: The scrypt parameters and salt.
+    :return: A 32-byte key, in a buffer the caller should wipe once the vault key is unwrapped.
+    """
+    n: int = 2 ** params.log2_n
+    derived: bytes = hashlib.scrypt(password.encode(), salt=base64.urlsafe_b64decode(params.salt), n=n,
+                                    r=params.r, p=params.p, maxmem=129 * params.r * (n + params.p + 2),
+                                    dklen=KEY_BYTES)
+    return bytearray(derived)
+
+
+def calibrate(target_seconds: float = TARGET_UNLOCK_SECONDS, r: int = SCRYPT_R, p: int = SCRYPT_P) -> KdfParams:
+    """
+    Picks the largest scrypt cost whose derivation takes about `target_seconds` on this machine.
+
+    scrypt's running time grows linearly with N, so one timed run at the minimum cost is enough to estimate
+    the cost that hits the target. The result is clamped between MIN_LOG2_N and MAX_LOG2_N.
+
+    :param target_seconds: Desired time to derive the key at login.
+    :param r: scrypt block size.
+    :param p: scrypt parallelization.
+    :return: Parameters with a new random salt.
+    """
+    params: KdfParams = KdfParams(MIN_LOG2_N, r, p, new_salt())
+
+    started: float = time.perf_counter()
+    derive_key("calibration", params)
+    elapsed: float = max(time.perf_counter() - started, 1e-6)
+
+    log2_n: int = MIN_LOG2_N + math.floor(math.log2(target_seconds / elapsed))
+    return params._replace(log2_n=min(max(log2_n, MIN_LOG2_N), MAX_LOG2_N))
+
+
+def wrap_key(vault_key: bytes, password: str, params: KdfParams) -> str:
+    """
+    Encrypts the vault key with a key derived from the master password.
+
+    :param vault_key: The Fernet key that encrypts the stored passwords.
+    :param password: The master password.
+    :param params: The scrypt parameters and salt.
+    :return: The wrapped key as a Fernet token.
+    """
+    return wrap_keys([vault_key], password, params)[0]
+
+
+def unwrap_key(wrapped_key: str, password: str, params: KdfParams) -> bytes:
+    """
+    Decrypts the vault key with a key derived from the master password.
+
+    :param wrapped_key: The wrapped key written by `wrap_key`.
+    :param password: The master password.
+    :param params: The scrypt parameters and salt used to wrap the key.
+    :return: The vault key.
+    :raises InvalidToken: If the password is wrong or the wrapped key was modified.
+    """
+    return unwrap_keys([wrapped_key], password, params)[0]
+
+
+def wrap_keys(vault_keys: list[bytes], password: str, params: KdfParams) -> list[str]:
+    """
+    Encrypts several vault keys with one derivation of the master password, e.g. the old and new key of a
+    key rotation.
+
+    :param vault_keys: The Fernet keys to wrap.
+    :param password: The master password.
+    :param params: The scrypt parameters and salt.
+    :return: The wrapped keys as Fernet tokens, in input order.
+    """
+    from cryptography.fernet import Fernet
+
+    derived: bytearray = derive_key(password, params)
+
+    try:
+        wrapper: Fernet = Fernet(base64.urlsafe_b64encode(derived))
+        return [wrapper.encrypt(vault_key).decode() for vault_key in vault_keys]
+    finally:
+        derived[:] = bytes(len(derived))
+
+
+def unwrap_keys(wrapped_keys: list[str], password: str, params: KdfParams) -> list[bytes]:
+    """
+    Decrypts several vault keys with one derivation of the master password.
+
+    :param wrapped_keys: The wrapped keys written by `wrap_key` or `wrap_keys`.
+    :param password: The master password.
+    :param params: The scrypt parameters and salt used to wrap the keys.
+    :return: The vault keys, in input order.
+    :raises InvalidToken: If the password is wrong or any wrapped key was modified.
+    """
+    from cryptography.fernet import Fernet
+
+    derived: bytearray = derive_key(password, params)
+
+    try:
+        wrapper: Fernet = Fernet(base64.urlsafe_b64encode(derived))
+        return [wrapper.decrypt(wrapped_key.encode()) for wrapped_key in wrapped_keys]
+    finally:
+        derived[:] = bytes(len(derived))
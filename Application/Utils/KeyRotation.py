@@ -0,0 +1,97 @@
+import logging
+import time
+from itertools import dropwhile, islice
+from typing import Callable, Iterator, NamedTuple
+
+from Application.Utils.CredentialStore import CredentialStore
+from Application.Utils.VaultSession import VaultSession
+
+ROTATION_BATCH = 500
+
+
+class RotationResult(NamedTuple):
+    """
+    Outcome of re-encrypting the vault under a new key.
+
+    :param rotated: Number of entries re-encrypted by this run.
+    :param failed: Number of entries left unchanged because they could not be decrypted with any key.
+    :param seconds: Time spent re-encrypting, in seconds.
+    """
+    rotated: int
+    failed: int
+    seconds: float
+
+    @property
+    def entries_per_second(self) -> float:
+        """
+        :return: Re-encryption throughput of this run.
+        """
+        return self.rotated / self.seconds if self.seconds > 0 else 0.0
+
+
+def rotate_entries(store: CredentialStore, session: VaultSession, after: list[str] | str | None = None,
+                   checkpoint: Callable[[list[str]], None] | None = None,
+                   progress: Callable[[int, int], None] | None = None,
+                   batch_size: int = ROTATION_BATCH) -> RotationResult:
+    """
+    Re-encrypts every stored password with the session's current key, one batch at a time.
+
+    The session must hold the previous key as well, so entries not yet re-encrypted stay readable. Each batch
+    is written in its own short transaction, so the vault stays usable between batches. An entry that was
+    changed or deleted while its batch was being re-encrypted is left alone, because anything written during
+    the rotation is already under the current key.
+
+    After each batch, `checkpoint` receives the [site, username] of the batch's last entry. Passing that back as
+    `after` resumes an interrupted rotation where it stopped.
+
+    :param store: The credential store to re-encrypt.
+    :param session: An unlocked session holding the current key and the previous keys.
+    :param after: [site, username] of the last entry re-encrypted by an earlier run, or None to start from the
+                  beginning. A bare site, as checkpointed before sites could hold several accounts, covers every
+                  account on that site.
+    :param checkpoint: Optional callable receiving the [site, username] of the last entry of every committed batch.
+    :param progress: Optional callable receiving (entries processed, total entries) after each batch.
+    :param batch_size: Number of entries re-encrypted per transaction.
+    :return: The number of entries re-encrypted and failed, and the time taken.
+    """
+    started: float = time.perf_counter()
+    last: tuple[str, ...] = () if after is None else (after,) if isinstance(after, str) else tuple(after)
+    total: int = len(store) if progress is not None else 0
+    processed: int = sum(1 for key in store.keys() if key[:len(last)] <= last) if progress is not None and last \
+        else 0
+    rotated: int = 0
+    failed: int = 0
+
+    # ASSERT: items() is ordered by site and username, so everything up to the checkpoint is a prefix
+    entries: Iterator[tuple[str, dict[str, str]]] = store.items()
+
+    if last:
+        entries = dropwhile(lambda entry: (entry[0], entry[1]["username"])[:len(last)] <= last, entries)
+
+    while batch := list(islice(entries, batch_size)):
+        tokens: list[str | None] = session.rotate_many(creds["password"] for _, creds in batch)
+
+        with store.transaction():
+            for (site, creds), token in zip(batch, tokens):
+                if token is None:
+                    logging.warning(f"Could not decrypt password for {site}, leaving entry unchanged")
+                    failed += 1
+                    continue
+
+                current: dict[str, str] | None = store.get(site, creds["username"])
+
+                if current is None or current["password"] != creds["password"]:
+                    continue
+
+                store.put(site, creds["username"], token)
+                rotated += 1
+
+        processed += len(batch)
+
+        if checkpoint is not None:
+            checkpoint([batch[-1][0], batch[-1][1]["username"]])
+
+        if progress is not None:
+            progress(processed, total)
+
+    return RotationResult(rotated, failed, time.perf_counter() - started)
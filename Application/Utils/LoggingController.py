@@ -1,31 +1,94 @@
-import inspect
+import json
 import logging
 import os
+import queue
+import sys
+from datetime import datetime, timezone
 from logging import Formatter, FileHandler
+from logging.handlers import QueueHandler, QueueListener
 
 BASE_DIR = "../../Application"
 PARENT_DIR = os.path.join(BASE_DIR, "logs")
 
-def setup_logging() -> None:
+_listener: QueueListener | None = None
+
+
+class JsonFormatter(Formatter):
+    """
+    Formats each log record as a single-line JSON object, for log files that are read by tools.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry)
+
+
+def setup_logging(structured: bool = False) -> None:
     """
     Configures application-wide logging.
 
-    Sets up the logs directory, file handler with formatting,
-    and attaches it to the root logger. Logs will be written to 'logs/app.log'.
+    Sets up the logs directory and a file handler with formatting. The file handler runs behind a
+    QueueHandler/QueueListener pair, so callers (including the Tk thread) only enqueue records and
+    the file writes happen on the listener's thread. Logs will be written to 'logs/app.log'.
+
+    :param structured: If True, each record is written as a JSON object instead of a text line.
     """
+    global _listener
+
+    if _listener is not None:
+        return None
+
     os.makedirs(PARENT_DIR, exist_ok=True)
 
     log_file = os.path.join(PARENT_DIR, "app.log")
-    formatter = Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    formatter = JsonFormatter() if structured else Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
     file_handler = FileHandler(log_file)
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
+    logger.addHandler(QueueHandler(log_queue))
+    return None
+
+
+def shutdown_logging() -> None:
+    """
+    Stops the queue listener after it has written every pending record.
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def log_error_and_method(error: Exception) -> None:
-    method_name = inspect.stack()[1].function
-    logging.warning(f"{type(error).__name__} occurred in {method_name}: {error}")
+    """
+    Logs a warning naming the error and the function that handled it.
+
+    The caller is found with a single frame lookup instead of `inspect.stack()`, which would build the
+    whole stack with source context on every call.
+
+    :param error: The exception that was handled.
+    """
+    method_name = sys._getframe(1).f_code.co_name
+    logging.warning("%s occurred in %s: %s", type(error).__name__, method_name, error, stacklevel=2)
@@ -0,0 +1,301 @@
+import math
+import os
+import string
+from functools import lru_cache
+from itertools import combinations
+from typing import Any, Callable, NamedTuple
+
+# Matches the symbols `is_password_valid` accepts, so default passwords always pass the app's own check
+DEFAULT_SYMBOLS = "!@#$%^&*"
+DEFAULT_LENGTH = 16
+DEFAULT_WORDS = 6
+# Diceware-style word list, one word per line (an optional leading dice roll column is ignored). No list is
+# bundled: passphrase policies need one saved here, or their own "wordlist" path
+DEFAULT_WORDLIST = os.path.join(os.path.dirname(__file__), "..", "Assets", "wordlist.txt")
+# Extra random bytes drawn on top of the expected need, so a rejection shortfall rarely needs a second read
+RANDOM_SLACK = 1.25
+
+
+class PolicyError(ValueError):
+    """
+    Raised when a generator policy cannot produce any password, e.g. an empty alphabet or a length shorter
+    than the number of required character classes.
+    """
+
+
+class PasswordPolicy(NamedTuple):
+    """
+    Declarative rules for random character passwords.
+
+    :param length: Exact number of characters.
+    :param lowercase: Use lower-case letters.
+    :param uppercase: Use upper-case letters.
+    :param digits: Use digits.
+    :param symbols: Symbols to use; an empty string disables symbols.
+    :param require_each: Every enabled character class must appear at least once.
+    :param exclude: Characters never used, e.g. look-alikes such as "O0l1".
+    """
+    length: int = DEFAULT_LENGTH
+    lowercase: bool = True
+    uppercase: bool = True
+    digits: bool = True
+    symbols: str = DEFAULT_SYMBOLS
+    require_each: bool = True
+    exclude: str = ""
+
+    @property
+    def classes(self) -> list[str]:
+        """
+        :return: The enabled character classes with excluded characters removed, in a fixed order.
+        """
+        enabled: list[tuple[bool, str]] = [(self.lowercase, string.ascii_lowercase),
+                                           (self.uppercase, string.ascii_uppercase),
+                                           (self.digits, string.digits),
+                                           (bool(self.symbols), "".join(dict.fromkeys(self.symbols)))]
+        return ["".join(char for char in chars if char not in self.exclude) for use, chars in enabled if use]
+
+    @property
+    def alphabet(self) -> str:
+        """
+        :return: Every character the policy may use.
+        """
+        return "".join(self.classes)
+
+    def check(self) -> None:
+        """
+        Checks the policy can generate passwords.
+
+        :raises PolicyError: If the alphabet is empty or unusable, or the required classes cannot all fit.
+        :return: None
+        """
+        classes: list[str] = self.classes
+        alphabet: str = "".join(classes)
+
+        if self.length < 1 or not alphabet:
+            raise PolicyError("Policy needs a positive length and at least one character.")
+        if any(char not in string.printable or char.isspace() for char in self.symbols):
+            raise PolicyError("Symbols must be printable ASCII characters other than whitespace.")
+        if len(set(alphabet)) != len(alphabet):
+            raise PolicyError("Symbols must not repeat letters or digits.")
+        if self.require_each and (not all(classes) or self.length < len(classes)):
+            raise PolicyError("Every required character class needs a character and room in the length.")
+
+    def validate(self, password: str) -> bool:
+        """
+        Checks a password against the policy.
+
+        :param password: The password to check.
+        :return: True if the password has the policy's length, alphabet and required classes.
+        """
+        alphabet: set[str] = set(self.alphabet)
+
+        if len(password) != self.length or not alphabet.issuperset(password):
+            return False
+
+        return not self.require_each or all(not set(chars).isdisjoint(password) for chars in self.classes)
+
+    def entropy_bits(self) -> float:
+        """
+        Returns the entropy of a password drawn by `PasswordGenerator`, i.e. log2 of the number of passwords
+        the policy allows, since every allowed password is equally likely.
+
+        :return: The entropy in bits.
+        """
+        classes: list[str] = self.classes
+        size: int = len(self.alphabet)
+
+        if not self.require_each:
+            return self.length * math.log2(size)
+
+        # Inclusion-exclusion over the classes a password could be missing
+        allowed: int = 0
+        for missing in range(len(classes) + 1):
+            for subset in combinations(classes, missing):
+                allowed += (-1) ** missing * (size - sum(len(chars) for chars in subset)) ** self.length
+
+        return math.log2(allowed)
+
+
+class PassphrasePolicy(NamedTuple):
+    """
+    Declarative rules for diceware passphrases.
+
+    :param words: Number of words.
+    :param separator: Text placed between words.
+    :param wordlist: Path to the word list.
+    """
+    words: int = DEFAULT_WORDS
+    separator: str = "-"
+    wordlist: str = DEFAULT_WORDLIST
+
+    def check(self) -> None:
+        """
+        Checks the policy can generate passphrases, loading its word list.
+
+        :raises PolicyError: If the word count is not positive, the policy uses the default word list and none has
+                             been saved there, or the word list has fewer than two words.
+        :raises OSError: If the word list cannot be read.
+        :return: None
+        """
+        if self.words < 1:
+            raise PolicyError("Passphrases need at least one word.")
+        if self.wordlist == DEFAULT_WORDLIST and not os.path.isfile(DEFAULT_WORDLIST):
+            raise PolicyError(f"No word list is bundled. Save a diceware word list, such as the EFF large word list, "
+                              f"to {os.path.normpath(DEFAULT_WORDLIST)} or set \"wordlist\" in the passphrase policy.")
+        if len(load_wordlist(self.wordlist)) < 2:
+            raise PolicyError(f"Word list {self.wordlist} needs at least two distinct words.")
+
+    def validate(self, passphrase: str) -> bool:
+        """
+        Checks a passphrase against the policy.
+
+        :param passphrase: The passphrase to check.
+        :return: True if the passphrase is the policy's number of words from its word list.
+        """
+        words: list[str] = passphrase.split(self.separator) if self.separator else [passphrase]
+        return len(words) == self.words and set(load_wordlist(self.wordlist)).issuperset(words)
+
+    def entropy_bits(self) -> float:
+        """
+        :return: The entropy in bits of a passphrase drawn by `PasswordGenerator`.
+        """
+        return self.words * math.log2(len(load_wordlist(self.wordlist)))
+
+
+Policy = PasswordPolicy | PassphrasePolicy
+
+
+@lru_cache(maxsize=4)
+def load_wordlist(path: str) -> tuple[str, ...]:
+    """
+    Loads a word list, accepting both plain lists and the diceware "11111<tab>word" layout.
+
+    Duplicates and blank lines are dropped so every word is equally likely.
+
+    :param path: Path to the word list.
+    :return: The distinct words, in file order.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        words: list[str] = [line.split()[-1] for line in file if line.strip()]
+
+    return tuple(dict.fromkeys(words))
+
+
+def policy_from_dict(data: dict[str, Any]) -> Policy:
+    """
+    Builds a policy from its settings representation. A "passphrase" key selects a diceware policy.
+
+    :param data: The policy fields, e.g. {"length": 12, "symbols": ""} or {"passphrase": true, "words": 5}.
+    :raises PolicyError: If the data has unknown fields or describes an unusable policy.
+    :return: The policy.
+    """
+    fields: dict[str, Any] = dict(data)
+    policy_type: type[PasswordPolicy] | type[PassphrasePolicy] = \
+        PassphrasePolicy if fields.pop("passphrase", False) else PasswordPolicy
+    unknown: set[str] = set(fields) - set(policy_type._fields)
+
+    if unknown:
+        raise PolicyError(f"Unknown policy fields: {', '.join(sorted(unknown))}")
+
+    policy: Policy = policy_type(**fields)
+    policy.check()
+    return policy
+
+
+def _sampling_table(size: int) -> tuple[bytes, bytes]:
+    """
+    Builds the byte translation used for rejection sampling over `size` values.
+
+    Bytes below the largest multiple of `size` map to `byte % size`; the rest are deleted, so every kept value
+    is uniform.
+
+    :param size: Number of values to sample, at most 256.
+    :return: The translation table and the bytes to delete.
+    """
+    limit: int = 256 - 256 % size
+    table: bytes = bytes(byte % size if byte < limit else 0 for byte in range(256))
+    return table, bytes(range(limit, 256))
+
+
+class PasswordGenerator:
+    """
+    Generates passwords and passphrases in bulk.
+
+    Each call draws its randomness in one read sized for the whole batch, maps it onto the alphabet with
+    rejection sampling so no character is favoured, and discards candidates that miss a required class.
+    Every returned password passes the policy's `validate`.
+
+    :param random_bytes: Source of random bytes. Defaults to `os.urandom`.
+    """
+
+    def __init__(self, random_bytes: Callable[[int], bytes] = os.urandom):
+        self.random_bytes: Callable[[int], bytes] = random_bytes
+
+    def _values(self, size: int, count: int) -> list[int]:
+        """
+        Draws uniform values in range(size).
+
+        :param size: Number of possible values.
+        :param count: Number of values to draw.
+        :return: The values.
+        """
+        width: int = 1 if size <= 256 else 2
+        span: int = 256 ** width
+        limit: int = span - span % size
+        values: list[int] = []
+
+        while len(values) < count:
+            needed: int = count - len(values)
+            data: bytes = self.random_bytes(math.ceil(needed * span / limit * RANDOM_SLACK) * width + width)
+
+            if width == 1:
+                table, rejected = _sampling_table(size)
+                values.extend(data.translate(table, rejected))
+            else:
+                values.extend(value % size for value in memoryview(data[:len(data) // 2 * 2]).cast("H")
+                              if value < limit)
+
+        return values[:count]
+
+    def _passwords(self, policy: PasswordPolicy, count: int) -> list[str]:
+        alphabet: str = policy.alphabet
+        table, rejected = _sampling_table(len(alphabet))
+        table = bytes(ord(alphabet[value]) for value in table)
+        # Odds a candidate has every required class, so one read usually covers the whole batch
+        accept_rate: float = 2 ** (policy.entropy_bits() - policy.length * math.log2(len(alphabet)))
+        passwords: list[str] = []
+
+        while len(passwords) < count:
+            needed: int = math.ceil((count - len(passwords)) / accept_rate * RANDOM_SLACK) * policy.length
+            data: bytes = self.random_bytes(math.ceil(needed * 256 / (256 - len(rejected))))
+            chars: str = data.translate(table, rejected).decode("ascii")
+            candidates = (chars[start:start + policy.length]
+                          for start in range(0, len(chars) - policy.length + 1, policy.length))
+            passwords.extend(candidate for candidate in candidates if policy.validate(candidate))
+
+        return passwords[:count]
+
+    def _passphrases(self, policy: PassphrasePolicy, count: int) -> list[str]:
+        words: tuple[str, ...] = load_wordlist(policy.wordlist)
+        values: list[int] = self._values(len(words), count * policy.words)
+
+        return [policy.separator.join(words[value] for value in values[start:start + policy.words])
+                for start in range(0, len(values), policy.words)]
+
+    def generate(self, policy: Policy, count: int = 1) -> list[str]:
+        """
+        Generates passwords or passphrases for a policy.
+
+        :param policy: The policy every output follows.
+        :param count: Number of outputs, e.g. thousands when rotating many entries at once.
+        :raises PolicyError: If the policy cannot produce any output.
+        :return: The generated passwords.
+        """
+        policy.check()
+
+        if count <= 0:
+            return []
+        if isinstance(policy, PassphrasePolicy):
+            return self._passphrases(policy, count)
+
+        return self._passwords(policy, count)
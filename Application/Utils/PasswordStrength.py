@@ -0,0 +1,365 @@
+import math
+import os
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate, combinations
+from typing import Iterable, Iterator, NamedTuple
+
+from Application.Utils.PasswordGenerator import DEFAULT_SYMBOLS, load_wordlist
+
+MIN_LENGTH = 8
+COMMON_PASSWORDS = os.path.join(os.path.dirname(__file__), "..", "Assets", "common_passwords.txt")
+# Rows whose runs of three or more characters count as sequences, read forwards or backwards
+SEQUENCE_ROWS = (("abcdefghijklmnopqrstuvwxyz", "0123456789"), ("qwertyuiop", "asdfghjkl", "zxcvbnm"))
+# Entropy in bits at which a password reaches each score from 1 to 4
+SCORE_BITS = (28, 36, 60, 80)
+REQUIREMENTS = ("length", "lowercase", "uppercase", "digit", "symbol", "characters")
+
+_LOWER, _UPPER, _DIGIT, _SYMBOL, _OTHER = range(1, 6)
+_CLASS_SIZES = {_LOWER: 26, _UPPER: 26, _DIGIT: 10, _SYMBOL: len(DEFAULT_SYMBOLS), _OTHER: 33}
+_REQUIRED = ((_LOWER, "lowercase"), (_UPPER, "uppercase"), (_DIGIT, "digit"), (_SYMBOL, "symbol"))
+# Look-alike substitutions undone before looking for common words
+_LEET = {"4": "a", "@": "a", "3": "e", "1": "i", "!": "i", "0": "o", "5": "s", "$": "s", "7": "t"}
+# Marks the positions where two code strings hold the same byte
+_EQUAL_MARKS = b"1" + b"0" * 255
+_RUN = re.compile(rb"11+")
+# A character repeated three or more times, compared by code point
+_REPEAT = re.compile(r"(.)\1\1+", re.DOTALL)
+
+_MESSAGES = {"length": f"Use at least {MIN_LENGTH} characters.",
+             "lowercase": "Add a lowercase letter.",
+             "uppercase": "Add an uppercase letter.",
+             "digit": "Add a number.",
+             "symbol": f"Add one of {DEFAULT_SYMBOLS}.",
+             "characters": f"Use only letters, numbers and {DEFAULT_SYMBOLS}."}
+
+
+def _class_table(separator: int) -> bytes:
+    """
+    :param separator: Code for the line break that separates passwords in a batch.
+    :return: A table mapping each latin-1 character to its class code.
+    """
+    table: bytearray = bytearray([_OTHER] * 256)
+
+    for chars, code in (("abcdefghijklmnopqrstuvwxyz", _LOWER), ("ABCDEFGHIJKLMNOPQRSTUVWXYZ", _UPPER),
+                        ("0123456789", _DIGIT), (DEFAULT_SYMBOLS, _SYMBOL)):
+        for char in chars:
+            table[ord(char)] = code
+
+    table[ord("\n")] = separator
+    return bytes(table)
+
+
+def _word_table() -> bytes:
+    """
+    :return: A table lower-casing letters and look-alikes, turning every other character into a space.
+    """
+    table: bytearray = bytearray(b" " * 256)
+
+    for char in "abcdefghijklmnopqrstuvwxyz":
+        table[ord(char)] = table[ord(char.upper())] = ord(char)
+    for char, letter in _LEET.items():
+        table[ord(char)] = ord(letter)
+
+    table[ord("\n")] = ord("\n")
+    return bytes(table)
+
+
+def _sequence_tables(rows: tuple[str, ...]) -> tuple[bytes, bytes, bytes]:
+    """
+    Numbers the characters of each row consecutively, leaving gaps between rows, so a sequence is a run of codes
+    that each differ from the previous one by exactly one.
+
+    :param rows: The rows to number.
+    :return: The character to code table, and tables mapping each code to the next and previous code.
+    """
+    table: bytearray = bytearray(256)
+    code: int = 2
+
+    for row in rows:
+        for char in row:
+            table[ord(char)] = table[ord(char.upper())] = code
+            code += 1
+        code += 2
+
+    # Characters outside every row (code 0) step to 255, which no character has, so they never form a run
+    step_up: bytes = bytes([255] + [value + 1 for value in range(1, 255)] + [255])
+    step_down: bytes = bytes([255] + [value - 1 for value in range(1, 256)])
+    return bytes(table), step_up, step_down
+
+
+def _class_info() -> dict[frozenset[int], tuple[tuple[str, ...], float]]:
+    """
+    :return: For every set of class codes, the requirements it fails and log2 of its alphabet size.
+    """
+    info: dict[frozenset[int], tuple[tuple[str, ...], float]] = {}
+    codes: list[int] = list(_CLASS_SIZES)
+
+    for count in range(len(codes) + 1):
+        for present in combinations(codes, count):
+            missing: list[str] = [name for code, name in _REQUIRED if code not in present]
+
+            if _OTHER in present:
+                missing.append("characters")
+
+            pool: int = sum(_CLASS_SIZES[code] for code in present)
+            info[frozenset(present)] = (tuple(missing), math.log2(pool) if pool else 0.0)
+
+    return info
+
+
+_CLASS_TABLE = _class_table(_OTHER)
+_BATCH_CLASS_TABLE = _class_table(0)
+_WORD_TABLE = _word_table()
+_SEQUENCE_TABLES = [_sequence_tables(rows) for rows in SEQUENCE_ROWS]
+_CLASS_INFO = _class_info()
+_SEQUENCE_BITS = math.log2(2 * sum(len(row) for rows in SEQUENCE_ROWS for row in rows))
+
+
+class StrengthReport(NamedTuple):
+    """
+    Diagnostics for one password. Only the weak fragments are kept, never the whole password.
+
+    :param score: 0 (very weak) to 4 (strong), from `entropy_bits`.
+    :param entropy_bits: Estimated entropy, counting repeats, sequences and common words as single guesses.
+    :param missing: Requirements of `is_password_valid` the password fails, from `REQUIREMENTS`.
+    :param repeats: Runs of one repeated character, e.g. "aaa".
+    :param sequences: Alphabet, number or keyboard runs, e.g. "abc", "321" or "qwer".
+    :param words: Common passwords and words found, e.g. "P@ssw0rd".
+    """
+    score: int
+    entropy_bits: float
+    missing: tuple[str, ...]
+    repeats: tuple[str, ...] = ()
+    sequences: tuple[str, ...] = ()
+    words: tuple[str, ...] = ()
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        :return: True if the password meets every requirement of `is_password_valid`.
+        """
+        return not self.missing
+
+    @property
+    def problems(self) -> list[str]:
+        """
+        :return: A message for each failed requirement and weak pattern, suitable for showing to the user.
+        """
+        problems: list[str] = [_MESSAGES[requirement] for requirement in self.missing]
+        problems += [f'Avoid common words like "{word}".' for word in self.words]
+        problems += [f'Avoid sequences like "{sequence}".' for sequence in self.sequences]
+        problems += [f'Avoid repeated characters like "{repeat}".' for repeat in self.repeats]
+        return problems
+
+
+def missing_requirements(password: str) -> tuple[str, ...]:
+    """
+    Returns the requirements of `is_password_valid` a password fails, without the pattern checks of `analyze`.
+
+    :param password: The password to check.
+    :return: The failed requirements from `REQUIREMENTS`, empty if the password is valid.
+    """
+    codes: frozenset[int] = frozenset(password.encode("latin-1", "replace").translate(_CLASS_TABLE))
+    missing: tuple[str, ...] = _CLASS_INFO[codes][0]
+    return ("length",) + missing if len(password) < MIN_LENGTH else missing
+
+
+def _equal_runs(codes: bytes, neighbours: bytes) -> Iterator[tuple[int, int]]:
+    """
+    Finds where each character's code equals the one derived from the character before it, comparing the whole
+    batch at once as a big integer XOR.
+
+    :param codes: The batch as codes.
+    :param neighbours: The code each character expects its successor to have, aligned with `codes`.
+    :return: The (start, end) offsets of every run of three or more characters that follow the rule.
+    """
+    if len(codes) < 3:
+        return
+
+    difference: int = int.from_bytes(codes[1:], "big") ^ int.from_bytes(neighbours[:-1], "big")
+
+    for match in _RUN.finditer(difference.to_bytes(len(codes) - 1, "big").translate(_EQUAL_MARKS)):
+        yield match.start(), match.end() + 1
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Builds a regex matching any of the words, nested by shared prefixes so each position is tested against at most
+    one branch per character instead of every word. Longer words win over their own prefixes.
+
+    :param words: The words, lower-case letters only.
+    :return: The regex source.
+    """
+    trie: dict[str, dict] = {}
+
+    for word in words:
+        node: dict[str, dict] = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches: list[str] = [char + build(child) for char, child in sorted(node.items()) if char]
+
+        if not branches:
+            return ""
+
+        body: str = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class StrengthAnalyzer:
+    """
+    Scores passwords in batches.
+
+    A batch is joined into one byte string and each check is a single C-level pass over it: character classes
+    come from `bytes.translate`, repeats and sequences from comparing the batch with itself shifted by one
+    character as a big integer XOR, and common words from one scan with a regex compiled from a trie of the
+    word list. Python only handles the hits, so the cost per password stays flat as batches grow.
+
+    :param words: Common passwords and words to flag. Defaults to the bundled list.
+    """
+
+    def __init__(self, words: Iterable[str] | None = None):
+        words = load_wordlist(COMMON_PASSWORDS) if words is None else words
+        self.words: frozenset[str] = frozenset(word.lower() for word in words if word.isascii() and word.isalpha())
+        self._word_pattern: re.Pattern[bytes] | None = \
+            re.compile(_trie_pattern(self.words).encode("ascii")) if self.words else None
+        self._word_bits: float = math.log2(max(len(self.words), 2))
+
+    def analyze(self, password: str) -> StrengthReport:
+        """
+        Scores a single password.
+
+        :param password: The password to score.
+        :return: Its diagnostics.
+        """
+        return self.analyze_many([password])[0]
+
+    def analyze_many(self, passwords: Iterable[str]) -> list[StrengthReport]:
+        """
+        Scores a batch of passwords.
+
+        :param passwords: The passwords to score, e.g. a page of decrypted vault entries.
+        :return: Their diagnostics, in the same order.
+        """
+        passwords = list(passwords)
+
+        if not passwords:
+            return []
+
+        text: str = "\n".join(passwords)
+
+        if text.count("\n") >= len(passwords):
+            # ASSERT: A line break inside a password is an invalid character either way, but must not split the batch
+            text = "\n".join(password.replace("\n", "\r") for password in passwords)
+
+        # Characters outside latin-1 become "?" so every character keeps a one byte offset
+        joined: bytes = text.encode("latin-1", "replace")
+        classes: list[tuple[tuple[str, ...], float]] = \
+            list(map(_CLASS_INFO.__getitem__, map(frozenset, joined.translate(_BATCH_CLASS_TABLE).split(b"\0"))))
+        patterns: dict[int, tuple[list[str], list[str], list[str]]] = self._patterns(passwords, text, joined)
+        reports: list[StrengthReport] = []
+
+        for index, password in enumerate(passwords):
+            missing, pool_bits = classes[index]
+            bits: float = len(password) * pool_bits
+
+            if len(password) < MIN_LENGTH:
+                missing = ("length",) + missing
+
+            if index not in patterns:
+                reports.append(StrengthReport(bisect_right(SCORE_BITS, bits), bits, missing))
+                continue
+
+            # Each weak run is worth one guess from its kind instead of its characters' share of the alphabet
+            repeats, sequences, words = patterns[index]
+            covered: int = min(sum(map(len, repeats + sequences + words)), len(password))
+            bits = ((len(password) - covered) * pool_bits + sum(pool_bits + math.log2(len(run)) for run in repeats)
+                    + sum(_SEQUENCE_BITS + math.log2(len(run)) for run in sequences) + len(words) * self._word_bits)
+            reports.append(StrengthReport(bisect_right(SCORE_BITS, bits), bits, missing, tuple(repeats),
+                                          tuple(sequences), tuple(words)))
+
+        return reports
+
+    def _patterns(self, passwords: list[str], text: str,
+                  joined: bytes) -> dict[int, tuple[list[str], list[str], list[str]]]:
+        """
+        Finds repeats, sequences and common words in a batch.
+
+        The "?" that stands in for characters outside latin-1 in `joined` only serves the class lookup. Repeats
+        found in `joined` are confirmed against the code points in `text`, so "日本語" is not a repeat while "日日日"
+        is. Sequence rows are all latin-1, so a replaced character has no row code either way and can neither form
+        nor break a sequence.
+
+        :param passwords: The passwords in the batch.
+        :param text: The batch, one line per password.
+        :param joined: `text` as latin-1 bytes, one byte per character.
+        :return: For each password with a hit, its repeated runs, sequences and words. Nested hits are dropped.
+        """
+        # Runs of line breaks only come from empty passwords sitting next to each other
+        spans: list[tuple[int, int, int]] = [(match.start(), -match.end(), 0)
+                                             for start, end in _equal_runs(joined, joined)
+                                             if joined[start] != ord("\n")
+                                             for match in _REPEAT.finditer(text, start, end)]
+
+        for table, step_up, step_down in _SEQUENCE_TABLES:
+            codes: bytes = joined.translate(table)
+            spans += [(start, -end, 1) for start, end in _equal_runs(codes, codes.translate(step_up))]
+            spans += [(start, -end, 1) for start, end in _equal_runs(codes, codes.translate(step_down))]
+
+        if self._word_pattern is not None:
+            spans += [(match.start(), -match.end(), 2)
+                      for match in self._word_pattern.finditer(joined.translate(_WORD_TABLE))]
+
+        patterns: dict[int, tuple[list[str], list[str], list[str]]] = {}
+
+        if not spans:
+            return patterns
+
+        starts: list[int] = list(accumulate(map((1).__add__, map(len, passwords)), initial=0))
+        reach: int = -1
+
+        # Longest first where hits share a start, so a keyboard "jkl" inside an alphabet "jklmn" is skipped
+        for start, negative_end, kind in sorted(spans):
+            if -negative_end <= reach:
+                continue
+
+            reach = -negative_end
+            index: int = bisect_right(starts, start) - 1
+            run: str = passwords[index][start - starts[index]:reach - starts[index]]
+            patterns.setdefault(index, ([], [], []))[kind].append(run)
+
+        return patterns
+
+
+@lru_cache(maxsize=1)
+def default_analyzer() -> StrengthAnalyzer:
+    """
+    :return: The analyzer for the bundled common password list, built on first use.
+    """
+    return StrengthAnalyzer()
+
+
+def analyze(password: str) -> StrengthReport:
+    """
+    Scores a password with the default analyzer.
+
+    :param password: The password to score.
+    :return: Its diagnostics.
+    """
+    return default_analyzer().analyze(password)
+
+
+def analyze_many(passwords: Iterable[str]) -> list[StrengthReport]:
+    """
+    Scores a batch of passwords with the default analyzer.
+
+    :param passwords: The passwords to score.
+    :return: Their diagnostics, in the same order.
+    """
+    return default_analyzer().analyze_many(passwords)
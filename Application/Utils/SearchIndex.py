@@ -0,0 +1,175 @@
+import heapq
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Iterable
+
+CANDIDATE_LIMIT = 500
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Splits a lower-cased string into overlapping three-character grams, padded so short strings still match.
+
+    :param text: The string to split. Expected to be lower-cased already.
+    :return: The set of trigrams.
+    """
+    padded: str = f"  {text} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class SiteIndex:
+    """
+    In-memory search index over site names.
+
+    Keeps the lower-cased names in a sorted list for binary-search prefix lookups, and a trigram posting
+    table for ranked fuzzy matches. Both are updated incrementally as sites are added or removed.
+
+    :param sites: Site names to index initially.
+    """
+
+    def __init__(self, sites: Iterable[str] = ()):
+        self._keys: list[str] = []
+        self._names: dict[str, set[str]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._postings: dict[str, set[str]] = {}
+
+        for site in sites:
+            self._names.setdefault(site.lower(), set()).add(site)
+
+        self._keys = sorted(self._names)
+
+        for key in self._keys:
+            grams: set[str] = trigrams(key)
+            self._grams[key] = grams
+
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self._names.values())
+
+    def __contains__(self, site: str) -> bool:
+        return site in self._names.get(site.lower(), ())
+
+    def add(self, site: str) -> None:
+        """
+        Adds a site name to the index. Adding a name that is already indexed does nothing.
+
+        :param site: The site name to add.
+        :return: None
+        """
+        key: str = site.lower()
+        names: set[str] | None = self._names.get(key)
+
+        if names is not None:
+            names.add(site)
+            return None
+
+        self._names[key] = {site}
+        insort(self._keys, key)
+        grams: set[str] = trigrams(key)
+        self._grams[key] = grams
+
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+        return None
+
+    def remove(self, site: str) -> None:
+        """
+        Removes a site name from the index. Removing a name that is not indexed does nothing.
+
+        :param site: The site name to remove.
+        :return: None
+        """
+        key: str = site.lower()
+        names: set[str] | None = self._names.get(key)
+
+        if names is None or site not in names:
+            return None
+
+        names.discard(site)
+        if names:
+            return None
+
+        del self._names[key]
+        del self._keys[bisect_left(self._keys, key)]
+
+        for gram in self._grams.pop(key):
+            posting: set[str] = self._postings[gram]
+            posting.discard(key)
+            if not posting:
+                del self._postings[gram]
+
+        return None
+
+    def prefix(self, query: str, limit: int = 10) -> list[str]:
+        """
+        Finds sites whose name starts with the query, ignoring case.
+
+        :param query: The prefix to look for.
+        :param limit: Maximum number of results.
+        :return: Matching site names in alphabetical order.
+        """
+        key: str = query.lower()
+        results: list[str] = []
+        position: int = bisect_left(self._keys, key)
+
+        while position < len(self._keys) and len(results) < limit and self._keys[position].startswith(key):
+            results.extend(sorted(self._names[self._keys[position]]))
+            position += 1
+
+        return results[:limit]
+
+    def fuzzy(self, query: str, limit: int = 10) -> list[str]:
+        """
+        Finds sites whose name shares trigrams with the query, ranked by similarity.
+
+        Candidates are gathered from the rarest query trigrams first and capped at `CANDIDATE_LIMIT`, so common
+        trigrams do not make the lookup scan most of the index. Names containing the query as a substring rank
+        above those that don't.
+
+        :param query: The text to look for.
+        :param limit: Maximum number of results.
+        :return: Matching site names, best match first.
+        """
+        key: str = query.lower()
+        query_grams: set[str] = trigrams(key)
+        postings: list[set[str]] = sorted((self._postings[gram] for gram in query_grams if gram in self._postings),
+                                          key=len)
+        candidates: set[str] = set()
+
+        for posting in postings:
+            if len(candidates) + len(posting) > CANDIDATE_LIMIT:
+                if not candidates:
+                    # ASSERT: Every query trigram is common, so rank a bounded sample instead of most of the index
+                    candidates = set(islice(posting, CANDIDATE_LIMIT))
+                break
+            candidates |= posting
+
+        def score(candidate: str) -> tuple[bool, float, str]:
+            grams: set[str] = self._grams[candidate]
+            shared: int = len(query_grams & grams)
+            return key in candidate, shared / (len(query_grams) + len(grams) - shared), candidate
+
+        ranked: list[str] = [candidate for candidate in heapq.nlargest(limit, candidates, key=score)]
+        return [name for candidate in ranked for name in sorted(self._names[candidate])][:limit]
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """
+        Finds sites matching the query: prefix matches first, then fuzzy matches to fill the remaining slots.
+
+        :param query: The text typed by the user.
+        :param limit: Maximum number of results.
+        :return: Matching site names, best match first.
+        """
+        if not query:
+            return []
+
+        results: list[str] = self.prefix(query, limit)
+
+        if len(results) < limit:
+            seen: set[str] = set(results)
+            results.extend(site for site in self.fuzzy(query, limit) if site not in seen)
+
+        return results[:limit]
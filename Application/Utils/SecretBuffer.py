@@ -0,0 +1,162 @@
+import base64
+import binascii
+
+FERNET_VERSION = 0x80
+# Fernet token layout: version (1) | timestamp (8) | IV (16) | ciphertext | HMAC-SHA256 (32)
+IV_START = 9
+CIPHERTEXT_START = 25
+HMAC_SIZE = 32
+BLOCK_SIZE = 16
+
+
+class SecretBuffer:
+    """
+    A mutable, wipeable container for a decrypted secret.
+
+    A Python `str` or `bytes` cannot be overwritten, so a decrypted password held in one stays in memory
+    until the garbage collector frees it and the allocator happens to reuse the block. A SecretBuffer holds
+    the plaintext in a `bytearray` that is zeroed by `wipe()`, on leaving a `with` block, or when the buffer
+    is garbage collected. A buffer can be reused for several secrets; it only grows when a secret does not fit.
+
+    `reveal()` is the one place a `str` copy is made, for widgets and the clipboard, which only accept text.
+
+    :param capacity: Initial size of the underlying buffer in bytes.
+    """
+
+    def __init__(self, capacity: int = 0):
+        self._buffer: bytearray = bytearray(capacity)
+        self._length: int = 0
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> 'SecretBuffer':
+        """
+        Copies a secret into a new buffer. The caller remains responsible for wiping `data` if it is mutable.
+
+        :param data: The secret.
+        :return: A buffer holding a copy of `data`.
+        """
+        secret: SecretBuffer = cls(len(data))
+        secret._buffer[:len(data)] = data
+        secret._length = len(data)
+        return secret
+
+    def reserve(self, capacity: int) -> bytearray:
+        """
+        Makes sure the buffer can hold `capacity` bytes, wiping the previous contents.
+
+        :param capacity: Number of bytes needed.
+        :return: The underlying bytearray, to be written into directly.
+        """
+        self.wipe()
+
+        if len(self._buffer) < capacity:
+            self._buffer = bytearray(capacity)
+
+        return self._buffer
+
+    def set_length(self, length: int) -> None:
+        """
+        Marks how many bytes of the buffer hold the secret after it was written with `reserve()`.
+        The bytes past the end are wiped.
+
+        :param length: Length of the secret in bytes.
+        :return: None
+        """
+        self._buffer[length:] = bytes(len(self._buffer) - length)
+        self._length = length
+
+    def view(self) -> memoryview:
+        """
+        Returns a read-only view of the secret without copying it. Release the view when done.
+
+        :return: A memoryview over the secret bytes.
+        """
+        return memoryview(self._buffer)[:self._length].toreadonly()
+
+    def reveal(self) -> str:
+        """
+        Decodes the secret to text. The returned `str` cannot be wiped, so keep it only as long as needed.
+
+        :return: The secret as a string.
+        """
+        with memoryview(self._buffer) as buffer_view, buffer_view[:self._length] as secret_view:
+            return str(secret_view, "utf-8")
+
+    def wipe(self) -> None:
+        """
+        Overwrites the whole buffer with zeros.
+
+        :return: None
+        """
+        self._buffer[:] = bytes(len(self._buffer))
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> 'SecretBuffer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wipe()
+
+    def __del__(self) -> None:
+        self.wipe()
+
+    def __repr__(self) -> str:
+        return f"SecretBuffer(<{self._length} bytes>)"
+
+
+def fernet_decrypt_into(raw_key: bytearray, token: str, secret: SecretBuffer | None = None) -> SecretBuffer:
+    """
+    Verifies and decrypts a Fernet token straight into a SecretBuffer.
+
+    `Fernet.decrypt` returns the plaintext as an immutable `bytes`. This performs the same steps (HMAC-SHA256
+    check, then AES-128-CBC decryption and PKCS7 unpadding) with the AES output written directly into the
+    buffer, so no other copy of the plaintext is created.
+
+    :param raw_key: The 32 decoded key bytes: the signing key followed by the encryption key.
+    :param token: The Fernet token.
+    :param secret: A buffer to reuse, or None to allocate a new one.
+    :return: The buffer holding the plaintext.
+    :raises InvalidToken: If the token is malformed or fails authentication.
+    """
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.fernet import InvalidToken
+    from cryptography.hazmat.primitives import hashes, hmac
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+    try:
+        data: bytes = base64.urlsafe_b64decode(token)
+    except (binascii.Error, ValueError) as error:
+        raise InvalidToken from error
+
+    ciphertext_size: int = len(data) - CIPHERTEXT_START - HMAC_SIZE
+
+    if not data or data[0] != FERNET_VERSION or ciphertext_size <= 0 or ciphertext_size % BLOCK_SIZE:
+        raise InvalidToken
+
+    secret = secret if secret is not None else SecretBuffer()
+
+    with memoryview(raw_key) as key, memoryview(data) as token_view:
+        signature = hmac.HMAC(key[:16], hashes.SHA256())
+        signature.update(token_view[:-HMAC_SIZE])
+
+        try:
+            signature.verify(data[-HMAC_SIZE:])
+        except InvalidSignature as error:
+            raise InvalidToken from error
+
+        decryptor = Cipher(algorithms.AES(key[16:]), modes.CBC(data[IV_START:CIPHERTEXT_START])).decryptor()
+        buffer: bytearray = secret.reserve(ciphertext_size + BLOCK_SIZE - 1)
+        written: int = decryptor.update_into(token_view[CIPHERTEXT_START:-HMAC_SIZE], buffer)
+        decryptor.finalize()
+
+    padding: int = buffer[written - 1]
+
+    if not 1 <= padding <= BLOCK_SIZE or any(byte != padding for byte in buffer[written - padding:written]):
+        secret.wipe()
+        raise InvalidToken
+
+    secret.set_length(written - padding)
+    return secret
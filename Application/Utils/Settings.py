@@ -0,0 +1,251 @@
+import json
+import os
+import threading
+from json import JSONDecodeError
+from typing import Any
+
+from Application.Utils.LoggingController import log_error_and_method
+
+SAVE_DELAY = 0.5
+
+
+class SettingsLoadError(OSError):
+    """
+    Raised when a change is made while the settings file exists but cannot be read, since saving would replace
+    the whole file, including the master password hash and the wrapped vault key, with the few settings in memory.
+    """
+
+
+class Settings:
+    """
+    In-memory view of the settings file, shared by every reader in the application.
+
+    The file is parsed once and reads are served from memory. Before each read the file's modification time
+    is checked, and the file is reloaded if it was changed by something else. Writes update memory at once,
+    and are saved to disk after `save_delay` seconds without further changes, so a burst of changes costs one
+    write. Each save goes to a temporary file that is fsynced and renamed over the original, so a crash never
+    leaves a half-written settings file. While an existing file cannot be read, nothing is written over it.
+
+    :param path: Path to the JSON settings file.
+    :param save_delay: Seconds to wait after the last change before saving.
+    """
+
+    def __init__(self, path: str, save_delay: float = SAVE_DELAY):
+        self.path: str = path
+        self.save_delay: float = save_delay
+        self._data: dict[str, dict[str, Any]] = {}
+        self._mtime_ns: int | None = None
+        self._load_error: Exception | None = None
+        self._dirty: bool = False
+        self._timer: threading.Timer | None = None
+        self._lock: threading.RLock = threading.RLock()
+
+        self.reload()
+
+    @property
+    def exists(self) -> bool:
+        """
+        :return: True if the settings file exists or has changes waiting to be saved.
+        """
+        with self._lock:
+            return self._dirty or self._file_mtime() is not None
+
+    @property
+    def load_error(self) -> Exception | None:
+        """
+        :return: The error that stopped the existing settings file from being read, or None if it was read.
+        """
+        with self._lock:
+            self._refresh()
+            return self._load_error
+
+    def _file_mtime(self) -> int | None:
+        """
+        :return: The modification time of the settings file in nanoseconds, or None if it does not exist.
+        """
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def reload(self) -> None:
+        """
+        Reads the settings file into memory. A missing or unreadable file is treated as empty. An unreadable file
+        is remembered in `load_error` and protected from being overwritten until it is readable again.
+
+        :return: None
+        """
+        with self._lock:
+            self._mtime_ns = self._file_mtime()
+            self._data = {}
+            self._load_error = None
+
+            if self._mtime_ns is None:
+                return None
+
+            try:
+                with open(self.path, "r") as file:
+                    data = json.load(file)
+
+                if not isinstance(data, dict):
+                    raise JSONDecodeError("Settings file does not hold a JSON object", "", 0)
+
+                self._data = data
+
+            except (OSError, JSONDecodeError) as error:
+                log_error_and_method(error)
+                self._load_error = error
+
+        return None
+
+    def _refresh(self) -> None:
+        """
+        Reloads the file if it changed on disk since it was last read or written. Unsaved changes take priority.
+
+        :return: None
+        """
+        if not self._dirty and self._file_mtime() != self._mtime_ns:
+            self.reload()
+
+    def get(self, section: str, key: str, default: Any = None) -> Any:
+        """
+        Returns a setting from memory.
+
+        :param section: The top-level block of the settings file, e.g. 'settings' or 'app_password'.
+        :param key: The setting within the block.
+        :param default: Returned if the setting is not defined.
+        :return: The value of the setting, or `default`.
+        """
+        with self._lock:
+            self._refresh()
+            return self._data.get(section, {}).get(key, default)
+
+    def set(self, section: str, key: str, value: Any, immediate: bool = False) -> None:
+        """
+        Changes a setting in memory and schedules a save.
+
+        :param section: The top-level block of the settings file.
+        :param key: The setting within the block.
+        :param value: The new value. It must be JSON serializable.
+        :param immediate: If True, saves before returning instead of waiting for the save delay.
+        :return: None
+        :raises SettingsLoadError: If the existing settings file cannot be read.
+        :raises OSError: If `immediate` is True and the file cannot be written.
+        """
+        with self._lock:
+            self._refresh()
+            self._check_loaded()
+            self._data.setdefault(section, {})[key] = value
+            self._schedule_save(immediate)
+
+        return None
+
+    def remove(self, section: str, key: str, immediate: bool = False) -> None:
+        """
+        Deletes a setting from memory and schedules a save. Removing a setting that is not defined does nothing.
+
+        :param section: The top-level block of the settings file.
+        :param key: The setting within the block.
+        :param immediate: If True, saves before returning instead of waiting for the save delay.
+        :return: None
+        :raises SettingsLoadError: If the existing settings file cannot be read.
+        :raises OSError: If `immediate` is True and the file cannot be written.
+        """
+        with self._lock:
+            self._refresh()
+            self._check_loaded()
+
+            if key not in self._data.get(section, {}):
+                return None
+
+            del self._data[section][key]
+            self._schedule_save(immediate)
+
+        return None
+
+    def _check_loaded(self) -> None:
+        """
+        :return: None
+        :raises SettingsLoadError: If the existing settings file could not be read.
+        """
+        if self._load_error is not None:
+            raise SettingsLoadError(f"Refusing to change {self.path}, which could not be read: {self._load_error}")
+
+    def _schedule_save(self, immediate: bool) -> None:
+        """
+        Marks the settings as changed and either saves them now or (re)starts the save timer.
+
+        :param immediate: If True, saves before returning.
+        :return: None
+        """
+        self._dirty = True
+
+        if immediate:
+            self.flush()
+            return None
+
+        if self._timer is not None:
+            self._timer.cancel()
+
+        self._timer = threading.Timer(self.save_delay, self._save_pending)
+        self._timer.daemon = True
+        self._timer.start()
+        return None
+
+    def _save_pending(self) -> None:
+        """
+        Saves the pending changes from the save timer, logging instead of raising if the write fails.
+
+        :return: None
+        """
+        try:
+            self.flush()
+        except OSError as error:
+            log_error_and_method(error)
+
+    def flush(self) -> None:
+        """
+        Saves pending changes now, cancelling any scheduled save.
+
+        :return: None
+        :raises OSError: If the file cannot be written. The changes stay pending.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if not self._dirty:
+                return None
+
+            self._write()
+            self._dirty = False
+
+        return None
+
+    def _write(self) -> None:
+        """
+        Atomically replaces the settings file with the in-memory settings.
+
+        :return: None
+        :raises SettingsLoadError: If the existing settings file could not be read.
+        """
+        self._check_loaded()
+        directory: str = os.path.dirname(self.path)
+        temp_path: str = f"{self.path}.tmp"
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            with open(temp_path, "w") as file:
+                json.dump(self._data, file, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temp_path, self.path)
+            self._mtime_ns = self._file_mtime()
+
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,127 @@
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+PROFILE_FLAG = "--profile-startup"
+FIRST_FRAME_FLAG = "--exit-after-first-frame"
+FIRST_FRAME_MARKER = "first-frame"
+IMPORTTIME_PREFIX = "import time:"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class ImportTime(NamedTuple):
+    """
+    Import cost of one module, as reported by `python -X importtime`.
+
+    :param module: The fully qualified module name.
+    :param self_us: Microseconds spent executing the module itself.
+    :param cumulative_us: Microseconds including the modules it imported.
+    :param depth: Nesting level of the import, 0 for modules imported by the script.
+    """
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class StartupReport(NamedTuple):
+    """
+    Outcome of profiling one application launch.
+
+    :param first_frame_seconds: Wall time from process start until the first frame was drawn,
+                                or None if the window could not be shown (e.g. no display).
+    :param imports: Every module imported before the first frame, in import order.
+    """
+    first_frame_seconds: float | None
+    imports: list[ImportTime]
+
+
+def parse_importtime(lines: Iterable[str]) -> list[ImportTime]:
+    """
+    Parses the output of `python -X importtime`, ignoring any other stderr lines.
+
+    :param lines: Lines written to stderr by the profiled process.
+    :return: One entry per imported module.
+    """
+    imports: list[ImportTime] = []
+
+    for line in lines:
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+
+        fields: list[str] = line[len(IMPORTTIME_PREFIX):].split("|")
+
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # ASSERT: Column header line
+            continue
+
+        name: str = fields[2].rstrip()
+        module: str = name.lstrip()
+        depth: int = (len(name) - len(module) - 1) // 2
+        imports.append(ImportTime(module, int(fields[0]), int(fields[1]), depth))
+
+    return imports
+
+
+def profile_startup(script: str, timeout: float = 60) -> StartupReport:
+    """
+    Launches the application in a child process with `-X importtime` and stops it once the first frame is drawn.
+
+    The child runs with `FIRST_FRAME_FLAG`, so it prints `FIRST_FRAME_MARKER` after drawing its first frame and
+    closes. The time until that marker arrives includes interpreter startup, as a user would experience it.
+
+    :param script: Path to the application entry script.
+    :param timeout: Seconds to wait for the child before giving up.
+    :return: The time to the first frame and the per-module import times.
+    """
+    # Only needed in profile mode, so they are kept out of the normal startup path
+    import subprocess
+    import tempfile
+
+    script_path: Path = Path(script).resolve()
+    env: dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+
+    with tempfile.TemporaryFile("w+") as stderr:
+        started: float = time.perf_counter()
+        process = subprocess.Popen([sys.executable, "-X", "importtime", str(script_path), FIRST_FRAME_FLAG],
+                                   cwd=script_path.parent, env=env, stdout=subprocess.PIPE, stderr=stderr,
+                                   text=True)
+        first_frame_seconds: float | None = None
+
+        try:
+            for line in process.stdout:
+                if line.strip() == FIRST_FRAME_MARKER:
+                    first_frame_seconds = time.perf_counter() - started
+
+            process.wait(timeout=timeout)
+        finally:
+            process.kill()
+            process.stdout.close()
+
+        stderr.seek(0)
+        return StartupReport(first_frame_seconds, parse_importtime(stderr))
+
+
+def format_report(report: StartupReport, limit: int = 25) -> str:
+    """
+    Formats a startup report as a table of the slowest imports.
+
+    :param report: The report to format.
+    :param limit: Number of modules listed.
+    :return: The formatted report.
+    """
+    first_frame: str = "n/a (no display)" if report.first_frame_seconds is None \
+        else f"{report.first_frame_seconds * 1000:.1f} ms"
+    total_us: int = sum(entry.cumulative_us for entry in report.imports if entry.depth == 0)
+    lines: list[str] = [f"Time to first frame: {first_frame}",
+                        f"Imports: {len(report.imports)} modules, {total_us / 1000:.1f} ms",
+                        f"{'self (ms)':>10} {'total (ms)':>11}  module"]
+
+    for entry in sorted(report.imports, key=lambda item: item.cumulative_us, reverse=True)[:limit]:
+        lines.append(f"{entry.self_us / 1000:>10.1f} {entry.cumulative_us / 1000:>11.1f}  "
+                     f"{'  ' * entry.depth}{entry.module}")
+
+    return "\n".join(lines)
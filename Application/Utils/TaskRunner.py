@@ -0,0 +1,121 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+POLL_MS = 25
+
+
+class TaskRunner:
+    """
+    Runs one CPU-bound task at a time on a worker thread and delivers its outcome back to the UI thread.
+
+    Completion is detected by polling through `schedule`, which for Tk is the root window's `after()`,
+    so the callbacks always run on the thread that owns the widgets. While a task is in flight, new
+    submissions are ignored, which makes repeated button clicks harmless.
+
+    Tasks that can measure their progress are handed `report_progress` as an argument by the caller; the latest
+    value is passed to `on_progress` on the UI thread at each poll.
+
+    :param schedule: Callable taking a delay in milliseconds and a callback, e.g. `tkinter.Tk.after`.
+    :param on_busy_change: Optional callable told True when a task starts and False when it finishes.
+    :param on_progress: Optional callable receiving (done, total) on the UI thread when a task reports progress.
+    """
+
+    def __init__(self, schedule: Callable[[int, Callable[[], None]], Any],
+                 on_busy_change: Callable[[bool], None] | None = None,
+                 on_progress: Callable[[int, int], None] | None = None):
+        self.schedule: Callable[[int, Callable[[], None]], Any] = schedule
+        self.on_busy_change: Callable[[bool], None] | None = on_busy_change
+        self.on_progress: Callable[[int, int], None] | None = on_progress
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task")
+        self._future: Future | None = None
+        self._progress: tuple[int, int] | None = None
+        self._shown_progress: tuple[int, int] | None = None
+
+    @property
+    def busy(self) -> bool:
+        """
+        :return: True while a task is in flight.
+        """
+        return self._future is not None
+
+    def submit(self, func: Callable[..., Any], *args, on_done: Callable[[Any], None] | None = None,
+               on_error: Callable[[BaseException], None] | None = None) -> bool:
+        """
+        Starts a task on the worker thread unless another task is still running.
+
+        :param func: The function to run on the worker thread.
+        :param args: Positional arguments passed to `func`.
+        :param on_done: Called on the UI thread with the return value of `func`.
+        :param on_error: Called on the UI thread with the exception if `func` raises. Errors are logged if omitted.
+        :return: True if the task was started, False if it was ignored because another task is running.
+        """
+        if self.busy:
+            logging.info(f"Ignoring {getattr(func, '__name__', func)} while another task is running")
+            return False
+
+        self._progress = None
+        self._shown_progress = None
+        self._future = self._executor.submit(func, *args)
+
+        if self.on_busy_change is not None:
+            self.on_busy_change(True)
+
+        self.schedule(POLL_MS, lambda: self._poll(on_done, on_error))
+        return True
+
+    def _poll(self, on_done: Callable[[Any], None] | None, on_error: Callable[[BaseException], None] | None) -> None:
+        """
+        Checks whether the running task has finished and, if so, runs its callback.
+
+        :param on_done: Callback for a successful result.
+        :param on_error: Callback for a raised exception.
+        :return: None
+        """
+        future: Future = self._future
+        progress: tuple[int, int] | None = self._progress
+
+        if progress != self._shown_progress and self.on_progress is not None:
+            self._shown_progress = progress
+            self.on_progress(*progress)
+
+        if not future.done():
+            self.schedule(POLL_MS, lambda: self._poll(on_done, on_error))
+            return None
+
+        self._future = None
+
+        if self.on_busy_change is not None:
+            self.on_busy_change(False)
+
+        error: BaseException | None = future.exception()
+
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+            else:
+                logging.error(f"{type(error).__name__} occurred in background task: {error}")
+            return None
+
+        if on_done is not None:
+            on_done(future.result())
+
+        return None
+
+    def report_progress(self, done: int, total: int) -> None:
+        """
+        Records the progress of the running task. Safe to call from the worker thread.
+
+        :param done: Units of work completed.
+        :param total: Total units of work.
+        :return: None
+        """
+        self._progress = (done, total)
+
+    def shutdown(self) -> None:
+        """
+        Stops accepting tasks and lets the worker thread exit once any running task finishes.
+
+        :return: None
+        """
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,109 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TimedCache(Generic[K, V]):
+    """
+    A small cache whose entries expire after a fixed time-to-live.
+
+    Once `max_size` entries are held, adding a new one evicts the least recently used entry.
+    Expired entries are dropped whenever the cache is read or written.
+
+    :param ttl: Seconds an entry stays valid after it is stored.
+    :param max_size: Maximum number of entries held at once.
+    :param on_evict: Optional callable receiving each value the cache drops (expired, evicted, replaced or
+                     cleared), e.g. to wipe a secret. Values removed with `pop()` are handed to the caller instead.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 32, on_evict: Callable[[V], None] | None = None):
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.on_evict: Callable[[V], None] | None = on_evict
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """
+        Returns the cached value for a key if it has not expired.
+
+        :param key: The key to look up.
+        :return: The cached value, or None if it is missing or expired.
+        """
+        self.purge()
+        entry: tuple[float, V] | None = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Stores a value, restarting its time-to-live.
+
+        :param key: The key to store the value under.
+        :param value: The value to cache.
+        :return: None
+        """
+        self.purge()
+        previous: tuple[float, V] | None = self._entries.get(key)
+
+        if previous is not None and previous[1] is not value:
+            self._evict(previous[1])
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._evict(self._entries.popitem(last=False)[1][1])
+
+    def pop(self, key: K) -> V | None:
+        """
+        Removes a key from the cache.
+
+        :param key: The key to remove.
+        :return: The value that was cached, or None if there was none.
+        """
+        entry: tuple[float, V] | None = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def purge(self) -> None:
+        """
+        Drops every expired entry.
+
+        :return: None
+        """
+        now: float = time.monotonic()
+        expired: list[K] = [key for key, (expires, _) in self._entries.items() if expires <= now]
+
+        for key in expired:
+            self._evict(self._entries.pop(key)[1])
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+
+        :return: None
+        """
+        for _, value in self._entries.values():
+            self._evict(value)
+
+        self._entries.clear()
+
+    def _evict(self, value: V) -> None:
+        """
+        Passes a dropped value to `on_evict`, if set.
+
+        :param value: The value dropped from the cache.
+        :return: None
+        """
+        if self.on_evict is not None:
+            self.on_evict(value)
+
+    def __len__(self) -> int:
+        self.purge()
+        return len(self._entries)
@@ -0,0 +1,682 @@
+import logging
+import os
+import threading
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+import bcrypt
+
+from Application.Utils.BreachIndex import BreachIndex, build_index
+from Application.Utils.CredentialImport import ImportResult, import_credentials
+from Application.Utils.CredentialStore import Entry, EntryStore, SqliteCredentialStore
+from Application.Utils.KeyDerivation import KdfParams, TARGET_UNLOCK_SECONDS, calibrate, wrap_keys, unwrap_keys
+from Application.Utils.KeyRotation import RotationResult, rotate_entries
+from Application.Utils.LoggingController import log_error_and_method
+from Application.Utils.SearchIndex import SiteIndex
+from Application.Utils.SecretBuffer import SecretBuffer
+from Application.Utils.Settings import Settings
+from Application.Utils.VaultAudit import AUDIT_BATCH, AuditResult, audit_entries
+from Application.Utils.VaultBackup import restore_backup, write_backup
+from Application.Utils.VaultSession import DecryptBatch, VaultSession
+
+BCRYPT_ROUNDS = 13
+PROCESS_POOL_THRESHOLD = 20000
+ENTRY_BATCH = 256
+SETTINGS_NAME = "Settings.json"
+LEGACY_KEY_NAME = "secret.key"
+CRED_JSON_NAME = "Creds.json"
+CRED_DB_NAME = "Creds.db"
+BREACH_INDEX_NAME = "Breaches.idx"
+
+
+class VaultKeyError(Exception):
+    """
+    Raised when the vault holds entries but neither a wrapped key nor a legacy key file is found to decrypt them.
+    """
+
+
+def hash_password(password: str) -> str:
+    """
+    Hashes a password using bcrypt with a generated salt and a cost factor of `BCRYPT_ROUNDS`.
+
+    :param password: The plain-text password to hash.
+    :return: A bcrypt-hashed version of the password.
+    """
+    encoded_bytes: bytes = password.encode('utf-8')
+    salt: bytes = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    hashed_password: bytes = bcrypt.hashpw(encoded_bytes, salt)
+    return hashed_password.decode('utf-8')
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    """
+    Verifies a plain-text password against a previously hashed password using bcrypt.
+
+    :param password: The plain-text password to verify.
+    :param hashed: The bcrypt-hashed password to compare against
+    :return: True if the password matches the hash, False otherwise.
+    """
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+class Vault:
+    """
+    Headless vault engine: the master password, the key, the credential store and the search index of one
+    data directory, with no dependency on Tk or on the working directory.
+
+    Every file the vault uses lives in `data_dir`. The session, store and settings can be passed in, e.g. to
+    share a session or to use another backend; anything not passed in is created on first use. Several vaults
+    can be open at once, and one vault can be used from several threads, since the store, settings and session
+    are each thread-safe.
+
+    Methods raise on storage errors instead of logging them; callers that drive a UI decide how to report them.
+
+    :param data_dir: Directory holding the settings file, the credential database and any legacy files.
+    :param session: The session holding the vault key. A new locked session is created if None.
+    :param store: The credential store. The SQLite database in `data_dir` is opened on first use if None.
+    :param settings: The settings service. The settings file in `data_dir` is loaded on first use if None.
+    """
+
+    def __init__(self, data_dir: str, session: VaultSession | None = None, store: EntryStore | None = None,
+                 settings: Settings | None = None):
+        self.data_dir: str = data_dir
+        self.session: VaultSession = session if session is not None else VaultSession(
+            process_threshold=PROCESS_POOL_THRESHOLD)
+        self._store: EntryStore | None = store
+        self._settings: Settings | None = settings
+        self._index: SiteIndex | None = None
+        self._breaches: BreachIndex | None = None
+        self._lock: threading.RLock = threading.RLock()
+
+    def path(self, name: str) -> str:
+        """
+        :param name: A file name.
+        :return: The path of that file inside the data directory.
+        """
+        return os.path.join(self.data_dir, name)
+
+    @property
+    def settings(self) -> Settings:
+        """
+        :return: The settings service, loading the settings file on first use.
+        """
+        with self._lock:
+            if self._settings is None:
+                self._settings = Settings(self.path(SETTINGS_NAME))
+
+            return self._settings
+
+    def set_settings(self, settings: Settings | None) -> None:
+        """
+        Replaces the settings service, saving any changes still pending in the previous one.
+
+        :param settings: The settings service to use from now on, or None to reload the settings file on next use.
+        :return: None
+        :raises OSError: If the pending changes cannot be saved.
+        """
+        with self._lock:
+            if self._settings is not None and self._settings is not settings:
+                self._settings.flush()
+
+            self._settings = settings
+
+    @property
+    def store(self) -> EntryStore:
+        """
+        :return: The credential store, opening the SQLite database on first use. The first time the database
+                 is created, any entries in a legacy Creds.json are migrated into it.
+        """
+        with self._lock:
+            if self._store is None:
+                os.makedirs(self.data_dir, exist_ok=True)
+                self._store = SqliteCredentialStore(self.path(CRED_DB_NAME), legacy_json=self.path(CRED_JSON_NAME))
+
+            return self._store
+
+    def set_store(self, store: EntryStore | None) -> None:
+        """
+        Replaces the credential store, closing the previous one.
+
+        :param store: The store to use from now on, or None to reopen the database on next use.
+        :return: None
+        """
+        with self._lock:
+            if self._store is not None and self._store is not store:
+                self._store.close()
+
+            self._store = store
+            self._index = None
+
+    @property
+    def index(self) -> SiteIndex:
+        """
+        :return: The site search index, built from the store the first time it is needed.
+        """
+        with self._lock:
+            if self._index is None:
+                self._index = SiteIndex(self.store.sites())
+
+            return self._index
+
+    @property
+    def breach_index(self) -> BreachIndex | None:
+        """
+        :return: The breach index in the data directory, mapped on first use, or None if none has been imported.
+        :raises BreachIndexError: If the index file is damaged.
+        """
+        with self._lock:
+            if self._breaches is None and os.path.exists(self.path(BREACH_INDEX_NAME)):
+                self._breaches = BreachIndex(self.path(BREACH_INDEX_NAME))
+
+            return self._breaches
+
+    def close(self) -> None:
+        """
+        Locks the session, saves pending settings, closes the store and unmaps the breach index.
+
+        :return: None
+        :raises OSError: If pending settings cannot be saved.
+        """
+        self.lock()
+
+        try:
+            self.set_settings(None)
+        finally:
+            self.set_store(None)
+            self._close_breaches()
+
+    def _close_breaches(self) -> None:
+        """
+        Unmaps the breach index, if it is open.
+
+        :return: None
+        """
+        with self._lock:
+            if self._breaches is not None:
+                self._breaches.close()
+                self._breaches = None
+
+    # Account
+
+    def read_legacy_key(self) -> bytes | None:
+        """
+        Reads the unprotected key file written by earlier versions, so it can be wrapped with the master password.
+
+        :return: The key, or None if there is no legacy key file.
+        """
+        try:
+            with open(self.path(LEGACY_KEY_NAME), "rb") as key_file:
+                return key_file.read().strip()
+
+        except FileNotFoundError:
+            return None
+
+    def save_key(self, vault_key: bytes, password: str, target_seconds: float = TARGET_UNLOCK_SECONDS) -> None:
+        """
+        Wraps the vault key with a key derived from the master password and saves it in the settings file.
+
+        The scrypt cost is calibrated so that unwrapping takes about `target_seconds` on this machine. Once the
+        wrapped key is saved, the legacy plain-text key file is deleted.
+
+        :param vault_key: The Fernet key that encrypts the stored passwords.
+        :param password: The master password.
+        :param target_seconds: Desired time to derive the key at login.
+        :return: None
+        """
+        params: KdfParams = calibrate(target_seconds)
+
+        self.settings.set("vault", "kdf", params._asdict())
+        self.settings.set("vault", "wrapped_key", wrap_keys([vault_key], password, params)[0], immediate=True)
+
+        if os.path.exists(self.path(LEGACY_KEY_NAME)):
+            os.remove(self.path(LEGACY_KEY_NAME))
+            logging.info("Legacy key file replaced by a password-wrapped key")
+
+    def create(self, password: str) -> VaultSession:
+        """
+        Sets up the master password for a new account and unlocks the vault.
+
+        The password is stored as a bcrypt hash. The vault key is taken from a legacy key file if one exists,
+        otherwise generated, and is then saved wrapped with the password.
+
+        :param password: The new master password.
+        :return: The unlocked vault session.
+        """
+        from cryptography.fernet import Fernet
+
+        vault_key: bytes = self.read_legacy_key() or Fernet.generate_key()
+
+        self.settings.set("app_password", "password", hash_password(password), immediate=True)
+        self.save_key(vault_key, password)
+        self.session.unlock(vault_key)
+        return self.session
+
+    def open(self, password: str) -> bool:
+        """
+        Checks the master password and, if it is correct, unlocks the vault.
+
+        The vault key is unwrapped with a key derived from the password, so the scrypt cost is paid once per
+        login. Vaults still using a legacy key file are migrated to a wrapped key on their first login. If a key
+        rotation was interrupted, the previous key is unwrapped too so that entries not yet re-encrypted stay
+        readable. A new key is only generated for a vault with no entries, since entries encrypted under a lost
+        key could never be read again.
+
+        :param password: The master password.
+        :return: True if the password is correct and the vault is unlocked, False otherwise.
+        :raises VaultKeyError: If no key is found but the vault holds entries.
+        """
+        from cryptography.fernet import Fernet, InvalidToken
+
+        hashed_pwd: str | None = self.settings.get("app_password", "password")
+
+        if hashed_pwd is None or not verify_password(password, hashed_pwd):
+            return False
+
+        wrapped_key: str | None = self.settings.get("vault", "wrapped_key")
+
+        if wrapped_key is None:
+            vault_key: bytes | None = self.read_legacy_key()
+
+            if vault_key is None:
+                if len(self.store):
+                    raise VaultKeyError(f"No vault key found for the {len(self.store)} stored entries")
+
+                logging.warning("No vault key found for an empty vault, generating a new one")
+                vault_key = Fernet.generate_key()
+
+            self.save_key(vault_key, password)
+            self.session.unlock(vault_key)
+            return True
+
+        try:
+            previous_keys: list[str] = self.settings.get("vault", "previous_wrapped_keys", [])
+            vault_keys: list[bytes] = unwrap_keys([wrapped_key, *previous_keys], password,
+                                                  KdfParams(**self.settings.get("vault", "kdf")))
+            self.session.unlock(vault_keys[0], vault_keys[1:])
+            return True
+
+        except (InvalidToken, TypeError) as error:
+            log_error_and_method(error)
+            return False
+
+    def lock(self) -> None:
+        """
+        Locks the session, wiping the key held in memory, and drops the site search index.
+
+        :return: None
+        """
+        with self._lock:
+            self.session.lock()
+            self._index = None
+
+    # Key rotation
+
+    @property
+    def rotation_pending(self) -> bool:
+        """
+        :return: True if a key rotation was started and has not finished re-encrypting the vault.
+        """
+        return self.settings.get("vault", "previous_wrapped_keys") is not None
+
+    def rotate_key(self, password: str, progress: Callable[[int, int], None] | None = None) -> RotationResult | None:
+        """
+        Replaces the vault key with a new one and re-encrypts every stored password under it.
+
+        The new key and the old key are both saved, wrapped with the master password, before anything is
+        re-encrypted. From then on new entries use the new key while old entries stay readable with the old one,
+        so the vault can be used while the rotation runs. If a rotation is already pending, it is resumed instead
+        of starting another one.
+
+        :param password: The master password, needed to wrap the new key.
+        :param progress: Optional callable receiving (entries processed, total entries) as the rotation runs.
+        :return: The outcome of the re-encryption, or None if the password is wrong.
+        """
+        from cryptography.fernet import Fernet, InvalidToken
+
+        if self.rotation_pending:
+            return self.resume_rotation(progress)
+
+        try:
+            params: KdfParams = KdfParams(**self.settings.get("vault", "kdf"))
+            old_key: bytes = unwrap_keys([self.settings.get("vault", "wrapped_key")], password, params)[0]
+
+        except (InvalidToken, TypeError) as error:
+            log_error_and_method(error)
+            return None
+
+        new_key: bytes = Fernet.generate_key()
+        new_wrapped, old_wrapped = wrap_keys([new_key, old_key], password, params)
+
+        self.settings.set("vault", "previous_wrapped_keys", [old_wrapped])
+        self.settings.set("vault", "rotation_after", None)
+        self.settings.set("vault", "wrapped_key", new_wrapped, immediate=True)
+        self.session.unlock(new_key, [old_key])
+        logging.info("Vault key rotation started")
+
+        return self.resume_rotation(progress)
+
+    def resume_rotation(self, progress: Callable[[int, int], None] | None = None) -> RotationResult | None:
+        """
+        Re-encrypts the entries a pending key rotation has not reached yet, then retires the old key.
+
+        Progress is checkpointed in the settings file after every batch, so an interrupted rotation continues
+        from the last committed batch on the next call.
+
+        :param progress: Optional callable receiving (entries processed, total entries) as the rotation runs.
+        :return: The outcome of the re-encryption, or None if no rotation is pending.
+        """
+        if not self.rotation_pending:
+            return None
+
+        result: RotationResult = rotate_entries(
+            self.store, self.session, self.settings.get("vault", "rotation_after"),
+            checkpoint=lambda key: self.settings.set("vault", "rotation_after", key), progress=progress)
+
+        self.settings.remove("vault", "rotation_after")
+        self.settings.remove("vault", "previous_wrapped_keys", immediate=True)
+        self.session.retire_previous_keys()
+
+        logging.info(f"Re-encrypted {result.rotated} entries in {result.seconds:.2f}s "
+                     f"({result.entries_per_second:.0f} entries/sec), {result.failed} could not be decrypted")
+        return result
+
+    # Entries
+
+    def get_many(self, sites: Iterable[str]) -> dict[str, dict[str, str]]:
+        """
+        Looks up and decrypts the credentials of several sites, decrypting the passwords as one batch.
+
+        :param sites: The websites to look up.
+        :return: A dictionary mapping each stored site to the username and decrypted password of its first account
+                 by username. Sites that are not stored, or whose password cannot be decrypted, are left out.
+        """
+        found: list[tuple[str, dict[str, str]]] = list(self.store.get_many(sites).items())
+        return dict(self._decrypt(found)) if found else {}
+
+    def put_many(self, entries: Iterable[tuple[str, str, str]], encrypted: bool = False) -> int:
+        """
+        Encrypts and stores several entries in one transaction, replacing entries for the same site and username.
+
+        :param entries: (site, username, password) tuples.
+        :param encrypted: True if the passwords are already encrypted with the session key.
+        :return: The number of entries stored.
+        """
+        entries = list(entries)
+        tokens: list[str] = [pwd for _, _, pwd in entries] if encrypted else \
+            self.session.encrypt_many(pwd for _, _, pwd in entries)
+
+        self.store.put_many((site, username, token) for (site, username, _), token in zip(entries, tokens))
+
+        with self._lock:
+            if self._index is not None:
+                for site, _, _ in entries:
+                    self._index.add(site)
+
+        return len(entries)
+
+    def delete_many(self, sites: Iterable[str]) -> int:
+        """
+        Removes every account on several sites in one transaction.
+
+        :param sites: The websites to remove.
+        :return: The number of entries removed.
+        """
+        sites = list(sites)
+        removed: int = self.store.delete_many(sites)
+
+        with self._lock:
+            if self._index is not None:
+                for site in sites:
+                    self._index.remove(site)
+
+        return removed
+
+    def iter_entries(self, batch_size: int = ENTRY_BATCH) -> Iterator[tuple[str, dict[str, str]]]:
+        """
+        Streams decrypted credentials out of the store, ordered by site and then username.
+
+        Entries are read and decrypted in batches of `batch_size`, so only one batch of plaintext is held at once
+        regardless of vault size. Entries that fail to decrypt are logged and skipped.
+
+        :param batch_size: Number of entries decrypted together.
+        :return: An iterator of (site, {"username": ..., "password": ...}) pairs.
+        """
+        entries: Iterator[tuple[str, dict[str, str]]] = self.store.items()
+
+        while batch := list(islice(entries, batch_size)):
+            yield from self._decrypt(batch)
+
+    def _decrypt(self, batch: list[tuple[str, dict[str, str]]]) -> Iterator[tuple[str, dict[str, str]]]:
+        """
+        Decrypts the passwords of a batch of stored entries together.
+
+        :param batch: (site, {"username": ..., "password": token}) pairs.
+        :return: The pairs with decrypted passwords, skipping any that could not be decrypted.
+        """
+        decrypted: DecryptBatch = self.session.decrypt_batch(creds["password"] for _, creds in batch)
+
+        for (site, creds), password in zip(batch, decrypted.passwords):
+            if password is None:
+                # ASSERT: Token is corrupt or was encrypted under another key
+                logging.warning(f"Could not decrypt password for {site}, skipping entry")
+                continue
+
+            yield site, {"username": creds["username"], "password": password}
+
+    def get_secret(self, site: str, secret: SecretBuffer | None = None,
+                   username: str | None = None) -> SecretBuffer | None:
+        """
+        Decrypts the password stored for an account into a wipeable buffer, without creating a string copy of it.
+
+        :param site: The website to look up.
+        :param secret: A buffer to reuse, or None to allocate a new one.
+        :param username: The account to look up, or None for the site's first account by username.
+        :return: The buffer holding the decrypted password, or None if the account is not stored.
+        :raises InvalidToken: If the stored password cannot be decrypted.
+        """
+        creds: dict[str, str] | None = self.store.get(site, username)
+
+        if creds is None:
+            return None
+
+        return self.session.decrypt_into(creds["password"], secret)
+
+    def get_account(self, site: str, username: str | None = None) -> dict[str, str] | None:
+        """
+        Looks up and decrypts the credentials of one account.
+
+        :param site: The website to look up.
+        :param username: The account to look up, or None for the site's first account by username.
+        :return: The username and decrypted password, or None if the account is not stored or cannot be decrypted.
+        """
+        creds: dict[str, str] | None = self.store.get(site, username)
+        found: list[tuple[str, dict[str, str]]] = list(self._decrypt([(site, creds)])) if creds is not None else []
+        return found[0][1] if found else None
+
+    def find_entries(self, site: str | None = None, username: str | None = None,
+                     tag: str | None = None) -> list[Entry]:
+        """
+        Finds the entries matching every criterion given, without decrypting any passwords.
+
+        :param site: Only entries for this site.
+        :param username: Only entries with this username.
+        :param tag: Only entries with this tag.
+        :return: The matching entries with their passwords still encrypted, ordered by site and then username.
+        """
+        return self.store.find(site, username, tag)
+
+    def add_entry(self, site: str, username: str, password: str, tags: Iterable[str] = (), notes: str = "") -> int:
+        """
+        Encrypts and stores an account with its tags and notes, replacing the entry for the same site and
+        username.
+
+        :param site: The website the account is for.
+        :param username: The username or email of the account.
+        :param password: The plain-text password.
+        :param tags: The entry's tags.
+        :param notes: Free-text notes.
+        :return: The ID of the entry.
+        """
+        entry_id: int = self.store.add_entry(site, username, self.session.encrypt(password), tags, notes)
+
+        with self._lock:
+            if self._index is not None:
+                self._index.add(site)
+
+        return entry_id
+
+    def update_entry(self, entry_id: int, site: str | None = None, username: str | None = None,
+                     password: str | None = None, tags: Iterable[str] | None = None,
+                     notes: str | None = None) -> bool:
+        """
+        Changes the given fields of an entry, encrypting a new password. Fields left as None are kept.
+
+        :param entry_id: The entry to change.
+        :param site: The new site.
+        :param username: The new username.
+        :param password: The new plain-text password.
+        :param tags: The new tags, replacing the old ones.
+        :param notes: The new notes.
+        :return: True if the entry was changed, False if it does not exist.
+        :raises sqlite3.IntegrityError: If another entry already holds the new site and username.
+        """
+        before: Entry | None = self.store.get_entry(entry_id) if site is not None else None
+        token: str | None = self.session.encrypt(password) if password is not None else None
+
+        if not self.store.update_entry(entry_id, site, username, token, tags, notes):
+            return False
+
+        if before is not None and before.site != site:
+            self._reindex_site(before.site)
+            self._reindex_site(site)
+
+        return True
+
+    def delete_entry(self, entry_id: int) -> bool:
+        """
+        Removes one entry, leaving any other accounts on its site in place.
+
+        :param entry_id: The entry to remove.
+        :return: True if the entry was removed, False if it does not exist.
+        """
+        entry: Entry | None = self.store.get_entry(entry_id)
+
+        if entry is None or not self.store.delete_entry(entry_id):
+            return False
+
+        self._reindex_site(entry.site)
+        return True
+
+    def _reindex_site(self, site: str) -> None:
+        """
+        Adds a site to the search index if any account is stored for it, or removes it otherwise.
+
+        :param site: The site whose accounts changed.
+        :return: None
+        """
+        with self._lock:
+            if self._index is None:
+                return None
+
+            if self.store.get(site) is not None:
+                self._index.add(site)
+            else:
+                self._index.remove(site)
+
+        return None
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """
+        Finds stored sites matching the query, ignoring case: prefix matches first, then ranked fuzzy matches.
+
+        :param query: The text to search for.
+        :param limit: Maximum number of results.
+        :return: Matching site names, best match first.
+        """
+        return self.index.search(query.strip(), limit)
+
+    # Bulk operations
+
+    def audit(self, progress: Callable[[int, int], None] | None = None) -> AuditResult:
+        """
+        Checks every stored password for reuse and weakness in one streaming pass, and against the breach index
+        if one has been imported.
+
+        :param progress: Optional callable receiving (entries audited, total entries) as the audit runs.
+        :return: The reused groups, weak passwords and breached passwords found.
+        """
+        result: AuditResult = audit_entries(self.iter_entries(AUDIT_BATCH), len(self.store), progress,
+                                            breaches=self.breach_index)
+
+        logging.info(f"Audited {result.checked} entries in {result.seconds:.2f}s: {result.reused_entries} reused,"
+                     f" {len(result.weak)} weak, {len(result.breached)} breached")
+        return result
+
+    def import_breaches(self, source: str, progress: Callable[[int, int], None] | None = None) -> int:
+        """
+        Builds the breach index from a downloaded breach list, replacing any previous index.
+
+        :param source: The breach list, one "<SHA-1 hex>:<count>" line per hash.
+        :param progress: Optional callable receiving (bytes read, total bytes) as the list is read.
+        :return: The number of distinct hashes indexed.
+        :raises BreachIndexError: If the list cannot be parsed.
+        """
+        os.makedirs(self.data_dir, exist_ok=True)
+        # ASSERT: A mapped file cannot be replaced on Windows, so the old index is unmapped first and remapped on
+        # the next lookup
+        self._close_breaches()
+        count: int = build_index(source, self.path(BREACH_INDEX_NAME), progress)
+        self._close_breaches()
+        return count
+
+    def breach_count(self, password: str) -> int | None:
+        """
+        Looks a password up in the breach index.
+
+        :param password: The plain-text password.
+        :return: How many times it appears in the breach corpus, or None if no index has been imported.
+        :raises BreachIndexError: If the index file is damaged.
+        """
+        breaches: BreachIndex | None = self.breach_index
+        return breaches.count(password) if breaches is not None else None
+
+    def backup(self, path: str) -> int:
+        """
+        Writes an encrypted, compressed backup of the whole vault to the given path.
+
+        :param path: Where to write the backup file.
+        :return: The number of entries backed up.
+        """
+        return write_backup(path, self.store, self.session)
+
+    def restore(self, path: str) -> int:
+        """
+        Restores the entries of a vault backup with their tags and notes, overwriting stored entries with the same
+        site and username. Nothing is written unless every chunk of the backup verifies.
+
+        :param path: The backup file to restore.
+        :return: The number of entries restored.
+        :raises BackupError: If the backup is damaged or was written with another key.
+        """
+        count: int = restore_backup(path, self.store, self.session)
+
+        with self._lock:
+            self._index = None
+
+        return count
+
+    def import_file(self, path: str, progress: Callable[[int, int], None] | None = None) -> ImportResult:
+        """
+        Imports credentials from a CSV, JSON Lines or JSON export. Accounts that are already stored are left
+        unchanged, and all new entries are committed in a single transaction.
+
+        :param path: The export file to import.
+        :param progress: Optional callable receiving (bytes read, file size) as the import runs.
+        :return: The number of entries imported and skipped.
+        """
+        result: ImportResult = import_credentials(path, self.store, self.session, progress)
+
+        with self._lock:
+            self._index = None
+
+        return result
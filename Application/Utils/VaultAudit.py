@@ -0,0 +1,147 @@
+import hmac
+import secrets
+import time
+from itertools import islice
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from Application.Utils.BreachIndex import BreachIndex
+from Application.Utils.PasswordStrength import StrengthAnalyzer, StrengthReport, default_analyzer
+
+AUDIT_BATCH = 500
+# Passwords scoring below this are reported as weak
+WEAK_SCORE = 2
+# Truncated HMAC-SHA256 digests; 128 bits keeps accidental collisions out of reach for any vault size
+DIGEST_BYTES = 16
+
+
+class WeakEntry(NamedTuple):
+    """
+    A stored password the audit found weak. Holds no part of the password.
+
+    :param site: The site the password belongs to.
+    :param username: The account on that site.
+    :param score: Strength score from 0 to 4.
+    :param entropy_bits: Estimated entropy of the password.
+    :param issues: What makes the password weak, e.g. ("too short", "common word").
+    """
+    site: str
+    username: str
+    score: int
+    entropy_bits: float
+    issues: tuple[str, ...]
+
+
+class BreachedEntry(NamedTuple):
+    """
+    A stored password that appears in the breach index.
+
+    :param site: The site the password belongs to.
+    :param username: The account on that site.
+    :param count: How many times the password appears in the breach corpus.
+    """
+    site: str
+    username: str
+    count: int
+
+
+class AuditResult(NamedTuple):
+    """
+    Outcome of auditing the vault for reused and weak passwords.
+
+    :param checked: Number of passwords audited.
+    :param reused: Groups of (site, username) accounts sharing one password, largest group first, accounts in
+                   order. Two accounts on the same site sharing a password are a group too.
+    :param weak: Weak passwords, weakest first.
+    :param breached: Passwords found in the breach index, most often breached first. Empty if there is no index.
+    :param seconds: Time spent auditing, in seconds.
+    """
+    checked: int
+    reused: list[list[tuple[str, str]]]
+    weak: list[WeakEntry]
+    breached: list[BreachedEntry]
+    seconds: float
+
+    @property
+    def reused_entries(self) -> int:
+        """
+        :return: Number of entries whose password is also used by another entry.
+        """
+        return sum(len(group) for group in self.reused)
+
+    @property
+    def entries_per_second(self) -> float:
+        """
+        :return: Audit throughput.
+        """
+        return self.checked / self.seconds if self.seconds > 0 else 0.0
+
+
+def describe_issues(report: StrengthReport) -> tuple[str, ...]:
+    """
+    Names what makes a password weak without quoting it.
+
+    :param report: The password's strength report.
+    :return: The kinds of weakness found.
+    """
+    issues: list[str] = ["too short"] if "length" in report.missing else []
+    issues += [issue for issue, found in (("common word", report.words), ("sequence", report.sequences),
+                                          ("repeated characters", report.repeats)) if found]
+    return tuple(issues) or ("few character types",)
+
+
+def audit_entries(entries: Iterable[tuple[str, dict[str, str]]], total: int = 0,
+                  progress: Callable[[int, int], None] | None = None, analyzer: StrengthAnalyzer | None = None,
+                  breaches: BreachIndex | None = None, batch_size: int = AUDIT_BATCH) -> AuditResult:
+    """
+    Finds reused, weak and breached passwords in one pass over decrypted entries.
+
+    Reuse is found by keying each password with HMAC-SHA256 under a random key that lives only for this call,
+    and grouping the accounts with equal digests. Only the digests, sites and usernames are kept, never a password,
+    so memory grows with the number of entries but not with what they hold. Each batch's plaintext is dropped once
+    it has been hashed and scored.
+
+    :param entries: (site, {"username": ..., "password": ...}) pairs, e.g. `Vault.iter_entries()`.
+    :param total: Number of entries expected, passed on to `progress`.
+    :param progress: Optional callable receiving (entries audited, total) after each batch.
+    :param analyzer: Scores the passwords. Defaults to the bundled common password list.
+    :param breaches: Optional breach index to look every password up in.
+    :param batch_size: Number of passwords scored together.
+    :return: The reused groups, weak passwords and breached passwords found.
+    """
+    started: float = time.perf_counter()
+    analyzer = analyzer or default_analyzer()
+    key: bytes = secrets.token_bytes(32)
+    first_accounts: dict[bytes, tuple[str, str]] = {}
+    reused: dict[bytes, list[tuple[str, str]]] = {}
+    weak: list[WeakEntry] = []
+    breached: list[BreachedEntry] = []
+    checked: int = 0
+    iterator: Iterator[tuple[str, dict[str, str]]] = iter(entries)
+
+    while batch := list(islice(iterator, batch_size)):
+        passwords: list[str] = [creds["password"] for _, creds in batch]
+
+        for (site, creds), password, report in zip(batch, passwords, analyzer.analyze_many(passwords)):
+            digest: bytes = hmac.digest(key, password.encode("utf-8"), "sha256")[:DIGEST_BYTES]
+            account: tuple[str, str] = (site, creds["username"])
+            first_account: tuple[str, str] = first_accounts.setdefault(digest, account)
+
+            if first_account != account:
+                reused.setdefault(digest, [first_account]).append(account)
+
+            if report.score < WEAK_SCORE:
+                weak.append(WeakEntry(*account, report.score, report.entropy_bits, describe_issues(report)))
+
+        if breaches is not None:
+            breached += [BreachedEntry(site, creds["username"], count)
+                         for (site, creds), count in zip(batch, breaches.count_many(passwords)) if count]
+
+        checked += len(batch)
+
+        if progress is not None:
+            progress(checked, total)
+
+    weak.sort(key=lambda entry: entry.entropy_bits)
+    breached.sort(key=lambda entry: entry.count, reverse=True)
+    return AuditResult(checked, sorted(reused.values(), key=len, reverse=True), weak, breached,
+                       time.perf_counter() - started)
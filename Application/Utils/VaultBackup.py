@@ -0,0 +1,228 @@
+import json
+import os
+import struct
+import zlib
+from itertools import islice
+from typing import BinaryIO, Iterator
+
+from Application.Utils.CredentialStore import Entry, EntryStore
+from Application.Utils.VaultSession import VaultSession
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"SPMBAK\x00\x00"
+FORMAT_VERSION = 2
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+CHUNK_ENTRIES = 1000
+MAX_CHUNK_BYTES = 64 * 1024 * 1024
+
+HEADER = struct.Struct(">8sBB")
+LENGTH = struct.Struct(">I")
+CHUNK_HEADER = struct.Struct(">IB")
+FLAG_FINAL = 1
+
+
+class BackupError(Exception):
+    """
+    Raised when a backup file is malformed, truncated, tampered with or encrypted under another key.
+    """
+
+
+def compress(codec: int, data: bytes) -> bytes:
+    """
+    Compresses a chunk payload with the given codec.
+
+    :param codec: CODEC_ZLIB or CODEC_ZSTD.
+    :param data: The payload to compress.
+    :return: The compressed payload.
+    """
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor().compress(data)
+
+    return zlib.compress(data, 6)
+
+
+def decompress(codec: int, data: bytes) -> bytes:
+    """
+    Decompresses a chunk payload with the given codec.
+
+    :param codec: CODEC_ZLIB or CODEC_ZSTD.
+    :param data: The compressed payload.
+    :return: The original payload.
+    :raises BackupError: If the codec is unknown or unavailable, or the payload is corrupt.
+    """
+    try:
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise BackupError("Backup is zstd-compressed but the zstandard package is not installed")
+            return zstandard.ZstdDecompressor().decompress(data)
+
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(data)
+
+    except zlib.error as error:
+        raise BackupError(f"Corrupt chunk payload: {error}") from error
+
+    raise BackupError(f"Unknown compression codec {codec}")
+
+
+def write_chunk(file: BinaryIO, session: VaultSession, codec: int, sequence: int, flags: int, payload: bytes) -> None:
+    """
+    Compresses, encrypts and appends one chunk to a backup file.
+
+    The sequence number and flags are encrypted together with the payload, so chunks cannot be reordered,
+    dropped or marked final without failing authentication on restore.
+
+    :param file: The backup file, opened for binary writing.
+    :param session: The unlocked vault session whose key encrypts the chunk.
+    :param codec: The compression codec recorded in the file header.
+    :param sequence: Position of the chunk in the file, starting at 0.
+    :param flags: FLAG_FINAL for the trailer chunk, 0 otherwise.
+    :param payload: The uncompressed chunk payload.
+    :return: None
+    """
+    token: bytes = session.encrypt_bytes(CHUNK_HEADER.pack(sequence, flags) + compress(codec, payload))
+    file.write(LENGTH.pack(len(token)))
+    file.write(token)
+
+
+def read_chunks(file: BinaryIO, session: VaultSession, codec: int) -> Iterator[tuple[int, bytes]]:
+    """
+    Reads, authenticates and decompresses the chunks of a backup file one at a time.
+
+    :param file: The backup file, positioned just after the header.
+    :param session: The unlocked vault session whose key decrypts the chunks.
+    :param codec: The compression codec recorded in the file header.
+    :return: An iterator of (flags, payload) pairs, in file order.
+    :raises BackupError: If a chunk is truncated, fails authentication or is out of sequence.
+    """
+    from cryptography.fernet import InvalidToken
+
+    sequence: int = 0
+
+    while length_bytes := file.read(LENGTH.size):
+        if len(length_bytes) < LENGTH.size:
+            raise BackupError("Backup is truncated")
+
+        length: int = LENGTH.unpack(length_bytes)[0]
+        if length > MAX_CHUNK_BYTES:
+            raise BackupError(f"Chunk {sequence} is larger than the format allows")
+
+        token: bytes = file.read(length)
+        if len(token) < length:
+            raise BackupError("Backup is truncated")
+
+        try:
+            plaintext: bytes = session.decrypt_bytes(token)
+        except InvalidToken as error:
+            raise BackupError(f"Chunk {sequence} failed authentication") from error
+
+        found_sequence, flags = CHUNK_HEADER.unpack_from(plaintext)
+        if found_sequence != sequence:
+            raise BackupError(f"Expected chunk {sequence} but found chunk {found_sequence}")
+
+        yield flags, decompress(codec, plaintext[CHUNK_HEADER.size:])
+        sequence += 1
+
+
+def write_backup(path: str, store: EntryStore, session: VaultSession) -> int:
+    """
+    Streams every entry of a credential store into an encrypted, compressed backup file.
+
+    The file starts with a header (magic, format version, codec) followed by length-prefixed Fernet tokens,
+    each holding `CHUNK_ENTRIES` entries as compressed JSON Lines. Each line holds the whole entry: site, username,
+    password, tags, notes and timestamps. A final trailer chunk records the entry count. Passwords stay encrypted
+    exactly as stored. Only one chunk is held in memory at a time, and the file is written under a temporary name
+    and renamed into place once complete.
+
+    :param path: Where to write the backup.
+    :param store: The credential store to back up.
+    :param session: The unlocked vault session whose key encrypts the backup.
+    :return: The number of entries written.
+    """
+    codec: int = CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+    temp_path: str = f"{path}.tmp"
+    entries: Iterator[Entry] = store.entries()
+    count: int = 0
+    sequence: int = 0
+
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, codec))
+
+            while batch := list(islice(entries, CHUNK_ENTRIES)):
+                # ASSERT: Entry IDs are local to a database, so they are not backed up
+                lines: list[str] = [json.dumps({field: value for field, value in entry._asdict().items()
+                                                if field != "entry_id"}) for entry in batch]
+                write_chunk(file, session, codec, sequence, 0, "\n".join(lines).encode())
+                count += len(batch)
+                sequence += 1
+
+            write_chunk(file, session, codec, sequence, FLAG_FINAL, json.dumps({"entries": count}).encode())
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, path)
+
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return count
+
+
+def restore_backup(path: str, store: EntryStore, session: VaultSession) -> int:
+    """
+    Streams the entries of a backup file into a credential store with their tags, notes and creation times,
+    overwriting stored entries with the same site and username. Backups written before tags and notes existed
+    hold only the site, username and password of each entry.
+
+    The whole restore runs in a single store transaction. Each chunk is authenticated and checked for its
+    position before its entries are written, and the entry count in the trailer must match, so a truncated,
+    reordered or tampered file rolls back without changing the store.
+
+    :param path: The backup file to restore.
+    :param store: The credential store to restore into.
+    :param session: The unlocked vault session whose key decrypts the backup.
+    :return: The number of entries restored.
+    :raises BackupError: If the file is not a valid backup for this vault.
+    """
+    with open(path, "rb") as file:
+        header: bytes = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise BackupError("File is not a vault backup")
+
+        magic, version, codec = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise BackupError("File is not a vault backup")
+        if not 1 <= version <= FORMAT_VERSION:
+            raise BackupError(f"Unsupported backup format version {version}")
+
+        count: int = 0
+        finished: bool = False
+
+        with store.transaction():
+            for flags, payload in read_chunks(file, session, codec):
+                if finished:
+                    raise BackupError("Data found after the final chunk")
+
+                if flags & FLAG_FINAL:
+                    if json.loads(payload)["entries"] != count:
+                        raise BackupError("Entry count does not match the backup trailer")
+                    finished = True
+                    continue
+
+                for line in payload.decode().split("\n"):
+                    entry: dict = json.loads(line)
+                    store.add_entry(entry["site"], entry["username"], entry["password"], entry.get("tags", ()),
+                                    entry.get("notes", ""), entry.get("created"))
+                    count += 1
+
+            if not finished:
+                raise BackupError("Backup is truncated")
+
+    return count
@@ -0,0 +1,408 @@
+import base64
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+from Application.Utils.SecretBuffer import SecretBuffer, fernet_decrypt_into
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet, MultiFernet
+
+PARALLEL_THRESHOLD = 1024
+CHUNK_SIZE = 512
+
+# cryptography and the process pool are imported on first use, so importing this module stays cheap
+# for the login screen.
+_worker_fernet: 'Fernet | MultiFernet | None' = None
+
+
+class VaultLockedError(RuntimeError):
+    """
+    Raised when a cryptographic operation is attempted on a session that has been locked.
+    """
+
+
+class DecryptBatch(NamedTuple):
+    """
+    Result of a bulk decryption.
+
+    :param passwords: The decrypted passwords in input order, with None wherever decryption failed.
+    :param failures: Maps the input index of every token that failed to decrypt to the error raised.
+    """
+    passwords: list[str | None]
+    failures: dict[int, Exception]
+
+
+def _build_cipher(keys: list[bytes]) -> 'Fernet | MultiFernet':
+    """
+    Builds the cipher for a list of keys. With more than one key, tokens are encrypted with the first key and
+    decrypted with whichever key matches.
+
+    :param keys: The current key, followed by any previous keys still being rotated out.
+    :return: A Fernet cipher, or a MultiFernet cipher if there are previous keys.
+    """
+    from cryptography.fernet import Fernet, MultiFernet
+
+    if len(keys) == 1:
+        return Fernet(keys[0])
+
+    return MultiFernet([Fernet(key) for key in keys])
+
+
+def _init_worker(keys: list[bytes]) -> None:
+    """
+    Builds the cipher used by a decryption worker process.
+
+    :param keys: The vault key, followed by any previous keys.
+    :return: None
+    """
+    global _worker_fernet
+    _worker_fernet = _build_cipher(keys)
+
+
+def _decrypt_chunk(fernet: 'Fernet | MultiFernet | None', start: int, tokens: list[str]) -> DecryptBatch:
+    """
+    Decrypts one chunk of tokens, collecting failures instead of raising.
+
+    :param fernet: The cipher to use, or None to use the cipher of the current worker process.
+    :param start: Index of the first token of the chunk within the whole batch.
+    :param tokens: The encrypted passwords to decrypt.
+    :return: The decrypted chunk, with failure indexes relative to the whole batch.
+    """
+    from cryptography.fernet import InvalidToken
+
+    fernet = fernet or _worker_fernet
+    passwords: list[str | None] = []
+    failures: dict[int, Exception] = {}
+
+    for offset, token in enumerate(tokens):
+        try:
+            passwords.append(fernet.decrypt(token.encode()).decode())
+        except (InvalidToken, UnicodeError, AttributeError) as error:
+            passwords.append(None)
+            failures[start + offset] = error
+
+    return DecryptBatch(passwords, failures)
+
+
+def _encrypt_chunk(fernet: 'Fernet | MultiFernet | None', pwds: list[str]) -> list[str]:
+    """
+    Encrypts one chunk of passwords.
+
+    :param fernet: The cipher to use, or None to use the cipher of the current worker process.
+    :param pwds: The plain-text passwords to encrypt.
+    :return: The encrypted passwords, in input order.
+    """
+    fernet = fernet or _worker_fernet
+    return [fernet.encrypt(pwd.encode()).decode() for pwd in pwds]
+
+
+def _rotate_chunk(fernet: 'Fernet | MultiFernet | None', tokens: list[str]) -> list[str | None]:
+    """
+    Re-encrypts one chunk of tokens with the current key, collecting failures instead of raising.
+
+    :param fernet: The cipher to use, or None to use the cipher of the current worker process.
+    :param tokens: The encrypted passwords to re-encrypt.
+    :return: The re-encrypted passwords in input order, with None wherever a token could not be decrypted.
+    """
+    from cryptography.fernet import InvalidToken, MultiFernet
+
+    fernet = fernet or _worker_fernet
+    # ASSERT: Only MultiFernet can rotate, a single-key cipher is wrapped so re-encrypting still works
+    rotator: MultiFernet = fernet if isinstance(fernet, MultiFernet) else MultiFernet([fernet])
+    rotated: list[str | None] = []
+
+    for token in tokens:
+        try:
+            rotated.append(rotator.rotate(token.encode()).decode())
+        except InvalidToken:
+            rotated.append(None)
+
+    return rotated
+
+
+class VaultSession:
+    """
+    Holds the vault's encryption key and a single Fernet cipher for the lifetime of a login session.
+
+    The key is loaded once when the session is unlocked, so encrypting or decrypting credentials never
+    touches the key file again. Locking the session overwrites the key buffer and drops the cipher.
+
+    During a key rotation the session also holds the previous keys: new tokens are always encrypted with the
+    current key, and tokens are decrypted with whichever key they were written under.
+
+    Bulk decryption is spread over a pool of worker threads once a batch is large enough, or over a pool of
+    worker processes for batches at or above `process_threshold`.
+
+    :param key: Optional Fernet-compatible key. If provided, the session is unlocked immediately.
+    :param workers: Number of decryption workers. Defaults to the number of CPU cores.
+    :param process_threshold: Batch size from which worker processes are used instead of threads.
+                              None keeps bulk decryption on threads.
+    """
+
+    def __init__(self, key: bytes | None = None, workers: int | None = None, process_threshold: int | None = None):
+        self._key: bytearray | None = None
+        self._raw_key: bytearray | None = None
+        self._previous_keys: list[bytearray] = []
+        self._previous_raw_keys: list[bytearray] = []
+        self._fernet: 'Fernet | MultiFernet | None' = None
+        self.workers: int = workers or os.cpu_count() or 1
+        self.process_threshold: int | None = process_threshold
+
+        if key is not None:
+            self.unlock(key)
+
+    @property
+    def is_unlocked(self) -> bool:
+        """
+        :return: True if the session currently holds a usable cipher.
+        """
+        return self._fernet is not None
+
+    @property
+    def is_rotating(self) -> bool:
+        """
+        :return: True if the session still accepts tokens written under a previous key.
+        """
+        return bool(self._previous_keys)
+
+    def unlock(self, key: bytes, previous_keys: Iterable[bytes] = ()) -> None:
+        """
+        Loads the key into the session and builds the cipher used for all later operations.
+
+        :param key: A Fernet-compatible encryption key.
+        :param previous_keys: Keys of a rotation in progress, newest first. Tokens written under them can still
+                              be decrypted, but nothing new is encrypted with them.
+        :return: None
+        """
+        self.lock()
+        self._key = bytearray(key)
+        self._raw_key = bytearray(base64.urlsafe_b64decode(key))
+        self._previous_keys = [bytearray(previous_key) for previous_key in previous_keys]
+        self._previous_raw_keys = [bytearray(base64.urlsafe_b64decode(previous_key))
+                                   for previous_key in self._previous_keys]
+        self._fernet = _build_cipher(self._keys())
+
+    def retire_previous_keys(self) -> None:
+        """
+        Wipes the previous keys once a rotation has finished, leaving only the current key.
+
+        :return: None
+        """
+        self._cipher()
+        self._wipe(self._previous_keys + self._previous_raw_keys)
+        self._previous_keys = []
+        self._previous_raw_keys = []
+        self._fernet = _build_cipher(self._keys())
+
+    def lock(self) -> None:
+        """
+        Wipes the keys held by the session and drops the cipher.
+
+        :return: None
+        """
+        self._wipe([self._key, self._raw_key, *self._previous_keys, *self._previous_raw_keys])
+        self._key = None
+        self._raw_key = None
+        self._previous_keys = []
+        self._previous_raw_keys = []
+        self._fernet = None
+
+    @staticmethod
+    def _wipe(buffers: list[bytearray | None]) -> None:
+        """
+        Overwrites key buffers with zeros.
+
+        :param buffers: The buffers to wipe. None entries are ignored.
+        :return: None
+        """
+        for buffer in buffers:
+            if buffer is not None:
+                buffer[:] = bytes(len(buffer))
+
+    def _keys(self) -> list[bytes]:
+        """
+        :return: Copies of the current key followed by the previous keys, for building ciphers.
+        """
+        return [bytes(key) for key in (self._key, *self._previous_keys)]
+
+    def _cipher(self) -> 'Fernet | MultiFernet':
+        """
+        :return: The session cipher.
+        :raises VaultLockedError: If the session is locked.
+        """
+        if self._fernet is None:
+            raise VaultLockedError("The vault session is locked")
+
+        return self._fernet
+
+    def encrypt(self, pwd: str) -> str:
+        """
+        Encrypts a plain-text password with the session cipher.
+
+        :param pwd: The plain-text password to encrypt.
+        :return: The encrypted password as a URL-safe base64-encoded string.
+        """
+        return self._cipher().encrypt(pwd.encode()).decode()
+
+    def decrypt(self, encrypted_pwd: str) -> str:
+        """
+        Decrypts an encrypted password with the session cipher.
+
+        :param encrypted_pwd: The encrypted password string to decrypt.
+        :return: The original decrypted plain-text password.
+        """
+        return self._cipher().decrypt(encrypted_pwd.encode()).decode()
+
+    def decrypt_into(self, encrypted_pwd: str, secret: SecretBuffer | None = None) -> SecretBuffer:
+        """
+        Decrypts an encrypted password into a wipeable buffer instead of an immutable string.
+
+        :param encrypted_pwd: The encrypted password string to decrypt.
+        :param secret: A buffer to reuse, or None to allocate a new one.
+        :return: The buffer holding the plain-text password as UTF-8.
+        :raises InvalidToken: If the password cannot be decrypted.
+        """
+        from cryptography.fernet import InvalidToken
+
+        self._cipher()
+        raw_keys: list[bytearray] = [self._raw_key, *self._previous_raw_keys]
+
+        for raw_key in raw_keys[:-1]:
+            try:
+                return fernet_decrypt_into(raw_key, encrypted_pwd, secret)
+            except InvalidToken:
+                # ASSERT: Token may have been written under a previous key
+                continue
+
+        return fernet_decrypt_into(raw_keys[-1], encrypted_pwd, secret)
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypts raw bytes with the session cipher.
+
+        :param data: The bytes to encrypt.
+        :return: The Fernet token as bytes.
+        """
+        return self._cipher().encrypt(data)
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """
+        Decrypts and authenticates a Fernet token with the session cipher.
+
+        :param token: The Fernet token as bytes.
+        :return: The decrypted bytes.
+        """
+        return self._cipher().decrypt(token)
+
+    def decrypt_many(self, encrypted_pwds: Iterable[str]) -> list[str]:
+        """
+        Decrypts a batch of encrypted passwords with the session cipher.
+
+        :param encrypted_pwds: The encrypted password strings to decrypt.
+        :return: The decrypted passwords, in the same order as the input.
+        :raises InvalidToken: If any of the passwords cannot be decrypted.
+        """
+        batch: DecryptBatch = self.decrypt_batch(encrypted_pwds)
+
+        if batch.failures:
+            raise batch.failures[min(batch.failures)]
+
+        return batch.passwords
+
+    def decrypt_batch(self, encrypted_pwds: Iterable[str]) -> DecryptBatch:
+        """
+        Decrypts a batch of encrypted passwords, reporting failures per entry instead of aborting.
+
+        Small batches are decrypted inline. Larger batches are split into chunks that are decrypted
+        concurrently, and the results are reassembled in input order.
+
+        :param encrypted_pwds: The encrypted password strings to decrypt.
+        :return: The decrypted passwords and the errors for any entries that could not be decrypted.
+        """
+        fernet: 'Fernet | MultiFernet' = self._cipher()
+        tokens: list[str] = list(encrypted_pwds)
+
+        if self.workers <= 1 or len(tokens) < PARALLEL_THRESHOLD:
+            return _decrypt_chunk(fernet, 0, tokens)
+
+        starts: range = range(0, len(tokens), CHUNK_SIZE)
+        chunks: list[list[str]] = [tokens[start:start + CHUNK_SIZE] for start in starts]
+
+        with self._executor(len(tokens)) as executor:
+            use_processes: bool = self._uses_processes(len(tokens))
+            results = executor.map(_decrypt_chunk, [None if use_processes else fernet] * len(chunks), starts, chunks)
+
+            passwords: list[str | None] = []
+            failures: dict[int, Exception] = {}
+
+            for result in results:
+                passwords.extend(result.passwords)
+                failures.update(result.failures)
+
+        return DecryptBatch(passwords, failures)
+
+    def encrypt_many(self, pwds: Iterable[str]) -> list[str]:
+        """
+        Encrypts a batch of plain-text passwords, splitting large batches into chunks encrypted concurrently.
+
+        :param pwds: The plain-text passwords to encrypt.
+        :return: The encrypted passwords, in the same order as the input.
+        """
+        fernet: 'Fernet | MultiFernet' = self._cipher()
+        pwds = list(pwds)
+
+        if self.workers <= 1 or len(pwds) < PARALLEL_THRESHOLD:
+            return _encrypt_chunk(fernet, pwds)
+
+        chunks: list[list[str]] = [pwds[start:start + CHUNK_SIZE] for start in range(0, len(pwds), CHUNK_SIZE)]
+
+        with self._executor(len(pwds)) as executor:
+            use_processes: bool = self._uses_processes(len(pwds))
+            results = executor.map(_encrypt_chunk, [None if use_processes else fernet] * len(chunks), chunks)
+            return [token for result in results for token in result]
+
+    def rotate_many(self, encrypted_pwds: Iterable[str]) -> list[str | None]:
+        """
+        Re-encrypts a batch of tokens with the current key, whichever key they were written under.
+
+        Large batches are split into chunks re-encrypted concurrently, as in `encrypt_many`.
+
+        :param encrypted_pwds: The encrypted password strings to re-encrypt.
+        :return: The re-encrypted passwords in input order, with None wherever a token could not be decrypted
+                 with any of the session keys.
+        """
+        fernet: 'Fernet | MultiFernet' = self._cipher()
+        tokens: list[str] = list(encrypted_pwds)
+
+        if self.workers <= 1 or len(tokens) < PARALLEL_THRESHOLD:
+            return _rotate_chunk(fernet, tokens)
+
+        chunks: list[list[str]] = [tokens[start:start + CHUNK_SIZE] for start in range(0, len(tokens), CHUNK_SIZE)]
+
+        with self._executor(len(tokens)) as executor:
+            use_processes: bool = self._uses_processes(len(tokens))
+            results = executor.map(_rotate_chunk, [None if use_processes else fernet] * len(chunks), chunks)
+            return [token for result in results for token in result]
+
+    def _uses_processes(self, batch_size: int) -> bool:
+        """
+        :param batch_size: Number of tokens in the batch.
+        :return: True if a batch of this size is handled by worker processes rather than threads.
+        """
+        return self.process_threshold is not None and batch_size >= self.process_threshold
+
+    def _executor(self, batch_size: int) -> Executor:
+        """
+        Creates the pool used to encrypt or decrypt a batch of the given size.
+
+        :param batch_size: Number of tokens in the batch.
+        :return: A process pool for batches at or above the process threshold, otherwise a thread pool.
+        """
+        if self._uses_processes(batch_size):
+            from concurrent.futures import ProcessPoolExecutor
+
+            return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       initargs=(self._keys(),))
+
+        return ThreadPoolExecutor(max_workers=self.workers)
@@ -0,0 +1,232 @@
+import tkinter
+from abc import ABC, abstractmethod
+from tkinter import ttk
+
+from Application.Utils.CredentialStore import CredentialStore
+
+
+class RowSource(ABC):
+    """
+    Supplies the rows shown by a VirtualTreeview, fetched a page at a time.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        :return: The total number of rows.
+        """
+
+    @abstractmethod
+    def rows(self, start: int, stop: int) -> list[tuple]:
+        """
+        Returns the Treeview values for a range of rows.
+
+        :param start: Index of the first row to return.
+        :param stop: Index one past the last row to return.
+        :return: One tuple of column values per row.
+        """
+
+
+class StoreRowSource(RowSource):
+    """
+    Row source that pages (site, username, password) rows out of a credential store without decrypting them.
+
+    :param store: The credential store to read from.
+    :param password_text: Text shown in the password column in place of the encrypted password.
+    """
+
+    def __init__(self, store: CredentialStore, password_text: str):
+        self.store: CredentialStore = store
+        self.password_text: str = password_text
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def rows(self, start: int, stop: int) -> list[tuple]:
+        return [(site, creds["username"], self.password_text) for site, creds in self.store.page(start, stop - start)]
+
+
+class ListRowSource(RowSource):
+    """
+    Row source over rows already held in memory, e.g. a computed report.
+
+    :param rows: The rows to show, one tuple of column values each.
+    """
+
+    def __init__(self, rows: list[tuple] | None = None):
+        self.row_list: list[tuple] = rows or []
+
+    def __len__(self) -> int:
+        return len(self.row_list)
+
+    def rows(self, start: int, stop: int) -> list[tuple]:
+        return self.row_list[start:stop]
+
+
+class VirtualTreeview(ttk.Frame):
+    """
+    A Treeview with a vertical scrollbar that only materializes the rows currently on screen.
+
+    Small sources are inserted in full and scroll natively. Once a source holds more than `materialize_limit`
+    rows, the Treeview keeps exactly `height` items whose values are swapped as the scrollbar, mouse wheel or
+    arrow keys move, and rows are paged in from the source with `buffer` extra rows either side.
+
+    :param master: The parent widget.
+    :param source: Supplies the rows to display.
+    :param columns: The Treeview column identifiers.
+    :param height: Number of rows visible at once.
+    :param buffer: Number of rows fetched beyond each edge of the visible window.
+    :param materialize_limit: Largest source that is inserted in full instead of virtualized.
+    """
+
+    def __init__(self, master, source: RowSource, columns: list[str], height: int = 20, buffer: int = 100,
+                 materialize_limit: int = 1000):
+        super().__init__(master)
+        self.source: RowSource = source
+        self.height: int = height
+        self.buffer: int = buffer
+        self.materialize_limit: int = materialize_limit
+
+        self.tree: ttk.Treeview = ttk.Treeview(self, columns=columns, show="headings", height=height)
+        self.scrollbar: ttk.Scrollbar = ttk.Scrollbar(self, orient="vertical")
+
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.total: int = 0
+        self.offset: int = 0
+        self.virtual: bool = False
+        self._page_start: int = 0
+        self._page: list[tuple] = []
+
+        self.tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda event: self.on_scroll_keys(-3))
+        self.tree.bind("<Button-5>", lambda event: self.on_scroll_keys(3))
+        self.tree.bind("<Up>", lambda event: self.on_edge_key(-1))
+        self.tree.bind("<Down>", lambda event: self.on_edge_key(1))
+        self.tree.bind("<Prior>", lambda event: self.on_scroll_keys(-self.height))
+        self.tree.bind("<Next>", lambda event: self.on_scroll_keys(self.height))
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Reloads the row count from the source and redraws the Treeview from the top.
+
+        :return: None
+        """
+        self.tree.delete(*self.tree.get_children())
+        self.total = len(self.source)
+        self.offset = 0
+        self._page_start = 0
+        self._page = []
+        self.virtual = self.total > self.materialize_limit
+
+        if not self.virtual:
+            for row in self.source.rows(0, self.total):
+                self.tree.insert("", "end", values=row)
+
+            self.tree.configure(yscrollcommand=self.scrollbar.set)
+            self.scrollbar.configure(command=self.tree.yview)
+            return None
+
+        for _ in range(self.height):
+            self.tree.insert("", "end", values=())
+
+        self.tree.configure(yscrollcommand="")
+        self.scrollbar.configure(command=self.yview)
+        self.render()
+        return None
+
+    def rows(self, start: int, stop: int) -> list[tuple]:
+        """
+        Returns a range of rows, fetching a new page from the source only when the range is not cached.
+
+        :param start: Index of the first row to return.
+        :param stop: Index one past the last row to return.
+        :return: The requested rows.
+        """
+        page_stop: int = self._page_start + len(self._page)
+
+        if start < self._page_start or min(stop, self.total) > page_stop:
+            self._page_start = max(0, start - self.buffer)
+            self._page = self.source.rows(self._page_start, min(self.total, stop + self.buffer))
+
+        return self._page[start - self._page_start:stop - self._page_start]
+
+    def render(self) -> None:
+        """
+        Writes the rows of the visible window into the Treeview items and updates the scrollbar.
+
+        :return: None
+        """
+        rows: list[tuple] = self.rows(self.offset, self.offset + self.height)
+
+        for index, item in enumerate(self.tree.get_children()):
+            self.tree.item(item, values=rows[index] if index < len(rows) else ())
+
+        self.scrollbar.set(self.offset / self.total, (self.offset + self.height) / self.total)
+
+    def scroll_to(self, offset: int) -> None:
+        """
+        Moves the visible window so that it starts at the given row.
+
+        :param offset: Index of the first visible row. Clamped to the valid range.
+        :return: None
+        """
+        offset = max(0, min(offset, self.total - self.height))
+
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def yview(self, *args) -> None:
+        """
+        Scrollbar command for virtual mode, accepting the same arguments as `Treeview.yview`.
+
+        :param args: ("moveto", fraction) or ("scroll", count, "units" | "pages").
+        :return: None
+        """
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * self.total))
+
+        elif args[0] == "scroll":
+            step: int = self.height if args[2] == "pages" else 1
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def on_mouse_wheel(self, event: tkinter.Event) -> str | None:
+        """
+        Scrolls the visible window in response to the mouse wheel in virtual mode.
+        """
+        if not self.virtual:
+            return None
+
+        self.scroll_to(self.offset - (3 if event.delta > 0 else -3))
+        return "break"
+
+    def on_scroll_keys(self, rows: int) -> str | None:
+        """
+        Scrolls the visible window by a number of rows in virtual mode.
+        """
+        if not self.virtual:
+            return None
+
+        self.scroll_to(self.offset + rows)
+        return "break"
+
+    def on_edge_key(self, direction: int) -> str | None:
+        """
+        Scrolls the visible window when the arrow keys move the focus past its first or last row.
+        """
+        if not self.virtual:
+            return None
+
+        items: tuple[str, ...] = self.tree.get_children()
+        edge: str = items[0] if direction < 0 else items[-1]
+
+        if self.tree.focus() != edge:
+            return None
+
+        self.scroll_to(self.offset + direction)
+        self.tree.selection_set(edge)
+        return "break"
@@ -0,0 +1,105 @@
+from tkinter import ttk
+from typing import TYPE_CHECKING
+
+from Application.Utils.HelperFunctions import audit_vault
+from Application.Utils.VaultAudit import AuditResult
+from Application.Utils.VirtualTreeview import ListRowSource, VirtualTreeview
+
+if TYPE_CHECKING:
+    from Application.Views.ParentWindow import ParentWindow
+
+# Other accounts named in a reused row before the rest are summarised as "+N more"
+SHARED_ACCOUNTS_SHOWN = 3
+
+
+class AuditFrame(ttk.Frame):
+    """
+    Reports stored passwords that are breached, reused across accounts or weak.
+
+    The vault is audited on a worker thread each time the frame is shown. Rows name the problem only; no
+    password or part of one is displayed.
+    """
+
+    def __init__(self, parent: ttk.Frame, controller: 'ParentWindow'):
+        super().__init__(parent)
+        self.controller = controller
+        self.source: ListRowSource = ListRowSource()
+
+        self.summary_label: ttk.Label = ttk.Label(self, text="", anchor="w")
+        self.table: VirtualTreeview = VirtualTreeview(self, self.source,
+                                                      columns=["site", "username", "issue", "details"])
+        self.tree: ttk.Treeview = self.table.tree
+        style = ttk.Style()
+        style.configure("Treeview", background="light blue", fieldbackground="light blue", foreground="black")
+
+        self.tree.heading("site", text="Site")
+        self.tree.heading("username", text="Username")
+        self.tree.heading("issue", text="Issue")
+        self.tree.heading("details", text="Details")
+
+        self.tree.column("site", width=150, anchor="w")
+        self.tree.column("username", width=150, anchor="w")
+        self.tree.column("issue", width=100, anchor="w")
+        self.tree.column("details", width=300, anchor="w")
+
+        self.summary_label.pack(fill="x", padx=5, pady=5)
+        self.table.pack(fill="both", expand=True)
+
+    def on_show(self) -> None:
+        """
+        Called by the controller each time the frame is shown. Starts a fresh audit, since credentials may
+        have changed while the frame was hidden.
+        """
+        self.summary_label.config(text="Auditing passwords...")
+
+        if not self.controller.run_task(audit_vault, self.controller.tasks.report_progress,
+                                        on_done=self.show_report, on_error=lambda error: self.show_report(None)):
+            self.summary_label.config(text="Another task is running. Open the audit again once it finishes.")
+
+    def on_hide(self) -> None:
+        """
+        Called by the controller before the frame is hidden. Clears the report.
+        """
+        self.source.row_list = []
+        self.table.refresh()
+
+    def show_report(self, result: AuditResult | None) -> None:
+        """
+        Fills the table with the audit's findings: breached passwords first, then reused ones, then weak ones,
+        weakest first.
+
+        :param result: The audit result, or None if the audit failed.
+        """
+        if result is None:
+            self.summary_label.config(text="The audit failed. See the application log for details.")
+            return None
+
+        rows: list[tuple] = [(entry.site, entry.username, "Breached",
+                              f"Seen {entry.count:,} times in known data breaches") for entry in result.breached]
+
+        for group in result.reused:
+            # Only the first few accounts are ever named, so their labels are built once per group and each member
+            # skips its own label, instead of listing the rest of the group for every member.
+            leading: list[str] = [f"{username} on {site}" for site, username in group[:SHARED_ACCOUNTS_SHOWN + 1]]
+            hidden: int = len(group) - 1 - SHARED_ACCOUNTS_SHOWN
+            more: str = f" +{hidden} more" if hidden > 0 else ""
+            rest_details: str = f"Same password as {', '.join(leading[:SHARED_ACCOUNTS_SHOWN])}{more}"
+
+            for index, (site, username) in enumerate(group):
+                if index >= len(leading):
+                    rows.append((site, username, "Reused", rest_details))
+                    continue
+
+                shown: str = ", ".join((leading[:index] + leading[index + 1:])[:SHARED_ACCOUNTS_SHOWN])
+                rows.append((site, username, "Reused", f"Same password as {shown}{more}"))
+
+        for entry in result.weak:
+            rows.append((entry.site, entry.username, f"Weak ({entry.score}/4)",
+                         f"{entry.entropy_bits:.0f} bits: {', '.join(entry.issues)}"))
+
+        self.source.row_list = rows
+        self.table.refresh()
+        self.summary_label.config(text=f"Checked {result.checked} passwords: {len(result.breached)} breached, "
+                                       f"{result.reused_entries} reused in {len(result.reused)} groups, "
+                                       f"{len(result.weak)} weak.")
+        return None
@@ -1,10 +1,10 @@
-import json
 import logging
-import os
-from tkinter import ttk, PhotoImage, Canvas
+from tkinter import ttk, PhotoImage, Canvas, messagebox
 from typing import TYPE_CHECKING
 
-from Application.Utils.HelperFunctions import is_password_valid, hash_password, verify_password
+from Application.Utils.AssetCache import get_image
+from Application.Utils.HelperFunctions import is_password_valid, create_vault, open_vault, get_settings, analyze
+from Application.Utils.LoggingController import log_error_and_method
 from Application.Utils.PlaceholderEntry import PlaceholderEntry
 
 if TYPE_CHECKING:
@@ -30,7 +30,7 @@ class EntryFrame(ttk.Frame):
 
         self.controller = controller
 
-        self.canvas_image: PhotoImage = PhotoImage(file=HOME_LOGO)
+        self.canvas_image: PhotoImage = get_image(HOME_LOGO)
         self.canvas: Canvas = Canvas(self, bg='light blue', highlightthickness=0, width=720, height=480)
         self.canvas.create_image(360, 240, image=self.canvas_image)
 
@@ -52,7 +52,7 @@ class EntryFrame(ttk.Frame):
        """
         self.canvas.place(relx=0.5, rely=0.5, anchor="center", width=720, height=480)
 
-        if os.path.exists("../.Data/Settings.json"):
+        if get_settings().exists:
             self.password_entry.place(relx=0.5, rely=0.65, anchor="center")
             self.login_button.place(relx=0.9, rely=0.65, anchor="center")
 
@@ -61,43 +61,102 @@ class EntryFrame(ttk.Frame):
             self.confirm_password_entry.place(relx=0.5, rely=0.8, anchor="center")
             self.create_account_button.place(relx=0.9, rely=0.8, anchor="center")
 
+    def on_show(self) -> None:
+        """
+        Called by the controller each time the frame is shown. Focuses the password entry.
+        """
+        self.password_entry.focus()
+
+    def on_hide(self) -> None:
+        """
+        Called by the controller before the frame is hidden. Clears the typed passwords and any error.
+        """
+        # ASSERT: A disabled entry ignores edits, so the form is re-enabled before its fields are cleared
+        self.set_form_enabled(True)
+        self.password_entry.clear_field()
+        self.confirm_password_entry.clear_field()
+        self.error_label.place_forget()
+
+    def set_form_enabled(self, enabled: bool) -> None:
+        """
+        Enables or disables the password fields and buttons, so the form cannot be submitted again while a
+        login or account creation is running.
+
+        :param enabled: True to accept input, False while a task is running.
+        :return: None
+        """
+        for entry in (self.password_entry, self.confirm_password_entry):
+            entry.config(state="normal" if enabled else "disabled")
+
+        for button in (self.login_button, self.create_account_button):
+            button.state(["!disabled"] if enabled else ["disabled"])
+
+    def on_task_error(self, error: Exception, action: str) -> None:
+        """
+        Reports a login or account creation that raised, and re-enables the form so the user can try again.
+
+        :param error: The exception raised on the worker thread.
+        :param action: What failed, used in the dialog.
+        :return: None
+        """
+        log_error_and_method(error)
+        messagebox.showerror(f"{action} Failed", f"{action} failed: {error}")
+        self.set_form_enabled(True)
+
     def create_account(self) -> None:
         """
         Handles the logic for creating a new account.
-        Validates password fields, saves hashed password, and redirects to the HomeFrame.
+        Validates password fields, then hashes the password and sets up the vault key on a worker thread.
         Displays error if validation fails.
         """
-        from HomeFrame import HomeFrame
         password: str = self.password_entry.get_real_value()
         conf_password: str = self.confirm_password_entry.get_real_value()
         is_valid: bool = self.validate_passwords(password, conf_password)
 
         if is_valid:
-            self.create_settings(password)
-            logging.info("Transitioning to HomeFrame")
-            self.controller.render_frame(HomeFrame)
+            self.error_label.place_forget()
+            if self.controller.run_task(self.create_settings, password, on_done=lambda _: self.on_account_created(),
+                                        on_error=lambda error: self.on_task_error(error, "Account Creation")):
+                self.set_form_enabled(False)
             return None
 
-        self.error_label.config(text="Password is not valid")
+        self.error_label.config(text=self.describe_invalid(password, conf_password))
         self.error_label.place(relx=0.4, rely=0.9)
         return None
 
+    def on_account_created(self) -> None:
+        """
+        Redirects to the HomeFrame once the settings file has been written and the vault unlocked.
+        """
+        logging.info("Transitioning to HomeFrame")
+        self.controller.render_frame("HomeFrame")
+
     def is_password_correct(self) -> None:
         """
-        Verifies the entered password against the stored hash.
-        If verified, redirects to the HomeFrame.
+        Verifies the entered password and unlocks the vault with it on a worker thread.
+        The result is handled by `on_password_checked`.
         """
-        from HomeFrame import HomeFrame
         pwd: str = self.password_entry.get_real_value()
 
-        with open(file="../.Data/Settings.json", mode="r") as file:
-            data: dict = json.load(file)
-            hashed_pwd: str = data["app_password"]["password"]
-            if verify_password(password=pwd, hashed=hashed_pwd):
-                logging.info("Password verified. Transitioning to HomeFrame")
-                self.controller.render_frame(HomeFrame)
-                return None
+        if self.controller.run_task(open_vault, pwd, on_done=self.on_password_checked,
+                                    on_error=lambda error: self.on_task_error(error, "Login")):
+            self.set_form_enabled(False)
+        return None
+
+    def on_password_checked(self, is_correct: bool) -> None:
+        """
+        If the password was verified and the vault unlocked, redirects to the HomeFrame and resumes any
+        interrupted key rotation. Otherwise, displays an error.
+
+        :param is_correct: Result of the password verification.
+        """
+        if is_correct:
+            logging.info("Password verified. Transitioning to HomeFrame")
+            self.controller.render_frame("HomeFrame")
+            self.controller.resume_key_rotation()
+            return None
 
+        self.set_form_enabled(True)
         self.error_label.config(text="Password is incorrect")
         self.error_label.place(relx=0.4, rely=0.9)
         return None
@@ -120,19 +179,27 @@ class EntryFrame(ttk.Frame):
         return True
 
     @staticmethod
-    def create_settings(password: str) -> None:
+    def describe_invalid(password: str, conf_password: str) -> str:
         """
-        Hashes the provided password and stores it in a local settings JSON file.
+        Explains why `validate_passwords` rejected the passwords.
 
-        :param password: The password to store securely.
+        :param password: The main password entered by the user.
+        :param conf_password: The confirmation password entered by the user.
+        :return: The first two problems found, most important first.
         """
-        os.makedirs("../.Data", exist_ok=True)
+        if password != conf_password:
+            return "Passwords do not match"
 
-        with open(file="../.Data/Settings.json", mode="w") as file:
-            hashed_pass: str = hash_password(password)
+        return " ".join(analyze(password).problems[:2]) or "Password is not valid"
+
+    @staticmethod
+    def create_settings(password: str) -> None:
+        """
+        Hashes the provided password, wraps the vault key with it and saves both to the settings file
+        straight away. Leaves the vault unlocked.
 
-            data: dict = {'app_password': {"password": hashed_pass, }}
-            json_str: str = json.dumps(data, indent=4)
-            file.write(json_str)
+        :param password: The password to store securely.
+        """
+        create_vault(password)
 
         logging.info("Settings file created")
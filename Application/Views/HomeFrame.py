@@ -1,8 +1,8 @@
-import secrets
-import string
-from tkinter import ttk, Canvas, PhotoImage, simpledialog
+import tkinter
+from tkinter import ttk, Canvas, messagebox, simpledialog
 from typing import TYPE_CHECKING
 
+from Application.Utils.AssetCache import get_image
 from Application.Utils.HelperFunctions import *
 from Application.Utils.PlaceholderEntry import PlaceholderEntry
 
@@ -13,6 +13,8 @@ MAIN_LOGO = '../Assets/logo.png'
 WIN_WIDTH = 720
 WIN_HEIGHT = 480
 FONT = ("aerial", 8, "bold")
+SUGGESTION_LIMIT = 6
+ACCOUNT_LIST_HEIGHT = 5
 
 
 class HomeFrame(ttk.Frame):
@@ -36,7 +38,7 @@ class HomeFrame(ttk.Frame):
             self.controller.create_menu()
 
         # Canvas
-        self.canvas_image = PhotoImage(file=MAIN_LOGO)
+        self.canvas_image = get_image(MAIN_LOGO)
         self.canvas = Canvas(self, width=WIN_WIDTH / 2, height=WIN_HEIGHT / 2, bg='light blue', highlightthickness=0)
         self.canvas.create_image(180, 120, image=self.canvas_image)
 
@@ -53,6 +55,9 @@ class HomeFrame(ttk.Frame):
         self.username_entry = PlaceholderEntry(self, placeholder="Enter username", width=50, bg="light green", font=FONT)
         self.password_entry = PlaceholderEntry(self, placeholder="Enter Password", width=50, bg="light green", font=FONT)
         self.site_entry.focus()
+        self.suggestion_list = tkinter.Listbox(self, width=50, height=SUGGESTION_LIMIT, bg="light green", font=FONT)
+        self.account_list = tkinter.Listbox(self, width=24, height=ACCOUNT_LIST_HEIGHT, bg="light green", font=FONT)
+        self.account_site: str = ""
 
         # Buttons
         self.search_button = ttk.Button(self, text="Search", width=15, command=self.search_for_site)
@@ -60,6 +65,14 @@ class HomeFrame(ttk.Frame):
         self.gen_button = ttk.Button(self, text="Generate", width=15, command=self.generate_password)
         self.add_button = ttk.Button(self, text="Add", width=42, command=self.add_creds)
 
+        self.site_entry.bind("<KeyRelease>", self.update_suggestions)
+        self.site_entry.bind("<Down>", self.focus_suggestions)
+        self.site_entry.bind("<Return>", lambda event: self.search_for_site())
+        self.suggestion_list.bind("<<ListboxSelect>>", self.choose_suggestion)
+        self.suggestion_list.bind("<Return>", self.choose_suggestion)
+        self.suggestion_list.bind("<Escape>", lambda event: self.hide_suggestions())
+        self.account_list.bind("<<ListboxSelect>>", self.choose_account)
+
         self.place_elements()
 
     def place_elements(self):
@@ -79,20 +92,43 @@ class HomeFrame(ttk.Frame):
 
         self.add_button.place(relx=0.5, rely=0.82, anchor="center")
 
+    def on_show(self) -> None:
+        """
+        Called by the controller each time the frame is shown. Focuses the site entry.
+
+        :return: None
+        """
+        self.site_entry.focus()
+
+    def on_hide(self) -> None:
+        """
+        Called by the controller before the frame is hidden. Clears the fields so a looked-up or generated
+        password does not stay in the hidden widgets.
+
+        :return: None
+        """
+        self.clear_fields()
+
     def generate_password(self):
         """
         Generates a secure random password and sets it in the password entry field.
 
-        The password consists of 15 characters randomly selected from uppercase letters,
-        lowercase letters, digits, and punctuation symbols.
+        The password follows the generator policy for the site entered, by default 16 characters with at least one
+        uppercase letter, lowercase letter, digit and symbol. Its entropy is shown as the status message.
 
         :return: None
         """
         self.clear_status_messages()
-        alphabet = string.ascii_letters + string.digits + string.punctuation
-        password = ''.join(secrets.choice(alphabet) for _ in range(15))
+        site: str = self.site_entry.get_real_value().strip()
+        passwords: list[str] | None = generate_passwords(site)
 
-        self.password_entry.set_value(password)
+        if not passwords:
+            self.show_error("Could not generate a password for this site's policy.")
+            return None
+
+        self.password_entry.set_value(passwords[0])
+        self.show_success(f"Generated a {get_password_policy(site).entropy_bits():.0f}-bit password.")
+        return None
 
     def handle_autofill(self) -> None:
         """
@@ -196,9 +232,10 @@ class HomeFrame(ttk.Frame):
 
         Retrieves the input from the website, username, and password entry fields.
         Encrypts the password using Fernet symmetric encryption and stores the resulting
-        credentials in a JSON file via the `store_creds` helper function.
+        credentials in the credential store via the `store_creds` helper function.
 
-        If any required fields are empty, an error message is displayed and the process is aborted. Else a success
+        If any required fields are empty, an error message is displayed and the process is aborted. If the password
+        appears in the local breach index, the user is warned and asked whether to save it anyway. Else a success
         message is displayed.
 
         :return: None
@@ -214,6 +251,12 @@ class HomeFrame(ttk.Frame):
             self.show_error("Please fill out all fields and try again.")
             return None
 
+        if times := breach_count(password):
+            if not messagebox.askyesno("Breached Password", f"This password has appeared {times:,} times in known"
+                                                            " data breaches. Save it anyway?", icon="warning"):
+                self.show_error("Credentials not stored. Choose another password.")
+                return None
+
         store_creds(site, username, encrypted_pwd)
         self.show_success("Successfully stored credentials.")
         return None
@@ -227,29 +270,169 @@ class HomeFrame(ttk.Frame):
         :return: None
         """
         self.site_entry.clear_field()
+        self.hide_suggestions()
+        self.hide_accounts()
         self.username_entry.clear_field()
         self.password_entry.clear_field()
         self.clear_status_messages()
 
+    def update_suggestions(self, event=None) -> None:
+        """
+        Shows stored sites matching the text typed so far in a list below the site entry.
+
+        Navigation and confirmation keys are ignored so they can move through or choose from the list.
+
+        :return: None
+        """
+        if event is not None and event.keysym in ("Down", "Up", "Return", "Escape", "Tab"):
+            return None
+
+        matches: list[str] = search_sites(self.site_entry.get_real_value(), SUGGESTION_LIMIT)
+        self.suggestion_list.delete(0, "end")
+
+        if not matches:
+            self.hide_suggestions()
+            return None
+
+        self.suggestion_list.insert("end", *matches)
+        self.suggestion_list.configure(height=len(matches))
+        self.suggestion_list.place(relx=0.5, rely=0.58, anchor="n")
+        self.suggestion_list.lift()
+        return None
+
+    def hide_suggestions(self) -> None:
+        """
+        Hides the site suggestion list.
+
+        :return: None
+        """
+        self.suggestion_list.place_forget()
+
+    def focus_suggestions(self, event=None) -> None:
+        """
+        Moves keyboard focus from the site entry to the first suggestion, if the list is showing.
+
+        :return: None
+        """
+        if self.suggestion_list.winfo_ismapped() and self.suggestion_list.size():
+            self.suggestion_list.focus_set()
+            self.suggestion_list.selection_clear(0, "end")
+            self.suggestion_list.selection_set(0)
+            self.suggestion_list.activate(0)
+
+    def choose_suggestion(self, event=None) -> None:
+        """
+        Fills the site entry with the selected suggestion and searches for its credentials.
+
+        :return: None
+        """
+        selection: tuple[int, ...] = self.suggestion_list.curselection()
+
+        if not selection:
+            return None
+
+        self.site_entry.set_value(self.suggestion_list.get(selection[0]))
+        self.hide_suggestions()
+        self.search_for_site()
+        return None
+
     def search_for_site(self) -> None:
         """
         Searches for stored credentials matching the entered site name.
 
-        Retrieves the site name from the entry field, looks up corresponding credentials
-        using the `find_creds` helper function, and displays them in the username and password
-        fields if found. If no credentials are found, an error message is displayed.
+        Retrieves the site name from the entry field and looks up every account stored for it using the
+        `find_entries` helper function. The first account is decrypted and displayed in the username and
+        password fields; if the site holds several accounts, their usernames are listed so another can be
+        chosen. If there is no exact match, the best case-insensitive match from the site search index is used
+        instead. If no credentials are found, an error message listing the closest matches is displayed.
 
         :return: None
         """
         self.clear_status_messages()
+        self.hide_suggestions()
+        self.hide_accounts()
         site: str = self.site_entry.get_real_value().strip()
 
-        creds: dict[str, str] | None = find_creds(site)
+        entries: list[Entry] = find_entries(site) or []
 
-        if not creds:
+        if not entries:
+            matches: list[str] = search_sites(site, 3)
+
+            if matches and matches[0].lower() == site.lower():
+                site = matches[0]
+                entries = find_entries(site) or []
+
+            elif matches:
+                self.show_error(f"No credentials found for site {site}. Did you mean {', '.join(matches)}?")
+                return None
+
+        if not entries:
             self.show_error(f"No credentials found for site {site}")
             return None
 
+        if len(entries) > 1:
+            self.show_accounts(site, [entry.username for entry in entries])
+            self.show_success(f"{len(entries)} accounts stored for {site}. Choose one from the list.")
+
+        self.fill_account(site, entries[0].username)
+        return None
+
+    def fill_account(self, site: str, username: str) -> None:
+        """
+        Decrypts one account and displays it in the username and password fields.
+
+        :param site: The site the account is for.
+        :param username: The account's username.
+        :return: None
+        """
+        creds: dict[str, str] | None = find_creds(site, username)
+
+        if not creds:
+            self.show_error(f"Could not read the {username} account for site {site}")
+            return None
+
         self.username_entry.set_value(creds['username'])
         self.password_entry.set_value(creds['password'])
+        return None
+
+    def show_accounts(self, site: str, usernames: list[str]) -> None:
+        """
+        Lists the usernames of every account stored for a site next to the logo. Only usernames are listed;
+        a password is decrypted when its account is chosen.
+
+        :param site: The site the accounts are for.
+        :param usernames: The usernames, in display order.
+        :return: None
+        """
+        self.account_site = site
+        self.account_list.delete(0, "end")
+        self.account_list.insert("end", *usernames)
+        self.account_list.configure(height=min(len(usernames), ACCOUNT_LIST_HEIGHT))
+        self.account_list.selection_set(0)
+        self.account_list.place(relx=0.88, rely=0.05, anchor="n")
+        self.account_list.lift()
+
+    def hide_accounts(self) -> None:
+        """
+        Hides and empties the account list.
+
+        :return: None
+        """
+        self.account_site = ""
+        self.account_list.delete(0, "end")
+        self.account_list.place_forget()
+
+    def choose_account(self, event=None) -> None:
+        """
+        Displays the account selected in the account list.
+
+        :return: None
+        """
+        selection: tuple[int, ...] = self.account_list.curselection()
+
+        if not selection or not self.account_site:
+            return None
+
+        self.clear_status_messages()
+        self.fill_account(self.account_site, self.account_list.get(selection[0]))
         return None
\ No newline at end of file
@@ -1,13 +1,21 @@
+import importlib
 import logging
+import sys
 import tkinter
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog, simpledialog
 
-from Application.Utils.HelperFunctions import export_passwords
-from Application.Utils.LoggingController import setup_logging
+from Application.Utils.HelperFunctions import export_passwords, lock_session, backup_vault, restore_vault, \
+    import_passwords, rotate_vault_key, resume_key_rotation, is_rotation_pending, set_vault, import_breach_list
+from Application.Utils.AssetCache import clear_images
+from Application.Utils.LoggingController import setup_logging, shutdown_logging, log_error_and_method
+from Application.Utils.StartupProfile import PROFILE_FLAG, FIRST_FRAME_FLAG, FIRST_FRAME_MARKER, profile_startup, \
+    format_report
+from Application.Utils.TaskRunner import TaskRunner
 from Application.Views.EntryFrame import EntryFrame
-from Application.Views.HomeFrame import HomeFrame
-from Application.Views.PasswordFrame import PasswordFrame
-from Application.Views.ResetFrame import ResetFrame
+
+BACKUP_EXTENSION = ".spmb"
+# Frames other than the login screen live in Application.Views.<name> and are imported on first navigation.
+VIEWS_PACKAGE = "Application.Views"
 
 
 class ParentWindow(tkinter.Tk):
@@ -21,22 +29,103 @@ class ParentWindow(tkinter.Tk):
 
         self.container: ttk.Frame = ttk.Frame(self)
         self.container.pack(fill="both", expand=True)
+        self.frames: dict[tuple, ttk.Frame] = {}
+        self.current_frame: ttk.Frame | None = None
         self.menu_bar: tkinter.Menu = tkinter.Menu()
+        self.busy_bar: ttk.Progressbar = ttk.Progressbar(self, mode="indeterminate")
+        self.tasks: TaskRunner = TaskRunner(self.after, on_busy_change=self.show_busy, on_progress=self.show_progress)
+        self.protocol("WM_DELETE_WINDOW", self.close)
         self.render_frame(EntryFrame)
 
     def render_frame(self, new_frame, *args) -> None:
         """
-        Destroys previous frame and renders new frame.
-        :param new_frame: A class reference to the new ttk.Frame to render
+        Hides the current frame and shows the requested one, building it only on the first visit.
+
+        Frames are kept in a registry keyed by their class and constructor arguments, so navigating back to a
+        frame reuses its widgets and images. The hidden frame's `on_hide` hook runs before the switch and the
+        shown frame's `on_show` hook after it.
+
+        :param new_frame: A class reference to the ttk.Frame to render, or the name of a frame module in
+                          Application.Views, which is imported on first use.
         :param args: Optional arguments passed to the new frame's constructor.
         :return: None
         """
-        for frame in self.container.winfo_children():
-            frame.destroy()
+        if isinstance(new_frame, str):
+            new_frame = self.load_frame(new_frame)
+
+        key: tuple = (new_frame, *args)
+        frame: ttk.Frame | None = self.frames.get(key)
 
-        frame: ttk.Frame = new_frame(self.container, self, *args)
+        if frame is None:
+            frame = new_frame(self.container, self, *args)
+            self.frames[key] = frame
 
+        if self.current_frame is frame:
+            frame.on_show()
+            return None
+
+        if self.current_frame is not None:
+            self.current_frame.on_hide()
+            self.current_frame.pack_forget()
+
+        self.current_frame = frame
         frame.pack(fill="both", expand=True)
+        frame.tkraise()
+        frame.on_show()
+        return None
+
+    @staticmethod
+    def load_frame(name: str) -> type:
+        """
+        Imports a frame class by name. Modules already imported are returned from the import cache.
+
+        :param name: Name of the frame, which is both the module name and the class name.
+        :return: The frame class.
+        """
+        module = importlib.import_module(f"{VIEWS_PACKAGE}.{name}")
+        return getattr(module, name)
+
+    def run_task(self, func, *args, on_done=None, on_error=None) -> bool:
+        """
+        Runs CPU-bound work (bcrypt, bulk crypto, export) on a worker thread so the UI stays responsive.
+
+        The callbacks are posted back to the Tk loop with `after()`. Calls made while another task is still
+        running are ignored, so double-clicking a button does not start the work twice.
+
+        :param func: The function to run on the worker thread.
+        :param args: Positional arguments passed to `func`.
+        :param on_done: Called on the Tk thread with the return value of `func`.
+        :param on_error: Called on the Tk thread with the exception if `func` raises.
+        :return: True if the task was started, False if another task was already running.
+        """
+        return self.tasks.submit(func, *args, on_done=on_done, on_error=on_error)
+
+    def show_busy(self, busy: bool) -> None:
+        """
+        Shows or hides the busy indicator while a background task is running.
+        :param busy: True when a task starts, False when it finishes.
+        :return: None
+        """
+        if busy:
+            self.configure(cursor="watch")
+            self.busy_bar.place(relx=0, rely=1.0, relwidth=1.0, anchor="sw")
+            self.busy_bar.lift()
+            self.busy_bar.start(10)
+        else:
+            self.busy_bar.stop()
+            self.busy_bar.place_forget()
+            self.busy_bar.configure(mode="indeterminate", value=0)
+            self.configure(cursor="")
+
+    def show_progress(self, done: int, total: int) -> None:
+        """
+        Switches the busy indicator to a determinate progress bar for tasks that report progress.
+        :param done: Units of work completed.
+        :param total: Total units of work.
+        :return: None
+        """
+        self.busy_bar.stop()
+        self.busy_bar.configure(mode="determinate", maximum=max(total, 1), value=done)
 
     def create_menu(self) -> None:
         """
@@ -46,14 +135,24 @@ class ParentWindow(tkinter.Tk):
         # Account
         account_menu: tkinter.Menu = tkinter.Menu(self.menu_bar, tearoff=False)
         self.menu_bar.add_cascade(label="Account", menu=account_menu)
-        account_menu.add_command(label="Reset App Password", command=lambda: self.render_frame(ResetFrame, "password"))
-        account_menu.add_command(label="Change Autofill", command=lambda: self.render_frame(ResetFrame, "autofill"))
-        account_menu.add_command(label="View Passwords", command=lambda: self.render_frame(PasswordFrame))
-        account_menu.add_command(label="Export Passwords", command=self.export_passwords)
+        account_menu.add_command(label="Reset App Password", command=lambda: self.render_frame("ResetFrame", "password"))
+        account_menu.add_command(label="Change Autofill", command=lambda: self.render_frame("ResetFrame", "autofill"))
+        account_menu.add_command(label="View Passwords", command=lambda: self.render_frame("PasswordFrame"))
+        account_menu.add_command(label="Audit Passwords", command=lambda: self.render_frame("AuditFrame"))
+        export_menu: tkinter.Menu = tkinter.Menu(account_menu, tearoff=False)
+        account_menu.add_cascade(label="Export Passwords", menu=export_menu)
+        export_menu.add_command(label="JSON", command=lambda: self.export_passwords("json"))
+        export_menu.add_command(label="JSON Lines", command=lambda: self.export_passwords("jsonl"))
+        export_menu.add_command(label="CSV", command=lambda: self.export_passwords("csv"))
+        account_menu.add_command(label="Import Passwords", command=self.import_passwords)
+        account_menu.add_command(label="Import Breach List", command=self.import_breach_list)
+        account_menu.add_command(label="Backup Vault", command=self.backup_vault)
+        account_menu.add_command(label="Restore Vault", command=self.restore_vault)
+        account_menu.add_command(label="Rotate Encryption Key", command=self.rotate_vault_key)
 
         account_menu.add_separator()
-        account_menu.add_command(label="Home", command=lambda: self.render_frame(HomeFrame))
-        account_menu.add_command(label="Exit", command=exit)
+        account_menu.add_command(label="Home", command=lambda: self.render_frame("HomeFrame"))
+        account_menu.add_command(label="Exit", command=self.close)
 
         # Settings
         settings_menu: tkinter.Menu = tkinter.Menu(self.menu_bar, tearoff=False)
@@ -62,16 +161,39 @@ class ParentWindow(tkinter.Tk):
 
         self.configure(menu=self.menu_bar)
 
-    @staticmethod
-    def export_passwords() -> None:
+    def close(self) -> None:
+        """
+        Wipes the visible frame, locks the vault session, wiping the key from memory, saves pending settings,
+        closes the credential store and closes the application.
+        :return: None
+        """
+        if self.current_frame is not None:
+            self.current_frame.on_hide()
+
+        lock_session()
+        logging.info("Vault session locked")
+        self.tasks.shutdown()
+
+        try:
+            # Saves settings changes that are still waiting for their debounced write and closes the store
+            set_vault(None)
+        except OSError as error:
+            log_error_and_method(error)
+
+        shutdown_logging()
+        clear_images()
+        self.destroy()
+
+    def export_passwords(self, export_format: str = "json") -> None:
         """
         Prompts the user for confirmation to export all stored passwords in unencrypted form.
 
-        If the user consents, attempts to export the passwords to a file in the user's Downloads directory.
-        Displays a success message if the export completes successfully, or an error message if it fails.
+        If the user consents, exports the passwords to a file in the user's Downloads directory on a worker
+        thread. Displays a success message if the export completes successfully, or an error message if it fails.
 
         The exported passwords file should be handled securely and deleted promptly to protect sensitive data.
 
+        :param export_format: One of "json", "jsonl" or "csv".
         :return: None
         """
         answer: str = messagebox.askquestion("Export Passwords",
@@ -80,17 +202,198 @@ class ParentWindow(tkinter.Tk):
                                              " Do you wish to continue?")
 
         if answer == "yes":
-            was_successful: bool = export_passwords()
+            self.run_task(export_passwords, export_format, on_done=self.on_export_done,
+                          on_error=lambda error: self.on_export_done(False))
+
+        return None
+
+    @staticmethod
+    def on_export_done(was_successful: bool) -> None:
+        """
+        Reports the outcome of a password export.
+
+        :param was_successful: True if the export completed.
+        :return: None
+        """
+        if not was_successful:
+            messagebox.showerror("Export Failed", "Failed to export passwords.")
+        else:
+            messagebox.showinfo("Export Successful", "Successfully exported passwords.")
+
+    def import_passwords(self) -> None:
+        """
+        Prompts for a CSV, JSON Lines or JSON export and imports its credentials on a worker thread.
+
+        Progress is shown in the busy indicator, and a summary is displayed when the import finishes.
+
+        :return: None
+        """
+        path: str = filedialog.askopenfilename(title="Import Passwords",
+                                               filetypes=[("Password exports", "*.csv *.json *.jsonl *.txt")])
+
+        if path:
+            self.run_task(import_passwords, path, self.tasks.report_progress, on_done=self.on_import_done,
+                          on_error=lambda error: self.on_import_done(None))
+
+        return None
+
+    @staticmethod
+    def on_import_done(result) -> None:
+        """
+        Reports the outcome of a password import.
+
+        :param result: The ImportResult, or None if the import failed.
+        :return: None
+        """
+        if result is None:
+            messagebox.showerror("Import Failed", "Failed to import passwords. See the application log for details.")
+        else:
+            messagebox.showinfo("Import Successful",
+                                f"Imported {result.imported} entries. Skipped {result.duplicates} already stored"
+                                f" and {result.skipped} incomplete entries.")
+
+    def import_breach_list(self) -> None:
+        """
+        Prompts for a downloaded list of breached password hashes and indexes it on a worker thread.
+
+        Stored passwords are checked against the index by the password audit, and new ones when they are added.
+
+        :return: None
+        """
+        path: str = filedialog.askopenfilename(title="Import Breach List",
+                                               filetypes=[("SHA-1 hash lists", "*.txt"), ("All files", "*")])
+
+        if path:
+            self.run_task(import_breach_list, path, self.tasks.report_progress,
+                          on_done=lambda count: self.report_result(count is not None, "Breach Import",
+                                                                   f"Indexed {count or 0:,} breached passwords."),
+                          on_error=lambda error: self.report_result(False, "Breach Import", ""))
+
+        return None
+
+    def backup_vault(self) -> None:
+        """
+        Prompts for a destination and writes an encrypted backup of the vault there on a worker thread.
+
+        :return: None
+        """
+        path: str = filedialog.asksaveasfilename(title="Backup Vault", defaultextension=BACKUP_EXTENSION,
+                                                 filetypes=[("Vault backup", f"*{BACKUP_EXTENSION}")])
+
+        if path:
+            self.run_task(backup_vault, path,
+                          on_done=lambda ok: self.report_result(ok, "Backup", "Successfully backed up vault."),
+                          on_error=lambda error: self.report_result(False, "Backup", ""))
+
+        return None
+
+    def restore_vault(self) -> None:
+        """
+        Prompts for a backup file and restores it into the vault on a worker thread.
+
+        Entries in the backup overwrite stored entries with the same site and username.
+
+        :return: None
+        """
+        path: str = filedialog.askopenfilename(title="Restore Vault",
+                                               filetypes=[("Vault backup", f"*{BACKUP_EXTENSION}")])
+
+        if not path:
+            return None
+
+        answer: str = messagebox.askquestion("Restore Vault",
+                                             "Entries in the backup will overwrite stored entries with the same site"
+                                             " and username. Do you wish to continue?")
+
+        if answer == "yes":
+            self.run_task(restore_vault, path,
+                          on_done=lambda ok: self.report_result(ok, "Restore", "Successfully restored vault."),
+                          on_error=lambda error: self.report_result(False, "Restore", ""))
+
+        return None
+
+    def rotate_vault_key(self) -> None:
+        """
+        Asks for the master password and replaces the vault key, re-encrypting every entry on a worker thread.
 
-            if not was_successful:
-                messagebox.showerror("Export Failed", "Failed to export passwords.")
-            else:
-                messagebox.showinfo("Export Successful", "Successfully exported passwords.")
+        The vault stays usable while the entries are re-encrypted.
+
+        :return: None
+        """
+        answer: str = messagebox.askquestion("Rotate Encryption Key",
+                                             "All stored passwords will be re-encrypted with a new key."
+                                             " Do you wish to continue?")
+
+        if answer != "yes":
+            return None
+
+        password: str | None = simpledialog.askstring("Rotate Encryption Key", "Enter your master password:",
+                                                      show="*", parent=self)
+
+        if password:
+            self.run_task(rotate_vault_key, password, self.tasks.report_progress, on_done=self.on_rotation_done,
+                          on_error=lambda error: self.on_rotation_done(None))
 
         return None
 
+    def resume_key_rotation(self) -> None:
+        """
+        Continues an interrupted key rotation on a worker thread. Called after login.
+
+        :return: None
+        """
+        if is_rotation_pending():
+            logging.info("Resuming interrupted key rotation")
+            self.run_task(resume_key_rotation, self.tasks.report_progress, on_done=self.on_rotation_done,
+                          on_error=lambda error: self.on_rotation_done(None))
+
+        return None
+
+    @staticmethod
+    def on_rotation_done(result) -> None:
+        """
+        Reports the outcome of a key rotation.
+
+        :param result: The RotationResult, or None if the rotation failed.
+        :return: None
+        """
+        if result is None:
+            messagebox.showerror("Key Rotation Failed", "Failed to rotate the encryption key. Check the master"
+                                                        " password, or see the application log for details.")
+        else:
+            messagebox.showinfo("Key Rotation Successful",
+                                f"Re-encrypted {result.rotated} entries "
+                                f"({result.entries_per_second:.0f} entries/sec).")
+
+    @staticmethod
+    def report_result(was_successful: bool, action: str, message: str) -> None:
+        """
+        Shows the outcome of a background vault operation.
+
+        :param was_successful: True if the operation completed.
+        :param action: Name of the operation, used in the dialog titles.
+        :param message: Message shown on success.
+        :return: None
+        """
+        if not was_successful:
+            messagebox.showerror(f"{action} Failed", f"{action} failed. See the application log for details.")
+        else:
+            messagebox.showinfo(f"{action} Successful", message)
+
 
 if __name__ == "__main__":
+    if PROFILE_FLAG in sys.argv:
+        # Relaunches the app under -X importtime and reports where startup time goes
+        print(format_report(profile_startup(__file__)))
+        sys.exit(0)
+
     app: ParentWindow = ParentWindow()
+
+    if FIRST_FRAME_FLAG in sys.argv:
+        app.update()
+        print(FIRST_FRAME_MARKER, flush=True)
+        app.close()
+        sys.exit(0)
+
     logging.info("Application started")
     app.mainloop()
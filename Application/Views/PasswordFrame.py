@@ -1,19 +1,36 @@
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
-from Application.Utils.HelperFunctions import get_all_passwords
+from Application.Utils.HelperFunctions import get_store, find_secret
+from Application.Utils.SecretBuffer import SecretBuffer
+from Application.Utils.TimedCache import TimedCache
+from Application.Utils.VirtualTreeview import VirtualTreeview, StoreRowSource
 
 if TYPE_CHECKING:
     from Application.Views.ParentWindow import ParentWindow
 
+MASK = "••••••••"
+REVEAL_SECONDS = 30
+
 
 class PasswordFrame(ttk.Frame):
+    """
+    Lists every stored credential with its password masked.
+
+    Only sites and usernames are loaded, a page at a time as the list scrolls. A password is decrypted on
+    demand when its row is revealed (Enter/space) or copied (double-click), into a wipeable SecretBuffer that
+    is kept in a short-lived cache and zeroed when it expires or the frame is hidden.
+    """
 
     def __init__(self, parent: ttk.Frame, controller: 'ParentWindow'):
         super().__init__(parent)
         self.controller = controller
+        self.password_cache: TimedCache[tuple[str, str], SecretBuffer] = TimedCache(ttl=REVEAL_SECONDS,
+                                                                                   on_evict=SecretBuffer.wipe)
 
-        self.tree: ttk.Treeview = ttk.Treeview(self, columns=["site", "username", "password"], show="headings")
+        self.table: VirtualTreeview = VirtualTreeview(self, StoreRowSource(get_store(), MASK),
+                                                      columns=["site", "username", "password"])
+        self.tree: ttk.Treeview = self.table.tree
         style = ttk.Style()
         style.configure("Treeview", background="light blue", fieldbackground="light blue", foreground="black")
 
@@ -25,30 +42,98 @@ class PasswordFrame(ttk.Frame):
         self.tree.column("username", width=200, anchor="w")
         self.tree.column("password", width=200, anchor="w")
 
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-
-        self.tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.table.pack(fill="both", expand=True)
 
-        self.display_creds()
         self.tree.bind("<Double-1>", self.copy_password)
+        self.tree.bind("<Return>", self.toggle_reveal)
+        self.tree.bind("<space>", self.toggle_reveal)
 
     def display_creds(self) -> None:
         """
-        Populates the Treeview with decrypted credentials from the JSON file.
+        Reloads the credential rows from the credential store.
+
+        Passwords are not decrypted here; each row shows a masked placeholder until it is revealed.
+        """
+        self.table.refresh()
+
+    def on_show(self) -> None:
+        """
+        Called by the controller each time the frame is shown. Reloads the rows, since credentials may have
+        been added, imported or restored while the frame was hidden.
+        """
+        self.display_creds()
+        self.tree.focus_set()
+
+    def on_hide(self) -> None:
+        """
+        Called by the controller before the frame is hidden. Drops the decrypted passwords from the cache
+        and masks every revealed row.
+        """
+        self.password_cache.clear()
+
+        for item in self.tree.get_children():
+            self.mask_row(item)
+
+    def get_password(self, site: str, username: str) -> SecretBuffer | None:
+        """
+        Returns the decrypted password for an account, decrypting it only if it is not already cached.
+
+        :param site: The site of the account.
+        :param username: The username of the account.
+        :return: The buffer holding the decrypted password, or None if the account is not stored.
+        """
+        password: SecretBuffer | None = self.password_cache.get((site, username))
+
+        if password is None:
+            password = find_secret(site, username=username)
+
+            if password is None:
+                return None
+
+            self.password_cache.put((site, username), password)
+
+        return password
+
+    def toggle_reveal(self, event=None) -> None:
+        """
+        Shows the decrypted password of the focused row, or masks it again if it is already shown.
+
+        A revealed password is masked again automatically once the cache time-to-live has elapsed.
+        """
+        selected_item = self.tree.focus()
+
+        if not selected_item:
+            return None
+
+        site, username, shown = self.tree.item(selected_item, 'values')
+
+        if shown != MASK:
+            self.mask_row(selected_item)
+            return None
+
+        password: SecretBuffer | None = self.get_password(site, username)
+
+        if password is not None:
+            self.tree.item(selected_item, values=(site, username, password.reveal()))
+            self.after(REVEAL_SECONDS * 1000, self.mask_row, selected_item)
+
+        return None
+
+    def mask_row(self, item: str) -> None:
         """
-        credentials: dict[str, dict[str, str]] = get_all_passwords()
+        Replaces the password shown in a row with the masked placeholder.
 
-        if credentials:
-            for site, creds in credentials.items():
-                self.tree.insert("", "end", values=(site, creds["username"], creds["password"]))
+        :param item: The Treeview item to mask.
+        """
+        if self.tree.exists(item) and self.tree.item(item, 'values'):
+            site, username, _ = self.tree.item(item, 'values')
+            self.tree.item(item, values=(site, username, MASK))
 
     def copy_password(self, event) -> None:
         """
         Copies the password of the selected credential row to the system clipboard.
 
-        Triggered by a double-click event on the Treeview. Retrieves the selected row's password,
+        Triggered by a double-click event on the Treeview. Decrypts the selected row's password on demand,
         clears the clipboard, and appends the password for quick copying.
         """
         selected_item = self.tree.focus()
@@ -57,7 +142,9 @@ class PasswordFrame(ttk.Frame):
             values = self.tree.item(selected_item, 'values')
 
             if values:
-                password = values[2]
-                self.clipboard_clear()
-                self.clipboard_append(password)
-                self.update()
+                password: SecretBuffer | None = self.get_password(values[0], values[1])
+
+                if password is not None:
+                    self.clipboard_clear()
+                    self.clipboard_append(password.reveal())
+                    self.update()
@@ -1,6 +1,7 @@
 from tkinter import ttk, PhotoImage, Canvas
 from typing import TYPE_CHECKING
 
+from Application.Utils.AssetCache import get_image
 from Application.Utils.PlaceholderEntry import PlaceholderEntry
 
 if TYPE_CHECKING:
@@ -15,7 +16,7 @@ class ResetFrame(ttk.Frame):
         self.controller = controller
         reset_type: str = args[0]
 
-        self.canvas_image: PhotoImage = PhotoImage(file=HOME_LOGO)
+        self.canvas_image: PhotoImage = get_image(HOME_LOGO)
         self.canvas: Canvas = Canvas(self, bg='light blue', highlightthickness=0, width=720, height=480)
         self.canvas.create_image(360, 240, image=self.canvas_image)
 
@@ -33,4 +34,17 @@ class ResetFrame(ttk.Frame):
         self.canvas.place(relx=0.5, rely=0.5, anchor="center", width=720, height=480)
         self.password_entry.place(relx=0.5, rely=0.75, anchor="center")
         self.confirm_password_entry.place(relx=0.5, rely=0.8, anchor="center")
-        self.login_button.place(relx=0.9, rely=0.8, anchor="center")
\ No newline at end of file
+        self.login_button.place(relx=0.9, rely=0.8, anchor="center")
+
+    def on_show(self) -> None:
+        """
+        Called by the controller each time the frame is shown. Focuses the first entry.
+        """
+        self.password_entry.focus()
+
+    def on_hide(self) -> None:
+        """
+        Called by the controller before the frame is hidden. Clears both entries.
+        """
+        self.password_entry.clear_field()
+        self.confirm_password_entry.clear_field()
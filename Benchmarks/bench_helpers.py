@@ -0,0 +1,521 @@
+"""
+Benchmark suite for the HelperFunctions hot paths.
+
+Builds synthetic vaults of the requested sizes, then times each helper in its own child process so that peak
+RSS is measured per case and one case cannot warm caches for the next. Each case is run in several children
+and the median of every measurement is kept. Every case records throughput, p50 and
+p99 latency and peak RSS. Vault contents come from a fixed seed, so runs with the same sizes are comparable.
+Nothing here imports Tk, so the suite runs headless.
+
+Results can be saved as a JSON baseline and later runs compared against it. A case is flagged as a regression
+when its throughput drops, or its p99 latency or peak RSS grows, by more than the tolerances below.
+
+Run from the repository root:
+    python -m Benchmarks.bench_helpers                                   # default vault sizes
+    python -m Benchmarks.bench_helpers --sizes 100 1000000               # 100 to 1M entries
+    python -m Benchmarks.bench_helpers --save Benchmarks/baselines/main.json
+    python -m Benchmarks.bench_helpers --compare Benchmarks/baselines/main.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import cycle
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from Application.Utils.StartupProfile import REPO_ROOT
+
+DEFAULT_SIZES = (100, 10_000, 100_000)
+SEED = 1234
+SAMPLE_OPS = 1000
+# Leading calls of a sampled case that are not recorded, so first-call costs (regex compilation, page cache)
+# do not skew the tail latency
+WARMUP_OPS = 50
+BULK_REPEATS = 3
+# Each case is run in this many child processes and the median of every measurement is kept
+ROUNDS = 3
+# Allowed change against the baseline before a case counts as a regression
+THROUGHPUT_TOLERANCE = 0.15
+P99_TOLERANCE = 0.30
+RSS_TOLERANCE = 0.20
+VALID_PASSWORD = "ValidPassword123!"
+
+
+class Case(NamedTuple):
+    """
+    One benchmarked helper.
+
+    :param run: Runs the helper and returns the latency of each timed call in nanoseconds.
+    :param per_call: Number of entries processed by each timed call, or None if each call is one operation.
+    :param sized: True if the helper's cost depends on the vault, so it is run for every vault size.
+    :param mutates: True if the case writes to the vault, so it runs against a copy.
+    """
+    run: Callable[[int], list[int]]
+    per_call: Callable[[int], int] | None = None
+    sized: bool = True
+    mutates: bool = False
+
+
+class Result(NamedTuple):
+    """
+    Measurements of one case at one vault size.
+
+    :param case: Name of the benchmarked helper.
+    :param size: Number of entries in the vault, or 0 for helpers that do not use it.
+    :param calls: Number of timed calls.
+    :param throughput: Operations per second, or entries per second for bulk helpers.
+    :param unit: The unit of `throughput`.
+    :param p50_us: Median latency of a call in microseconds.
+    :param p99_us: 99th percentile latency of a call in microseconds.
+    :param peak_rss_mb: Peak resident set size of the process running the case, or None if unavailable.
+    """
+    case: str
+    size: int
+    calls: int
+    throughput: float
+    unit: str
+    p50_us: float
+    p99_us: float
+    peak_rss_mb: float | None
+
+
+def synthetic_entries(size: int) -> list[tuple[str, str, str]]:
+    """
+    Generates reproducible plain-text entries.
+
+    :param size: Number of entries.
+    :return: (site, username, password) tuples.
+    """
+    rng: random.Random = random.Random(SEED)
+    alphabet: str = string.ascii_letters + string.digits + "!@#$%^&*"
+    return [(f"site{index:07}.example.com", f"user{index}@example.com",
+             "".join(rng.choices(alphabet, k=rng.randint(12, 24)))) for index in range(size)]
+
+
+def build_vault(size: int, directory: Path) -> None:
+    """
+    Writes a synthetic vault and its key to a directory.
+
+    :param size: Number of entries.
+    :param directory: Where to write Creds.db and the key.
+    :return: None
+    """
+    from cryptography.fernet import Fernet
+
+    from Application.Utils.CredentialStore import SqliteCredentialStore
+    from Application.Utils.VaultSession import VaultSession
+
+    key: bytes = Fernet.generate_key()
+    entries: list[tuple[str, str, str]] = synthetic_entries(size)
+    session: VaultSession = VaultSession(key)
+    store: SqliteCredentialStore = SqliteCredentialStore(str(directory / "Creds.db"))
+
+    store.put_many((site, username, token) for (site, username, _), token
+                   in zip(entries, session.encrypt_many(pwd for _, _, pwd in entries)))
+    store.close()
+    (directory / "key").write_bytes(key)
+
+
+def timed(func: Callable[[], object], calls: int, warmup: int = 0) -> list[int]:
+    """
+    :param func: The call to time.
+    :param calls: Number of times to call it, including the warmup calls.
+    :param warmup: Number of leading calls that are made but not recorded.
+    :return: The latency of each recorded call in nanoseconds.
+    """
+    latencies: list[int] = []
+
+    for _ in range(calls):
+        started: int = time.perf_counter_ns()
+        func()
+        latencies.append(time.perf_counter_ns() - started)
+
+    return latencies[warmup:]
+
+
+def bench_is_password_valid(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import is_password_valid
+
+    passwords = cycle([VALID_PASSWORD, "short", "nouppercase123!", "NoSpecial123", "x" * 64 + "A1!"])
+    return timed(lambda: is_password_valid(next(passwords)), SAMPLE_OPS * 10, WARMUP_OPS)
+
+
+def bench_analyze_passwords(size: int) -> list[int]:
+    from Application.Utils.PasswordStrength import analyze_many
+
+    passwords: list[str] = [pwd for _, _, pwd in synthetic_entries(SAMPLE_OPS)]
+    return timed(lambda: analyze_many(passwords), 25, 5)
+
+
+def bench_hash_password(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import hash_password
+
+    return timed(lambda: hash_password(VALID_PASSWORD), 3)
+
+
+def bench_verify_password(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import hash_password, verify_password
+
+    hashed: str = hash_password(VALID_PASSWORD)
+    return timed(lambda: verify_password(VALID_PASSWORD, hashed), 3)
+
+
+def bench_encrypt_password(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import encrypt_password
+
+    return timed(lambda: encrypt_password(VALID_PASSWORD), SAMPLE_OPS * 5, WARMUP_OPS)
+
+
+def bench_decrypt_password(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import decrypt_password, encrypt_password
+
+    token: str = encrypt_password(VALID_PASSWORD)
+    return timed(lambda: decrypt_password(token), SAMPLE_OPS * 5, WARMUP_OPS)
+
+
+def bench_store_creds(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import encrypt_password, store_creds
+
+    rng: random.Random = random.Random(SEED)
+    # ASSERT: Half the writes update an existing site, half add a new one
+    sites: list[str] = [f"site{rng.randrange(size):07}.example.com" if index % 2 else f"new{index}.example.com"
+                        for index in range(SAMPLE_OPS)]
+    writes = iter([(site, encrypt_password(VALID_PASSWORD)) for site in sites])
+
+    def write() -> None:
+        site, token = next(writes)
+        store_creds(site, "user@example.com", token)
+
+    return timed(write, SAMPLE_OPS, WARMUP_OPS)
+
+
+def bench_find_creds(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import find_creds
+
+    rng: random.Random = random.Random(SEED)
+    sites = iter([f"site{rng.randrange(size):07}.example.com" for _ in range(SAMPLE_OPS)])
+    return timed(lambda: find_creds(next(sites)), SAMPLE_OPS, WARMUP_OPS)
+
+
+def bench_get_all_passwords(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import get_all_passwords
+
+    return timed(get_all_passwords, bulk_repeats(size))
+
+
+def bench_export_passwords(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import export_passwords
+
+    return timed(lambda: export_passwords("json"), bulk_repeats(size))
+
+
+def bench_check_password_strength(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import check_password_strength
+
+    return timed(check_password_strength, bulk_repeats(size))
+
+
+def bench_audit_vault(size: int) -> list[int]:
+    from Application.Utils.HelperFunctions import audit_vault
+
+    return timed(audit_vault, bulk_repeats(size))
+
+
+def bulk_repeats(size: int) -> int:
+    """
+    :param size: Number of entries in the vault.
+    :return: How many times to repeat a whole-vault operation, fewer for large vaults.
+    """
+    return BULK_REPEATS if size <= 100_000 else 1
+
+
+CASES: dict[str, Case] = {
+    "is_password_valid": Case(bench_is_password_valid, sized=False),
+    "analyze_passwords": Case(bench_analyze_passwords, per_call=lambda size: SAMPLE_OPS, sized=False),
+    "hash_password": Case(bench_hash_password, sized=False),
+    "verify_password": Case(bench_verify_password, sized=False),
+    "encrypt_password": Case(bench_encrypt_password, sized=False),
+    "decrypt_password": Case(bench_decrypt_password, sized=False),
+    "store_creds": Case(bench_store_creds, mutates=True),
+    "find_creds": Case(bench_find_creds),
+    "get_all_passwords": Case(bench_get_all_passwords, per_call=lambda size: size),
+    "export_passwords": Case(bench_export_passwords, per_call=lambda size: size),
+    "check_password_strength": Case(bench_check_password_strength, per_call=lambda size: size),
+    "audit_vault": Case(bench_audit_vault, per_call=lambda size: size),
+}
+
+
+def percentile(latencies: list[int], fraction: float) -> float:
+    """
+    :param latencies: Latencies in nanoseconds.
+    :param fraction: The percentile as a fraction, e.g. 0.99.
+    :return: The nearest-rank percentile in microseconds.
+    """
+    ordered: list[int] = sorted(latencies)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))] / 1000
+
+
+def peak_rss_mb() -> float | None:
+    """
+    :return: Peak resident set size of this process in MB, or None where it cannot be read.
+    """
+    if sys.platform == "win32":
+        return None
+
+    import resource
+
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ASSERT: ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_case(name: str, size: int, vault: Path | None) -> Result:
+    """
+    Runs one case in the current process against a prepared vault. Used by the child processes.
+
+    :param name: The case to run.
+    :param size: Number of entries in the vault.
+    :param vault: Directory written by `build_vault`, or None for cases that do not use a vault.
+    :return: The measurements.
+    """
+    from cryptography.fernet import Fernet
+
+    from Application.Utils.CredentialStore import SqliteCredentialStore
+    from Application.Utils.HelperFunctions import set_store, unlock_session
+
+    case: Case = CASES[name]
+
+    if vault is not None:
+        unlock_session((vault / "key").read_bytes())
+        set_store(SqliteCredentialStore(str(vault / "Creds.db")))
+    else:
+        unlock_session(Fernet.generate_key())
+
+    latencies: list[int] = case.run(size)
+    entries: int = case.per_call(size) if case.per_call is not None else 1
+    set_store(None)
+
+    if "tkinter" in sys.modules:
+        raise RuntimeError(f"{name} imported tkinter, the benchmark must stay headless")
+
+    return Result(name, size, len(latencies), entries * len(latencies) / (sum(latencies) / 1e9),
+                  "entries/s" if case.per_call is not None else "ops/s",
+                  percentile(latencies, 0.5), percentile(latencies, 0.99), peak_rss_mb())
+
+
+def spawn_case(name: str, size: int, vault: Path | None, work_dir: Path) -> Result:
+    """
+    Runs one round of a case in a child process with its home directory pointed at a scratch folder, so
+    exports do not land in the real Downloads folder.
+
+    :param name: The case to run.
+    :param size: Number of entries in the vault.
+    :param vault: Directory written by `build_vault`, or None for cases that do not use a vault.
+    :param work_dir: Scratch directory for the child.
+    :return: The measurements reported by the child.
+    """
+    home: Path = work_dir / f"home-{name}-{size}"
+    (home / "Downloads").mkdir(parents=True, exist_ok=True)
+
+    if vault is not None and CASES[name].mutates:
+        copy: Path = work_dir / f"vault-{name}-{size}-copy"
+        shutil.copytree(vault, copy)
+        vault = copy
+
+    command: list[str] = [sys.executable, "-m", "Benchmarks.bench_helpers", "--case", name, "--size", str(size)]
+
+    if vault is not None:
+        command += ["--vault", str(vault)]
+
+    output: str = subprocess.run(command, cwd=REPO_ROOT, check=True, capture_output=True, text=True,
+                                 env=dict(os.environ, HOME=str(home), USERPROFILE=str(home))).stdout
+    shutil.rmtree(home)
+
+    if vault is not None and CASES[name].mutates:
+        shutil.rmtree(vault)
+
+    return Result(**json.loads(output.splitlines()[-1]))
+
+
+def median_result(rounds: list[Result]) -> Result:
+    """
+    :param rounds: Results of the same case and size from several rounds.
+    :return: A result holding the median of every measurement.
+    """
+    first: Result = rounds[0]
+    rss: list[float] = [result.peak_rss_mb for result in rounds if result.peak_rss_mb is not None]
+    return first._replace(throughput=statistics.median(result.throughput for result in rounds),
+                          p50_us=statistics.median(result.p50_us for result in rounds),
+                          p99_us=statistics.median(result.p99_us for result in rounds),
+                          peak_rss_mb=statistics.median(rss) if rss else None)
+
+
+def measure(name: str, size: int, vault: Path | None, work_dir: Path, rounds: int) -> Result:
+    """
+    Runs a case several times and prints the median result.
+
+    :param name: The case to run.
+    :param size: Number of entries in the vault.
+    :param vault: Directory written by `build_vault`, or None for cases that do not use a vault.
+    :param work_dir: Scratch directory for the children.
+    :param rounds: Number of child-process runs.
+    :return: The median result.
+    """
+    result: Result = median_result([spawn_case(name, size, vault, work_dir) for _ in range(rounds)])
+    print(format_result(result), flush=True)
+    return result
+
+
+def run_suite(sizes: list[int], cases: list[str], rounds: int = ROUNDS) -> list[Result]:
+    """
+    Builds a vault per size and runs every selected case against it, printing results as they arrive.
+
+    :param sizes: Vault sizes to benchmark.
+    :param cases: Names of the cases to run.
+    :param rounds: Number of child-process runs per case.
+    :return: All measurements.
+    """
+    results: list[Result] = []
+
+    with tempfile.TemporaryDirectory(prefix="spm-bench-") as temp_dir:
+        work_dir: Path = Path(temp_dir)
+
+        for name in cases:
+            if not CASES[name].sized:
+                results.append(measure(name, 0, None, work_dir, rounds))
+
+        for size in sizes:
+            vault: Path = work_dir / f"vault-{size}"
+            vault.mkdir()
+            started: float = time.perf_counter()
+            build_vault(size, vault)
+            print(f"-- built vault of {size} entries in {time.perf_counter() - started:.1f}s", flush=True)
+
+            for name in cases:
+                if CASES[name].sized:
+                    results.append(measure(name, size, vault, work_dir, rounds))
+
+            shutil.rmtree(vault)
+
+    return results
+
+
+def format_result(result: Result) -> str:
+    rss: str = f"{result.peak_rss_mb:8.1f}" if result.peak_rss_mb is not None else f"{'n/a':>8}"
+    return (f"{result.case:<18} {result.size:>9} {result.throughput:>14,.0f} {result.unit:<9} "
+            f"p50 {result.p50_us:>11,.1f}us  p99 {result.p99_us:>11,.1f}us  rss {rss} MB")
+
+
+def save_baseline(path: Path, results: list[Result]) -> None:
+    """
+    Writes results and the machine they were measured on as a JSON baseline.
+
+    :param path: Where to write the baseline.
+    :param results: The measurements.
+    :return: None
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline: dict = {
+        "meta": {"created": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                 "platform": platform.platform(), "cpu_count": os.cpu_count()},
+        "results": [result._asdict() for result in results],
+    }
+
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=4)
+
+
+def compare(baseline_path: Path, results: list[Result]) -> list[str]:
+    """
+    Compares results with a saved baseline and prints the change of every case measured in both.
+
+    :param baseline_path: A baseline written by `save_baseline`.
+    :param results: The new measurements.
+    :return: A description of every regression beyond the tolerances.
+    """
+    with open(baseline_path, "r") as file:
+        baseline: dict[tuple[str, int], Result] = {(entry["case"], entry["size"]): Result(**entry)
+                                                   for entry in json.load(file)["results"]}
+
+    regressions: list[str] = []
+    print(f"\n{'case':<18} {'size':>9} {'throughput':>11} {'p99':>9} {'rss':>9}")
+
+    for result in results:
+        old: Result | None = baseline.get((result.case, result.size))
+
+        if old is None:
+            continue
+
+        throughput_change: float = result.throughput / old.throughput - 1
+        p99_change: float = result.p99_us / old.p99_us - 1
+        rss_change: float | None = (result.peak_rss_mb / old.peak_rss_mb - 1
+                                    if result.peak_rss_mb and old.peak_rss_mb else None)
+        flags: list[str] = []
+
+        if throughput_change < -THROUGHPUT_TOLERANCE:
+            flags.append(f"throughput {throughput_change:+.0%}")
+        if p99_change > P99_TOLERANCE:
+            flags.append(f"p99 {p99_change:+.0%}")
+        if rss_change is not None and rss_change > RSS_TOLERANCE:
+            flags.append(f"peak RSS {rss_change:+.0%}")
+
+        rss: str = f"{rss_change:+9.0%}" if rss_change is not None else f"{'n/a':>9}"
+        print(f"{result.case:<18} {result.size:>9} {throughput_change:>+11.0%} {p99_change:>+9.0%} {rss}"
+              f"{'  REGRESSION' if flags else ''}")
+
+        if flags:
+            regressions.append(f"{result.case} at {result.size} entries: {', '.join(flags)}")
+
+    return regressions
+
+
+def main() -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="vault sizes to benchmark, from 100 to 1000000 entries")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="helpers to time")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="child-process runs per case, median is kept")
+    parser.add_argument("--save", type=Path, help="write the results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare the results with a JSON baseline")
+    # Internal: run a single case in this process and print its result as JSON
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--vault", type=Path, help=argparse.SUPPRESS)
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.size, args.vault)._asdict()))
+        return 0
+
+    if any(not 100 <= size <= 1_000_000 for size in args.sizes):
+        parser.error("vault sizes must be between 100 and 1000000 entries")
+
+    results: list[Result] = run_suite(sorted(args.sizes), args.cases, max(args.rounds, 1))
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"\nbaseline saved to {args.save}")
+
+    if args.compare:
+        regressions: list[str] = compare(args.compare, results)
+
+        for regression in regressions:
+            print(f"FAIL: {regression}")
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
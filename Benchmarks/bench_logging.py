@@ -0,0 +1,67 @@
+"""
+Microbenchmark for the per-call cost of `log_error_and_method`.
+
+Compares the previous `inspect.stack()` caller lookup with the current frame lookup, with the root logger
+routed to a handler that discards records so only the logging call itself is measured.
+
+Run from the repository root:  python -m Benchmarks.bench_logging
+"""
+import inspect
+import logging
+import sys
+import timeit
+
+from Application.Utils.LoggingController import log_error_and_method
+
+CALLS = 2000
+REPEATS = 5
+
+
+class DiscardHandler(logging.Handler):
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+def log_error_and_method_inspect(error: Exception) -> None:
+    # The implementation before the frame-lookup change, kept here as the baseline
+    method_name = inspect.stack()[1].function
+    logging.warning(f"{type(error).__name__} occurred in {method_name}: {error}")
+
+
+def handled_error(log) -> None:
+    try:
+        raise KeyError("site")
+    except KeyError as error:
+        log(error)
+
+
+def nested(depth: int, log) -> None:
+    # Give the caller a realistic stack: Tk callback -> frame method -> helper
+    if depth:
+        nested(depth - 1, log)
+    else:
+        handled_error(log)
+
+
+def per_call_microseconds(log, depth: int) -> float:
+    timer: timeit.Timer = timeit.Timer(lambda: nested(depth, log))
+    return min(timer.repeat(repeat=REPEATS, number=CALLS)) / CALLS * 1e6
+
+
+def main() -> None:
+    root: logging.Logger = logging.getLogger()
+    root.handlers = [DiscardHandler()]
+    root.setLevel(logging.DEBUG)
+
+    print(f"{'stack depth':>12} {'inspect.stack (us)':>20} {'frame lookup (us)':>20} {'speedup':>8}")
+
+    for depth in (5, 20, 50):
+        before: float = per_call_microseconds(log_error_and_method_inspect, depth)
+        after: float = per_call_microseconds(log_error_and_method, depth)
+        print(f"{depth:>12} {before:>20.1f} {after:>20.1f} {before / after:>7.0f}x")
+
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
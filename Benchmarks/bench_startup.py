@@ -0,0 +1,68 @@
+"""
+Regression benchmark for time-to-first-frame.
+
+Launches the application several times under `-X importtime`, stopping each run once the login screen is drawn.
+It reports the median time to first frame and the median import time, and fails if either is over budget or
+if a module that should load lazily was imported before the first frame. Without a display the window cannot
+be shown, so only the import checks run.
+
+Run from the repository root:  python -m Benchmarks.bench_startup
+"""
+import statistics
+import sys
+
+from Application.Utils.StartupProfile import StartupReport, profile_startup, format_report, REPO_ROOT
+
+RUNS = 5
+FIRST_FRAME_BUDGET_MS = 400
+IMPORT_BUDGET_MS = 150
+# Modules the login screen must not pay for: they load on first vault access or first navigation
+LAZY_MODULES = ("cryptography", "concurrent.futures.process", "Application.Views.HomeFrame",
+                "Application.Views.PasswordFrame", "Application.Views.ResetFrame", "Application.Views.AuditFrame",
+                "subprocess")
+SCRIPT = REPO_ROOT / "Application" / "Views" / "ParentWindow.py"
+
+
+def import_ms(report: StartupReport) -> float:
+    return sum(entry.cumulative_us for entry in report.imports if entry.depth == 0) / 1000
+
+
+def main() -> int:
+    reports: list[StartupReport] = [profile_startup(str(SCRIPT)) for _ in range(RUNS)]
+    failures: list[str] = []
+
+    print(format_report(reports[-1], limit=15))
+    print()
+
+    median_import: float = statistics.median(import_ms(report) for report in reports)
+    print(f"median import time over {RUNS} runs: {median_import:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+
+    if median_import > IMPORT_BUDGET_MS:
+        failures.append("import time over budget")
+
+    first_frames: list[float] = [report.first_frame_seconds * 1000 for report in reports
+                                 if report.first_frame_seconds is not None]
+
+    if first_frames:
+        median_first_frame: float = statistics.median(first_frames)
+        print(f"median time to first frame: {median_first_frame:.1f} ms (budget {FIRST_FRAME_BUDGET_MS} ms)")
+
+        if median_first_frame > FIRST_FRAME_BUDGET_MS:
+            failures.append("time to first frame over budget")
+    else:
+        print("time to first frame: not measured (no display)")
+
+    eager: list[str] = sorted({entry.module for entry in reports[-1].imports
+                               if entry.module.startswith(LAZY_MODULES)})
+
+    if eager:
+        failures.append(f"imported before the first frame: {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+
+from Application.Utils.AssetCache import get_image, clear_images
+
+ASSET_PATH = "Application.Utils.AssetCache"
+
+
+class TestAssetCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_images()
+
+    @patch(f"{ASSET_PATH}.PhotoImage")
+    def test_get_image_decodes_once(self, mock_photo_image):
+        first = get_image("../Assets/logo.png")
+        second = get_image("../Assets/logo.png")
+
+        self.assertIs(first, second)
+        mock_photo_image.assert_called_once_with(file="../Assets/logo.png")
+
+    @patch(f"{ASSET_PATH}.PhotoImage", side_effect=lambda file: object())
+    def test_get_image_per_path(self, mock_photo_image):
+        logo = get_image("../Assets/logo.png")
+        home_logo = get_image("../Assets/Home Logo.png")
+
+        self.assertIsNot(logo, home_logo)
+        self.assertEqual(2, mock_photo_image.call_count)
+
+    @patch(f"{ASSET_PATH}.PhotoImage")
+    def test_clear_images(self, mock_photo_image):
+        get_image("../Assets/logo.png")
+        clear_images()
+        get_image("../Assets/logo.png")
+
+        self.assertEqual(2, mock_photo_image.call_count)
+
+    def tearDown(self):
+        clear_images()
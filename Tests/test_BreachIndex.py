@@ -0,0 +1,105 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from Application.Utils.BreachIndex import (BreachIndex, BreachIndexError, RECORD, RECORDS_START, build_index,
+                                           parse_line)
+
+BREACH_PATH = "Application.Utils.BreachIndex"
+
+
+def sha1_line(password: str, count: int) -> str:
+    return f"{hashlib.sha1(password.encode('utf-8')).hexdigest().upper()}:{count}\r\n"
+
+
+class TestBreachIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.source: str = os.path.join(self.temp_dir.name, "breaches.txt")
+        self.path: str = os.path.join(self.temp_dir.name, "Breaches.idx")
+
+    def write_source(self, text: str) -> None:
+        with open(self.source, "w", newline="") as file:
+            file.write(text)
+
+    def open_index(self) -> BreachIndex:
+        index: BreachIndex = BreachIndex(self.path)
+        self.addCleanup(index.close)
+        return index
+
+    def test_lookup(self):
+        # ASSERT: The list is not in hash order, and "password" is listed twice
+        self.write_source("".join(sha1_line(f"pw{number}", number + 1) for number in range(500, 0, -1))
+                          + sha1_line("password", 10) + "\n" + sha1_line("password", 5))
+
+        self.assertEqual(501, build_index(self.source, self.path))
+        index: BreachIndex = self.open_index()
+
+        self.assertEqual(501, len(index))
+        self.assertEqual(15, index.count("password"))
+        self.assertEqual(2, index.count("pw1"))
+        self.assertEqual(0, index.count("pw0"))
+        self.assertEqual([501, 0, 15, 101], index.count_many(["pw500", "unlisted", "password", "pw100"]))
+        self.assertEqual(RECORDS_START + 501 * RECORD.size, os.path.getsize(self.path))
+
+    def test_lookup_reads_only_the_bucket(self):
+        self.write_source("".join(sha1_line(f"pw{number}", 1) for number in range(2000)))
+        build_index(self.source, self.path)
+        index: BreachIndex = self.open_index()
+        unpack = MagicMock(side_effect=RECORD.unpack_from)
+
+        with patch(f"{BREACH_PATH}.RECORD", MagicMock(size=RECORD.size, unpack_from=unpack)):
+            self.assertEqual(1, index.count("pw1234"))
+
+        # ASSERT: 2000 hashes over 65536 buckets leaves at most a handful of records to search
+        self.assertLessEqual(unpack.call_count, 3)
+
+    @patch(f"{BREACH_PATH}.PROGRESS_LINES", 2)
+    def test_progress(self):
+        self.write_source("".join(sha1_line(f"pw{number}", 1) for number in range(5)))
+        progress = MagicMock()
+        build_index(self.source, self.path, progress)
+
+        total: int = os.path.getsize(self.source)
+        self.assertEqual((total, total), progress.call_args_list[-1].args)
+        self.assertEqual(3, progress.call_count)
+
+    def test_bad_line_keeps_previous_index(self):
+        self.write_source(sha1_line("password", 1))
+        build_index(self.source, self.path)
+        self.write_source(sha1_line("other", 1) + "not a hash\n")
+
+        with self.assertRaises(BreachIndexError):
+            build_index(self.source, self.path)
+
+        self.assertEqual(1, self.open_index().count("password"))
+        self.assertEqual({"breaches.txt", "Breaches.idx"}, set(os.listdir(self.temp_dir.name)))
+
+    def test_parse_line(self):
+        digest: bytes = hashlib.sha1(b"password").digest()
+
+        self.assertEqual((digest, 7), parse_line(digest.hex().encode() + b":7\n"))
+        self.assertEqual((digest, 1), parse_line(digest.hex().upper().encode()))
+        self.assertIsNone(parse_line(b"  \r\n"))
+
+        for line in [b"ABCD:1", digest.hex().encode() + b":x", b"zz" * 20]:
+            with self.subTest(line=line), self.assertRaises(BreachIndexError):
+                parse_line(line)
+
+    def test_rejects_damaged_files(self):
+        self.write_source(sha1_line("password", 1))
+        build_index(self.source, self.path)
+
+        with open(self.path, "rb") as file:
+            data: bytes = file.read()
+
+        for damaged in [b"", b"SPMBRX", b"X" + data[1:], data[:-1]]:
+            with open(self.path, "wb") as file:
+                file.write(damaged)
+
+            with self.subTest(size=len(damaged)), self.assertRaises(BreachIndexError):
+                BreachIndex(self.path)
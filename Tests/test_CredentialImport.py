@@ -0,0 +1,131 @@
+import json
+import os
+import tempfile
+import unittest
+from json import JSONDecodeError
+from unittest.mock import MagicMock
+
+from cryptography.fernet import Fernet
+
+from Application.Utils.CredentialImport import ImportResult, import_credentials, normalize_row, site_from_url
+from Application.Utils.CredentialStore import SqliteCredentialStore
+from Application.Utils.VaultSession import VaultSession
+
+
+class TestCredentialImport(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.session: VaultSession = VaultSession(Fernet.generate_key())
+        self.store: SqliteCredentialStore = SqliteCredentialStore(os.path.join(self.temp_dir.name, "Creds.db"))
+
+    def write_file(self, name: str, content: str) -> str:
+        path: str = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def stored(self) -> dict[str, tuple[str, str]]:
+        return {site: (creds["username"], self.session.decrypt(creds["password"]))
+                for site, creds in self.store.items()}
+
+    def test_site_from_url(self):
+        self.assertEqual("accounts.google.com", site_from_url("https://accounts.google.com/signin"))
+        self.assertEqual("example.com", site_from_url("example.com/login"))
+        self.assertEqual("My Bank", site_from_url("My Bank"))
+
+    def test_normalize_row_missing_password(self):
+        self.assertIsNone(normalize_row({"name": "site", "username": "user", "password": ""}))
+
+    def test_import_chrome_csv(self):
+        path: str = self.write_file("chrome.csv", "name,url,username,password,note\n"
+                                                  "GitHub,https://github.com/login,user1,pwd1,\n")
+
+        result: ImportResult = import_credentials(path, self.store, self.session)
+
+        self.assertEqual(ImportResult(1, 0, 0), result)
+        self.assertEqual({"GitHub": ("user1", "pwd1")}, self.stored())
+
+    def test_import_firefox_csv_uses_host_name(self):
+        path: str = self.write_file("firefox.csv", '"url","username","password","httpRealm"\n'
+                                                   '"https://www.netflix.com","user1","pwd,1",""\n')
+
+        import_credentials(path, self.store, self.session)
+
+        self.assertEqual({"www.netflix.com": ("user1", "pwd,1")}, self.stored())
+
+    def test_import_bitwarden_json(self):
+        data: dict = {"items": [{"name": "GitHub", "login": {"username": "user1", "password": "pwd1",
+                                                            "uris": [{"uri": "https://github.com"}]}},
+                                {"name": "Secure note", "login": None}]}
+        path: str = self.write_file("bitwarden.json", json.dumps(data))
+
+        result: ImportResult = import_credentials(path, self.store, self.session)
+
+        self.assertEqual(ImportResult(1, 0, 1), result)
+        self.assertEqual({"GitHub": ("user1", "pwd1")}, self.stored())
+
+    def test_import_app_export_json(self):
+        path: str = self.write_file("passwords.txt", json.dumps({"GitHub": {"username": "user1", "password": "pwd1"}}))
+
+        import_credentials(path, self.store, self.session)
+
+        self.assertEqual({"GitHub": ("user1", "pwd1")}, self.stored())
+
+    def test_import_app_export_json_several_accounts(self):
+        data: dict = {"GitHub": [{"username": "home", "password": "pwd1"}, {"username": "work", "password": "pwd2"}]}
+        path: str = self.write_file("passwords.txt", json.dumps(data))
+
+        result: ImportResult = import_credentials(path, self.store, self.session)
+
+        self.assertEqual(ImportResult(2, 0, 0), result)
+        self.assertEqual([("GitHub", "home", "pwd1"), ("GitHub", "work", "pwd2")],
+                         [(site, creds["username"], self.session.decrypt(creds["password"]))
+                          for site, creds in self.store.items()])
+
+    def test_import_jsonl(self):
+        path: str = self.write_file("passwords.jsonl", '{"site": "a", "username": "u1", "password": "p1"}\n\n'
+                                                       '{"site": "b", "username": "u2", "password": "p2"}\n')
+
+        import_credentials(path, self.store, self.session)
+
+        self.assertEqual({"a": ("u1", "p1"), "b": ("u2", "p2")}, self.stored())
+
+    def test_import_deduplicates(self):
+        self.store.put("a", "u1", self.session.encrypt("old"))
+        path: str = self.write_file("dupes.csv", "site,username,password\na,u1,p1\nb,u2,p2\nb,u2,p3\nb,u3,p4\n")
+
+        result: ImportResult = import_credentials(path, self.store, self.session)
+
+        # ASSERT: A second username on a site is another account, not a duplicate
+        self.assertEqual(ImportResult(2, 2, 0), result)
+        self.assertEqual([("a", "u1", "old"), ("b", "u2", "p2"), ("b", "u3", "p4")],
+                         [(site, creds["username"], self.session.decrypt(creds["password"]))
+                          for site, creds in self.store.items()])
+
+    def test_import_reports_progress(self):
+        header: str = "site,username,password\n"
+        rows: list[str] = [f"site{index},user,pwd\n" for index in range(5)]
+        path: str = self.write_file("rows.csv", header + "".join(rows))
+        row_size: int = len(rows[0])
+        total: int = len(header) + 5 * row_size
+        progress = MagicMock()
+
+        import_credentials(path, self.store, self.session, progress=progress, batch_size=2)
+
+        # ASSERT: Progress is the bytes read so far, so the file is read once rather than counted first
+        self.assertEqual([(len(header) + 2 * row_size, total), (len(header) + 4 * row_size, total), (total, total)],
+                         [call.args for call in progress.call_args_list])
+        self.assertEqual(5, len(self.store))
+
+    def test_import_rolls_back_on_bad_record(self):
+        path: str = self.write_file("broken.jsonl", '{"site": "a", "username": "u1", "password": "p1"}\nnot json\n')
+
+        with self.assertRaises(JSONDecodeError):
+            import_credentials(path, self.store, self.session, batch_size=1)
+
+        self.assertEqual(0, len(self.store))
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
@@ -0,0 +1,313 @@
+import json
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from Application.Utils.CredentialStore import Entry, JsonCredentialStore, SqliteCredentialStore
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Child process for the kill test: writes numbered entries until it is killed
+WRITER_SCRIPT = """
+import sys
+from Application.Utils.CredentialStore import SqliteCredentialStore
+
+store = SqliteCredentialStore(sys.argv[1])
+index = 0
+print("ready", flush=True)
+
+while True:
+    if index % 7 == 0:
+        with store.transaction():
+            store.put(f"site{index:06}", "user", str(index))
+            store.add_entry(f"site{index + 1:06}", "user", str(index + 1), tags=["pair"])
+        index += 2
+    else:
+        store.put(f"site{index:06}", "user", str(index))
+        index += 1
+"""
+
+
+class TestSqliteCredentialStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path: str = os.path.join(self.temp_dir.name, "Creds.db")
+        self.json_path: str = os.path.join(self.temp_dir.name, "Creds.json")
+        self.store: SqliteCredentialStore = SqliteCredentialStore(self.db_path)
+
+    def write_legacy_json(self, data: dict) -> None:
+        with open(self.json_path, "w") as file:
+            json.dump(data, file)
+
+    def test_put_and_get(self):
+        self.store.put("Facebook", "user@domain.com", "token")
+
+        self.assertEqual({"username": "user@domain.com", "password": "token"}, self.store.get("Facebook"))
+
+    def test_get_missing_site(self):
+        self.assertIsNone(self.store.get("Facebook"))
+
+    def test_put_overwrites_existing_account(self):
+        self.store.put("Facebook", "user@domain.com", "old")
+        self.store.put("Facebook", "user@domain.com", "new")
+
+        self.assertEqual({"username": "user@domain.com", "password": "new"}, self.store.get("Facebook"))
+        self.assertEqual(1, len(self.store))
+
+    def test_several_accounts_per_site(self):
+        self.store.put("Facebook", "work@domain.com", "work")
+        self.store.put("Facebook", "home@domain.com", "home")
+        self.store.put("Google", "work@domain.com", "google")
+
+        self.assertEqual({"username": "home@domain.com", "password": "home"}, self.store.get("Facebook"))
+        self.assertEqual("work", self.store.get("Facebook", "work@domain.com")["password"])
+        self.assertIsNone(self.store.get("Facebook", "other@domain.com"))
+        self.assertEqual([("Facebook", "home@domain.com"), ("Facebook", "work@domain.com"),
+                          ("Google", "work@domain.com")], list(self.store.keys()))
+        self.assertEqual(["Facebook", "Google"], list(self.store.sites()))
+        self.assertEqual(1, self.store.delete("Facebook", "home@domain.com"))
+        self.assertEqual(2, len(self.store))
+
+    def test_entries(self):
+        work: int = self.store.add_entry("Facebook", "work@domain.com", "work", tags=["work", " social ", ""],
+                                         notes="Team page")
+        home: int = self.store.add_entry("Facebook", "home@domain.com", "home")
+        self.store.put("Google", "work@domain.com", "google")
+        entry: Entry = self.store.get_entry(work)
+
+        self.assertEqual((work, "Facebook", "work@domain.com", "work", ("social", "work"), "Team page"), entry[:6])
+        self.assertEqual(["home@domain.com", "work@domain.com"],
+                         [found.username for found in self.store.find(site="Facebook")])
+        self.assertEqual(["Facebook", "Google"], [found.site for found in self.store.find(username="work@domain.com")])
+        self.assertEqual([work], [found.entry_id for found in self.store.find(site="Facebook", tag="work")])
+        self.assertEqual(["social", "work"], self.store.tags())
+
+        # ASSERT: Replacing the account keeps its ID and creation time
+        self.assertEqual(work, self.store.add_entry("Facebook", "work@domain.com", "changed"))
+        self.assertEqual(entry.created, self.store.get_entry(work).created)
+        self.assertEqual(((), ""), self.store.get_entry(work)[4:6])
+
+        self.assertTrue(self.store.update_entry(home, username="personal@domain.com", tags=["personal"]))
+        self.assertEqual(("personal@domain.com", "home", ("personal",)), self.store.get_entry(home)[2:5])
+        self.assertGreaterEqual(self.store.get_entry(home).modified, self.store.get_entry(home).created)
+        self.assertFalse(self.store.update_entry(9999, notes="missing"))
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.store.update_entry(home, username="work@domain.com")
+
+        self.assertTrue(self.store.delete_entry(home))
+        self.assertFalse(self.store.delete_entry(home))
+        self.assertIsNone(self.store.get_entry(home))
+        self.assertEqual([], self.store.find(tag="personal"))
+        self.assertEqual([], self.store.tags())
+
+    def test_migrates_site_keyed_schema(self):
+        self.store.close()
+        db_path: str = os.path.join(self.temp_dir.name, "Legacy.db")
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE creds (site TEXT PRIMARY KEY NOT NULL, username TEXT NOT NULL, "
+                         "password TEXT NOT NULL) WITHOUT ROWID")
+            conn.executemany("INSERT INTO creds VALUES (?, ?, ?)", [("b", "user2", "2"), ("a", "user1", "1")])
+            conn.execute("PRAGMA user_version = 1")
+
+        conn.close()
+        self.store = SqliteCredentialStore(db_path)
+
+        self.assertEqual([("a", {"username": "user1", "password": "1"}), ("b", {"username": "user2", "password": "2"})],
+                         list(self.store.items()))
+        self.assertEqual(["a", "b"], [entry.site for entry in self.store.find(username="user1")
+                                      + self.store.find(username="user2")])
+        self.store.put("a", "user3", "3")
+        self.assertEqual(3, len(self.store))
+
+    def test_delete(self):
+        self.store.put("Facebook", "user@domain.com", "token")
+
+        self.assertTrue(self.store.delete("Facebook"))
+        self.assertFalse(self.store.delete("Facebook"))
+        self.assertIsNone(self.store.get("Facebook"))
+
+    def test_items_sorted_by_site(self):
+        self.store.put("b", "user", "2")
+        self.store.put("a", "user", "1")
+
+        self.assertEqual(["a", "b"], [site for site, _ in self.store.items()])
+
+    @patch("Application.Utils.CredentialStore.ITER_BATCH", 2)
+    def test_items_pages_through_batches(self):
+        for site in ["e", "d", "a", "c", "b"]:
+            self.store.put(site, "user", site)
+
+        self.assertEqual(["a", "b", "c", "d", "e"], [site for site, _ in self.store.items()])
+
+    def test_page(self):
+        for site in ["d", "a", "c", "b"]:
+            self.store.put(site, "user", site)
+
+        self.assertEqual(["b", "c"], [site for site, _ in self.store.page(1, 2)])
+        self.assertEqual(["d"], [site for site, _ in self.store.page(3, 10)])
+
+    def test_put_many(self):
+        self.store.put("a", "user1", "0")
+        self.store.put_many([("a", "user1", "1"), ("b", "user2", "2")])
+
+        self.assertEqual({"username": "user1", "password": "1"}, self.store.get("a"))
+        self.assertEqual(2, len(self.store))
+
+    @patch("Application.Utils.CredentialStore.ITER_BATCH", 2)
+    def test_get_many_in_chunks(self):
+        self.store.put_many((site, "user", site) for site in ["a", "b", "c", "d", "e"])
+
+        self.assertEqual(["a", "c", "e"], sorted(self.store.get_many(["a", "c", "missing", "e"])))
+        self.assertEqual({}, self.store.get_many([]))
+
+    def test_delete_many(self):
+        self.store.put_many([("a", "user", "1"), ("b", "user", "2"), ("c", "user", "3")])
+
+        self.assertEqual(2, self.store.delete_many(["a", "c", "missing"]))
+        self.assertEqual(["b"], list(self.store.sites()))
+
+    def test_transaction_commits(self):
+        with self.store.transaction():
+            self.store.put("a", "user", "1")
+            self.store.put("b", "user", "2")
+
+        self.assertEqual(2, len(self.store))
+
+    def test_transaction_rolls_back_on_error(self):
+        self.store.put("a", "user", "1")
+
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                self.store.put("b", "user", "2")
+                self.store.delete("a")
+                raise RuntimeError("abort")
+
+        self.assertIsNotNone(self.store.get("a"))
+        self.assertIsNone(self.store.get("b"))
+
+    def test_data_persists_after_reopen(self):
+        self.store.put("Facebook", "user@domain.com", "token")
+        self.store.close()
+
+        reopened: SqliteCredentialStore = SqliteCredentialStore(self.db_path)
+        self.assertEqual("token", reopened.get("Facebook")["password"])
+        reopened.close()
+
+    def test_migrates_legacy_json_once(self):
+        self.write_legacy_json({"Facebook": {"username": "user@domain.com", "password": "token"}})
+        db_path: str = os.path.join(self.temp_dir.name, "Migrated.db")
+
+        store: SqliteCredentialStore = SqliteCredentialStore(db_path, legacy_json=self.json_path)
+        self.assertEqual("token", store.get("Facebook")["password"])
+        store.delete("Facebook")
+        store.close()
+
+        reopened: SqliteCredentialStore = SqliteCredentialStore(db_path, legacy_json=self.json_path)
+        self.assertIsNone(reopened.get("Facebook"))
+        reopened.close()
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+
+class TestJsonCredentialStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_path: str = os.path.join(self.temp_dir.name, "Creds.json")
+        self.store: JsonCredentialStore = JsonCredentialStore(self.json_path)
+
+    def read_file(self) -> dict:
+        with open(self.json_path, "r") as file:
+            return json.load(file)
+
+    def test_put_writes_file(self):
+        self.store.put("Facebook", "user@domain.com", "token")
+
+        self.assertEqual({"Facebook": {"username": "user@domain.com", "password": "token"}}, self.read_file())
+
+    def test_page(self):
+        for site in ["c", "a", "b"]:
+            self.store.put(site, "user", site)
+
+        self.assertEqual(["b", "c"], [site for site, _ in self.store.page(1, 2)])
+
+    def test_transaction_writes_once_on_commit(self):
+        with self.store.transaction():
+            self.store.put("a", "user", "1")
+            self.assertFalse(os.path.exists(self.json_path))
+            self.store.put("b", "user", "2")
+
+        self.assertEqual(["a", "b"], sorted(self.read_file()))
+
+    def test_transaction_rolls_back_on_error(self):
+        self.store.put("a", "user", "1")
+
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                self.store.put("b", "user", "2")
+                raise RuntimeError("abort")
+
+        self.assertIsNone(self.store.get("b"))
+        self.assertEqual(["a"], sorted(self.read_file()))
+
+    def test_failed_save_keeps_previous_file(self):
+        self.store.put("a", "user", "1")
+
+        with patch("Application.Utils.CredentialStore.os.fsync", side_effect=OSError("disk full")):
+            self.assertRaises(OSError, self.store.put, "b", "user", "2")
+
+        self.assertEqual(["a"], sorted(self.read_file()))
+        self.assertEqual(["Creds.json"], os.listdir(self.temp_dir.name))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+
+class TestSqliteCrashSafety(unittest.TestCase):
+    """
+    Kills a writer process at arbitrary points and checks that the database always reopens in the state of its
+    last complete commit.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.random: random.Random = random.Random(1234)
+
+    def test_writer_killed_at_random_points(self):
+        env: dict[str, str] = dict(os.environ, PYTHONPATH=REPO_ROOT)
+
+        for attempt in range(5):
+            path: str = os.path.join(self.temp_dir.name, f"Killed{attempt}.db")
+            writer = subprocess.Popen([sys.executable, "-c", WRITER_SCRIPT, path], env=env,
+                                      stdout=subprocess.PIPE, text=True)
+            writer.stdout.readline()
+            time.sleep(self.random.uniform(0.05, 0.3))
+            writer.kill()
+            writer.wait()
+            writer.stdout.close()
+
+            store: SqliteCredentialStore = SqliteCredentialStore(path)
+            entries: dict = dict(store.items())
+
+            self.assertEqual("ok", store._conn.execute("PRAGMA integrity_check").fetchone()[0])
+            # ASSERT: Exactly the entries of the commits that completed, with nothing half-applied
+            self.assertEqual({f"site{index:06}": {"username": "user", "password": str(index)}
+                              for index in range(len(entries))}, entries)
+            # ASSERT: Transactions start at every seventh index, so a torn one would leave a count of 7n + 1
+            self.assertNotEqual(1, len(entries) % 7)
+            self.assertEqual([entry.site for entry in store.find(tag="pair")],
+                             [f"site{index + 1:06}" for index in range(0, len(entries), 7) if index + 1 < len(entries)])
+            store.close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
@@ -1,16 +1,26 @@
+import io
 import os.path
+import tempfile
 import unittest
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 
+from cryptography.fernet import Fernet
+
+from Application.Utils.CredentialStore import SqliteCredentialStore
 from Application.Utils.HelperFunctions import *
+from Application.Utils.KeyDerivation import KdfParams, derive_key
+from Application.Utils.KeyRotation import RotationResult
+from Application.Utils.VaultSession import VaultLockedError
 
 FUNCTIONS_PATH = "Application.Utils.HelperFunctions"
+KDF_PATH = "Application.Utils.KeyDerivation"
+VAULT_PATH = "Application.Utils.Vault"
 
 
 class TestHelperFunctions(unittest.TestCase):
 
     def assert_open_error(self, mock_get_passwords, mock_open_file, mock_logging, actual):
-        mock_get_passwords.assert_called_once()
+        mock_get_passwords.assert_not_called()
         mock_open_file.assert_called_once()
         mock_logging.assert_called_once()
         self.assertFalse(actual)
@@ -44,6 +54,11 @@ class TestHelperFunctions(unittest.TestCase):
 
         self.assertFalse(is_password_valid(test_password))
 
+    def test_is_password_valid_trailing_newline(self):
+        test_password: str = "validPassword123!\n"
+
+        self.assertFalse(is_password_valid(test_password))
+
     def test_is_password_valid_only_letters(self):
         test_password: str = "vAlIdPaSsWoRd"
 
@@ -128,23 +143,81 @@ class TestHelperFunctions(unittest.TestCase):
         actual: bool = verify_password("", hashed_password)
         self.assertFalse(actual)
 
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps({"settings": {"autofill": "enabled"}}))
-    def test_autofill_valid(self, mock_file):
+    def use_settings(self, data: dict | None) -> str:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.addCleanup(set_settings, None)
+        path: str = os.path.join(temp_dir.name, "Settings.json")
+
+        if data is not None:
+            with open(path, "w") as file:
+                json.dump(data, file)
+
+        set_settings(Settings(path, save_delay=0))
+        return path
+
+    def test_autofill_valid(self):
+        self.use_settings({"settings": {"autofill": "enabled"}})
+
         expected: str = "enabled"
         actual: str = autofill()
 
-        mock_file.assert_called_once()
         self.assertEqual(expected, actual)
 
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps({"settings": {"NotSettings": "value"}}))
-    def test_autofill_not_setup_yet(self, mock_file):
+    def test_autofill_not_setup_yet(self):
+        self.use_settings({"settings": {"NotSettings": "value"}})
 
         result = autofill()
-        mock_file.assert_called_once()
         self.assertIsNone(result)
 
-    @patch(f"{FUNCTIONS_PATH}.get_all_passwords", return_value=None)
-    def test_export_passwords_none_creds(self, mock_get_passwords):
+    def test_create_autofill(self):
+        path: str = self.use_settings({"app_password": {"password": "hash"}})
+
+        self.assertTrue(create_autofill("user@example.com"))
+        self.assertEqual("user@example.com", autofill())
+        get_settings().flush()
+
+        with open(path, "r") as file:
+            self.assertEqual({"app_password": {"password": "hash"}, "settings": {"autofill": "user@example.com"}},
+                             json.load(file))
+
+    @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
+    def test_create_autofill_no_settings_file(self, mock_logging):
+        self.use_settings(None)
+
+        self.assertFalse(create_autofill("user@example.com"))
+        mock_logging.assert_called_once()
+
+    @patch("Application.Utils.Settings.log_error_and_method")
+    @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
+    def test_create_autofill_unreadable_settings_file(self, mock_logging, _mock_settings_logging):
+        path: str = self.use_settings(None)
+
+        with open(path, "wb") as file:
+            file.write(b'{"app_password": {"password": "hash"},')
+
+        get_settings().reload()
+
+        self.assertFalse(create_autofill("user@example.com"))
+        mock_logging.assert_called_once()
+        get_settings().flush()
+
+        with open(path, "rb") as file:
+            self.assertEqual(b'{"app_password": {"password": "hash"},', file.read())
+
+    @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
+    def test_get_password_policy(self, mock_logging):
+        self.use_settings({"password_policies": {"*": {"length": 20}, "bank.com": {"length": 12, "symbols": "-"},
+                                                 "broken.com": {"length": 2}}})
+
+        self.assertEqual(PasswordPolicy(length=12, symbols="-"), get_password_policy("Login.Bank.com"))
+        self.assertEqual(PasswordPolicy(length=20), get_password_policy("other.com"))
+        self.assertEqual(PasswordPolicy(length=20), get_password_policy("broken.com"))
+        mock_logging.assert_called_once()
+        self.assertTrue(all(len(password) == 12 for password in generate_passwords("bank.com", 100)))
+
+    @patch(f"{FUNCTIONS_PATH}.iter_all_passwords", side_effect=sqlite3.Error)
+    def test_export_passwords_store_error(self, mock_get_passwords):
 
         actual: bool = export_passwords()
         does_file_exists: bool = os.path.exists(self.export_file_path)
@@ -153,7 +226,7 @@ class TestHelperFunctions(unittest.TestCase):
         self.assertFalse(actual)
         self.assertFalse(does_file_exists)
 
-    @patch(f"{FUNCTIONS_PATH}.get_all_passwords", return_value={})
+    @patch(f"{FUNCTIONS_PATH}.iter_all_passwords", return_value=iter([]))
     @patch("builtins.open", side_effect=FileNotFoundError)
     @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
     def test_export_passwords_file_not_found(self, mock_logging, mock_open_file, mock_get_passwords):
@@ -161,7 +234,7 @@ class TestHelperFunctions(unittest.TestCase):
 
         self.assert_open_error(mock_get_passwords, mock_open_file, mock_logging, actual)
 
-    @patch(f"{FUNCTIONS_PATH}.get_all_passwords", return_value={})
+    @patch(f"{FUNCTIONS_PATH}.iter_all_passwords", return_value=iter([]))
     @patch("builtins.open", side_effect=KeyError)
     @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
     def test_export_passwords_key_error(self, mock_logging, mock_open_file, mock_get_passwords):
@@ -169,7 +242,7 @@ class TestHelperFunctions(unittest.TestCase):
 
         self.assert_open_error(mock_get_passwords, mock_open_file, mock_logging, actual)
 
-    @patch(f"{FUNCTIONS_PATH}.get_all_passwords", return_value={})
+    @patch(f"{FUNCTIONS_PATH}.iter_all_passwords", return_value=iter([]))
     @patch("builtins.open", side_effect=JSONDecodeError("Expecting", "doc", 0))
     @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
     def test_export_passwords_json_error(self, mock_logging, mock_open_file, mock_get_passwords):
@@ -177,7 +250,17 @@ class TestHelperFunctions(unittest.TestCase):
 
         self.assert_open_error(mock_get_passwords, mock_open_file, mock_logging, actual)
 
-    @patch(f"{FUNCTIONS_PATH}.get_all_passwords", return_value={"Facebook": {"Password": "password"}})
+    @patch(f"{FUNCTIONS_PATH}.iter_all_passwords", return_value=iter([]))
+    @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
+    def test_export_passwords_unknown_format(self, mock_logging, mock_get_passwords):
+        actual: bool = export_passwords("xml")
+
+        self.assertFalse(actual)
+        mock_logging.assert_called_once()
+        mock_get_passwords.assert_not_called()
+
+    @patch(f"{FUNCTIONS_PATH}.iter_all_passwords",
+           return_value=iter([("Facebook", {"username": "user", "password": "password"})]))
     def test_export_passwords_successful(self, mock_get_passwords):
         actual: bool = export_passwords()
         was_file_created: bool = os.path.exists(self.export_file_path)
@@ -186,6 +269,304 @@ class TestHelperFunctions(unittest.TestCase):
         self.assertTrue(actual)
         self.assertTrue(was_file_created)
 
+        with open(self.export_file_path, "r") as file:
+            self.assertEqual({"Facebook": [{"username": "user", "password": "password"}]}, json.load(file))
+
+    def test_write_json_matches_json_dumps(self):
+        creds: dict = {"a": [{"username": "admin", "password": "pwd\"1"}, {"username": "user1", "password": "1"}],
+                       "b": [{"username": "user2", "password": "2"}]}
+
+        for data in (creds, {}):
+            buffer = io.StringIO()
+            write_json(buffer, iter([(site, account) for site, accounts in data.items() for account in accounts]))
+            self.assertEqual(json.dumps(data, indent=4), buffer.getvalue())
+
+    def test_write_jsonl(self):
+        buffer = io.StringIO()
+        write_jsonl(buffer, iter([("a", {"username": "user1", "password": "pwd1"})]))
+
+        self.assertEqual('{"site": "a", "username": "user1", "password": "pwd1"}\n', buffer.getvalue())
+
+    def test_write_csv(self):
+        buffer = io.StringIO()
+        write_csv(buffer, iter([("a", {"username": "user1", "password": "pwd,1"})]))
+
+        self.assertEqual('site,username,password\r\na,user1,"pwd,1"\r\n', buffer.getvalue())
+
+    def test_iter_all_passwords_batches(self):
+        unlock_session(Fernet.generate_key())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+
+            for index in range(5):
+                store_creds(f"site{index}", f"user{index}", encrypt_password(f"pwd{index}"))
+            store_creds("site5", "user5", "corrupt")
+
+            expected: list = [(f"site{i}", {"username": f"user{i}", "password": f"pwd{i}"}) for i in range(5)]
+            self.assertEqual(expected, list(iter_all_passwords(batch_size=2)))
+            set_store(None)
+        lock_session()
+
+    def test_check_password_strength(self):
+        unlock_session(Fernet.generate_key())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+            passwords: list[str] = ["Password123!", "xQ7#k2Lp9!vR4&hW", "aaa"]
+
+            for index, password in enumerate(passwords):
+                store_creds(f"site{index}", "user", encrypt_password(password))
+
+            store_creds("site0", "admin", encrypt_password("aaa"))
+
+            reports: dict[tuple[str, str], StrengthReport] = check_password_strength(batch_size=2)
+            expected: dict = {(f"site{index}", "user"): analyze(password) for index, password in enumerate(passwords)}
+            self.assertEqual({("site0", "admin"): analyze("aaa"), **expected}, reports)
+            self.assertEqual(4, reports[("site1", "user")].score)
+            set_store(None)
+        lock_session()
+
+    @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
+    def test_audit_vault_store_error(self, mock_logging):
+        with patch.object(Vault, "audit", side_effect=sqlite3.Error):
+            self.assertIsNone(audit_vault())
+
+        mock_logging.assert_called_once()
+
+    @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
+    def test_import_breach_list(self, mock_logging):
+        data_dir: str = os.path.dirname(self.use_vault_files())
+        source: str = os.path.join(data_dir, "breaches.txt")
+
+        with open(source, "w") as file:
+            file.write("5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8:3861493\nnot a hash\n")
+
+        self.assertIsNone(breach_count("password"))
+        self.assertIsNone(import_breach_list(source))
+        mock_logging.assert_called_once()
+
+        with open(source, "w") as file:
+            file.write("5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8:3861493\n")
+
+        self.assertEqual(1, import_breach_list(source))
+        self.assertEqual(3861493, breach_count("password"))
+        self.assertEqual(0, breach_count("ValidPassword123!"))
+
+    def use_vault_files(self) -> str:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        set_vault(Vault(temp_dir.name, settings=Settings(os.path.join(temp_dir.name, "Settings.json"), save_delay=0)))
+        self.addCleanup(set_vault, None)
+        patches = [patch(f"{VAULT_PATH}.BCRYPT_ROUNDS", 4),
+                   patch(f"{VAULT_PATH}.calibrate", side_effect=lambda target: KdfParams(10, 8, 1, "c2FsdHNhbHQ="))]
+
+        for active_patch in patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+
+        self.addCleanup(lock_session)
+        return os.path.join(temp_dir.name, "secret.key")
+
+    def test_create_and_open_vault(self):
+        self.use_vault_files()
+        encrypted: str = create_vault("ValidPassword123!").encrypt("password")
+        lock_session()
+
+        self.assertFalse(open_vault("WrongPassword123!"))
+        self.assertFalse(get_session().is_unlocked)
+        self.assertTrue(open_vault("ValidPassword123!"))
+        self.assertEqual("password", decrypt_password(encrypted))
+        self.assertNotIn("password", json.dumps(get_settings().get("vault", "wrapped_key")))
+
+    def test_open_vault_migrates_legacy_key(self):
+        key_path: str = self.use_vault_files()
+        legacy_key: bytes = Fernet.generate_key()
+        encrypted: str = Fernet(legacy_key).encrypt(b"password").decode()
+
+        with open(key_path, "wb") as key_file:
+            key_file.write(legacy_key)
+
+        get_settings().set("app_password", "password", hash_password("ValidPassword123!"), immediate=True)
+
+        self.assertTrue(open_vault("ValidPassword123!"))
+        self.assertFalse(os.path.exists(key_path))
+        self.assertEqual("password", decrypt_password(encrypted))
+
+        lock_session()
+        self.assertTrue(open_vault("ValidPassword123!"))
+        self.assertEqual("password", decrypt_password(encrypted))
+
+    def test_open_vault_derives_key_once(self):
+        self.use_vault_files()
+        create_vault("ValidPassword123!")
+        lock_session()
+
+        with patch(f"{KDF_PATH}.derive_key", wraps=derive_key) as mock_derive:
+            open_vault("ValidPassword123!")
+            [decrypt_password(encrypt_password(f"password{i}")) for i in range(5)]
+
+        mock_derive.assert_called_once()
+
+    def use_vault_store(self) -> SqliteCredentialStore:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        store: SqliteCredentialStore = SqliteCredentialStore(os.path.join(temp_dir.name, "Creds.db"))
+        set_store(store)
+        self.addCleanup(set_store, None)
+        return store
+
+    def test_rotate_vault_key(self):
+        self.use_vault_files()
+        store: SqliteCredentialStore = self.use_vault_store()
+        create_vault("ValidPassword123!")
+        old_wrapped: str = get_settings().get("vault", "wrapped_key")
+
+        for index in range(5):
+            store_creds(f"site{index}", f"user{index}", encrypt_password(f"pwd{index}"))
+        old_tokens: dict = dict(store.items())
+
+        self.assertIsNone(rotate_vault_key("WrongPassword123!"))
+        result: RotationResult = rotate_vault_key("ValidPassword123!")
+
+        self.assertEqual(5, result.rotated)
+        self.assertFalse(is_rotation_pending())
+        self.assertFalse(get_session().is_rotating)
+        self.assertNotEqual(old_wrapped, get_settings().get("vault", "wrapped_key"))
+        self.assertTrue(all(old_tokens[site] != creds for site, creds in store.items()))
+
+        lock_session()
+        self.assertTrue(open_vault("ValidPassword123!"))
+        self.assertEqual({"username": "user3", "password": "pwd3"}, find_creds("site3"))
+
+    def test_interrupted_rotation_resumes_after_login(self):
+        self.use_vault_files()
+        self.use_vault_store()
+        create_vault("ValidPassword123!")
+
+        for index in range(5):
+            store_creds(f"site{index}", f"user{index}", encrypt_password(f"pwd{index}"))
+
+        with patch(f"{VAULT_PATH}.rotate_entries", side_effect=sqlite3.OperationalError("disk I/O error")), \
+                patch(f"{FUNCTIONS_PATH}.log_error_and_method"):
+            self.assertIsNone(rotate_vault_key("ValidPassword123!"))
+
+        self.assertTrue(is_rotation_pending())
+        store_creds("site5", "user5", encrypt_password("pwd5"))
+        lock_session()
+
+        # ASSERT: Entries under either key are readable while the rotation is pending
+        self.assertTrue(open_vault("ValidPassword123!"))
+        self.assertTrue(get_session().is_rotating)
+        self.assertEqual({"username": "user0", "password": "pwd0"}, find_creds("site0"))
+        self.assertEqual({"username": "user5", "password": "pwd5"}, find_creds("site5"))
+
+        self.assertEqual(6, resume_key_rotation().rotated)
+        self.assertFalse(is_rotation_pending())
+        self.assertEqual(6, len(get_all_passwords()))
+
+    def test_session_reuses_vault_key(self):
+        unlock_session(Fernet.generate_key())
+        encrypted: list[str] = [encrypt_password(f"password{i}") for i in range(5)]
+        decrypted: list[str] = [decrypt_password(pwd) for pwd in encrypted]
+
+        self.assertEqual([f"password{i}" for i in range(5)], decrypted)
+        lock_session()
+
+    def test_locked_session_raises(self):
+        unlock_session(Fernet.generate_key())
+        encrypt_password("password")
+        lock_session()
+
+        with self.assertRaises(VaultLockedError):
+            encrypt_password("password")
+
+    def test_store_and_find_creds(self):
+        unlock_session(Fernet.generate_key())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+            store_creds("Facebook", "user@domain.com", encrypt_password("password"))
+
+            self.assertEqual({"username": "user@domain.com", "password": "password"}, find_creds("Facebook"))
+            set_store(None)
+        lock_session()
+
+    def test_find_secret(self):
+        unlock_session(Fernet.generate_key())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+            store_creds("Facebook", "user@domain.com", encrypt_password("password"))
+
+            with find_secret("Facebook") as secret:
+                self.assertEqual("password", secret.reveal())
+
+            self.assertEqual(0, len(secret))
+            self.assertIsNone(find_secret("Twitter"))
+            set_store(None)
+        lock_session()
+
+    @patch(f"{FUNCTIONS_PATH}.log_error_and_method")
+    def test_find_creds_missing_site(self, mock_logging):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+
+            self.assertIsNone(find_creds("Facebook"))
+            mock_logging.assert_called_once()
+            set_store(None)
+
+    def test_get_all_passwords(self):
+        unlock_session(Fernet.generate_key())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+            store_creds("b", "user2", encrypt_password("pwd2"))
+            store_creds("a", "user1", encrypt_password("pwd1"))
+            store_creds("a", "admin", encrypt_password("pwd3"))
+
+            expected: list = [("a", {"username": "admin", "password": "pwd3"}),
+                              ("a", {"username": "user1", "password": "pwd1"}),
+                              ("b", {"username": "user2", "password": "pwd2"})]
+            self.assertEqual(expected, get_all_passwords())
+            set_store(None)
+        lock_session()
+
+    def test_get_all_passwords_skips_corrupt_entry(self):
+        unlock_session(Fernet.generate_key())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+            store_creds("a", "user1", encrypt_password("pwd1"))
+            store_creds("b", "user2", "corrupt")
+
+            self.assertEqual([("a", {"username": "user1", "password": "pwd1"})], get_all_passwords())
+            set_store(None)
+        lock_session()
+
+    def test_several_accounts_per_site(self):
+        self.use_vault_files()
+        create_vault("ValidPassword123!")
+        store_creds("GitHub", "work", encrypt_password("work password"))
+        store_creds("GitHub", "home", encrypt_password("home password"))
+        entry_id: int = add_entry("GitHub", "bot", "bot password", tags=["ci"], notes="Deploy key owner")
+
+        self.assertEqual(["bot", "home", "work"], [entry.username for entry in find_entries("GitHub")])
+        self.assertEqual({"username": "work", "password": "work password"}, find_creds("GitHub", "work"))
+        self.assertEqual("bot", find_creds("GitHub")["username"])
+        self.assertEqual([entry_id], [entry.entry_id for entry in find_entries(tag="ci")])
+
+        self.assertTrue(update_entry(entry_id, site="GitLab", password="new bot password"))
+        self.assertEqual(["GitHub", "GitLab"], search_sites("git"))
+        self.assertEqual("new bot password", find_creds("GitLab", "bot")["password"])
+        self.assertTrue(delete_entry(entry_id))
+        self.assertEqual(["GitHub"], search_sites("git"))
+        self.assertFalse(delete_entry(entry_id))
+
+    def test_search_sites_updated_by_store_creds(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            set_store(SqliteCredentialStore(os.path.join(temp_dir, "Creds.db")))
+            store_creds("GitHub", "user", "token")
+
+            self.assertEqual(["GitHub"], search_sites("git"))
+            store_creds("Gitlab", "user", "token")
+            self.assertEqual(["GitHub", "Gitlab"], search_sites(" git "))
+            set_store(None)
+
     def tearDown(self):
 
         if os.path.exists(self.export_file_path):
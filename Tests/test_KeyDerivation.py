@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from Application.Utils.KeyDerivation import KdfParams, derive_key, calibrate, wrap_key, unwrap_key, MIN_LOG2_N, \
+    MAX_LOG2_N
+
+KDF_PATH = "Application.Utils.KeyDerivation"
+PARAMS = KdfParams(10, 8, 1, "c2FsdHNhbHRzYWx0c2FsdA==")
+
+
+class TestKeyDerivation(unittest.TestCase):
+
+    def test_derive_key_is_deterministic(self):
+        self.assertEqual(derive_key("password", PARAMS), derive_key("password", PARAMS))
+        self.assertEqual(32, len(derive_key("password", PARAMS)))
+
+    def test_derive_key_depends_on_salt_and_cost(self):
+        key: bytearray = derive_key("password", PARAMS)
+
+        self.assertNotEqual(key, derive_key("password", PARAMS._replace(salt="b3RoZXJzYWx0")))
+        self.assertNotEqual(key, derive_key("password", PARAMS._replace(log2_n=11)))
+
+    def test_wrap_and_unwrap(self):
+        vault_key: bytes = Fernet.generate_key()
+        wrapped: str = wrap_key(vault_key, "ValidPassword123!", PARAMS)
+
+        self.assertNotIn(vault_key.decode(), wrapped)
+        self.assertEqual(vault_key, unwrap_key(wrapped, "ValidPassword123!", PARAMS))
+
+    def test_unwrap_wrong_password(self):
+        wrapped: str = wrap_key(Fernet.generate_key(), "ValidPassword123!", PARAMS)
+
+        with self.assertRaises(InvalidToken):
+            unwrap_key(wrapped, "WrongPassword123!", PARAMS)
+
+    @patch(f"{KDF_PATH}.derive_key")
+    @patch(f"{KDF_PATH}.time.perf_counter", side_effect=[0.0, 0.05])
+    def test_calibrate_scales_to_target(self, mock_perf_counter, mock_derive_key):
+        params: KdfParams = calibrate(target_seconds=0.4)
+
+        # ASSERT: 0.05s at the minimum cost, so 8x the cost reaches 0.4s
+        self.assertEqual(MIN_LOG2_N + 3, params.log2_n)
+        mock_derive_key.assert_called_once()
+
+    @patch(f"{KDF_PATH}.derive_key")
+    @patch(f"{KDF_PATH}.time.perf_counter", side_effect=[0.0, 0.00001, 0.0, 10.0])
+    def test_calibrate_clamps_cost(self, mock_perf_counter, mock_derive_key):
+        self.assertEqual(MAX_LOG2_N, calibrate(target_seconds=1).log2_n)
+        self.assertEqual(MIN_LOG2_N, calibrate(target_seconds=1).log2_n)
+
+    def test_calibrate_uses_new_salt(self):
+        with patch(f"{KDF_PATH}.derive_key"):
+            self.assertNotEqual(calibrate().salt, calibrate().salt)
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from cryptography.fernet import Fernet
+
+from Application.Utils.CredentialStore import JsonCredentialStore, SqliteCredentialStore
+from Application.Utils.KeyRotation import RotationResult, rotate_entries
+from Application.Utils.VaultSession import VaultSession
+
+ROTATION_PATH = "Application.Utils.KeyRotation"
+
+
+class TestKeyRotation(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.old_key: bytes = Fernet.generate_key()
+        self.new_key: bytes = Fernet.generate_key()
+        self.store: SqliteCredentialStore = SqliteCredentialStore(os.path.join(self.temp_dir.name, "Creds.db"))
+        self.session: VaultSession = VaultSession(self.old_key)
+        self.store.put_many((f"site{i:02}", f"user{i}", self.session.encrypt(f"pwd{i}")) for i in range(10))
+        self.session.unlock(self.new_key, [self.old_key])
+
+    def stored_under_new_key(self) -> dict[str, tuple[str, str]]:
+        new_only: VaultSession = VaultSession(self.new_key)
+        return {site: (creds["username"], new_only.decrypt(creds["password"])) for site, creds in self.store.items()}
+
+    def test_rotate_entries(self):
+        progress = MagicMock()
+        result: RotationResult = rotate_entries(self.store, self.session, progress=progress, batch_size=4)
+
+        self.assertEqual((10, 0), result[:2])
+        self.assertGreater(result.entries_per_second, 0)
+        self.assertEqual({f"site{i:02}": (f"user{i}", f"pwd{i}") for i in range(10)}, self.stored_under_new_key())
+        self.assertEqual([(4, 10), (8, 10), (10, 10)], [call.args for call in progress.call_args_list])
+
+    def test_rotate_json_store(self):
+        store: JsonCredentialStore = JsonCredentialStore(os.path.join(self.temp_dir.name, "Creds.json"))
+        store.put_many((site, creds["username"], creds["password"]) for site, creds in self.store.items())
+
+        self.assertEqual(10, rotate_entries(store, self.session, batch_size=3).rotated)
+        self.assertEqual(["pwd0"], VaultSession(self.new_key).decrypt_many([store.get("site00")["password"]]))
+        store.close()
+
+    def test_resume_from_checkpoint(self):
+        checkpoints: list[list[str]] = []
+        rotated_tokens: list[str] = []
+        rotate_many = self.session.rotate_many
+
+        def interrupt(key: list[str]) -> None:
+            checkpoints.append(key)
+            raise KeyboardInterrupt
+
+        def count_tokens(tokens):
+            tokens = list(tokens)
+            rotated_tokens.extend(tokens)
+            return rotate_many(tokens)
+
+        with self.assertRaises(KeyboardInterrupt):
+            rotate_entries(self.store, self.session, checkpoint=interrupt, batch_size=4)
+
+        with patch.object(self.session, "rotate_many", side_effect=count_tokens):
+            result: RotationResult = rotate_entries(self.store, self.session, after=checkpoints[-1], batch_size=4)
+
+        self.assertEqual([["site03", "user3"]], checkpoints)
+        self.assertEqual(6, result.rotated)
+        # ASSERT: Entries committed before the interruption are not re-encrypted again
+        self.assertEqual(6, len(rotated_tokens))
+        self.assertEqual(10, len(self.stored_under_new_key()))
+
+    def test_resume_splits_site_accounts(self):
+        self.store.put("site03", "user3b", VaultSession(self.old_key).encrypt("second account"))
+
+        # ASSERT: The first batch of 4 ends between the two accounts on site03
+        self.assertEqual(7, rotate_entries(self.store, self.session, after=["site03", "user3"], batch_size=4).rotated)
+        self.assertEqual("second account", VaultSession(self.new_key).decrypt(self.store.get("site03", "user3b")
+                                                                              ["password"]))
+        # ASSERT: A bare site checkpointed by an earlier version covers every account on it
+        self.assertEqual(6, rotate_entries(self.store, self.session, after="site03").rotated)
+
+    def test_concurrent_write_is_kept(self):
+        rotate_many = self.session.rotate_many
+
+        def write_during_batch(tokens):
+            rotated: list[str | None] = rotate_many(tokens)
+            self.store.put("site01", "user1", self.session.encrypt("new password"))
+            self.store.delete("site02")
+            return rotated
+
+        with patch.object(self.session, "rotate_many", side_effect=write_during_batch):
+            result: RotationResult = rotate_entries(self.store, self.session, batch_size=4)
+
+        stored: dict[str, tuple[str, str]] = self.stored_under_new_key()
+        self.assertEqual(8, result.rotated)
+        self.assertEqual(("user1", "new password"), stored["site01"])
+        self.assertNotIn("site02", stored)
+
+    @patch(f"{ROTATION_PATH}.logging.warning")
+    def test_undecryptable_entry_left_unchanged(self, mock_logging):
+        self.store.put("corrupt", "user", "corrupt")
+        result: RotationResult = rotate_entries(self.store, self.session)
+
+        self.assertEqual((10, 1), result[:2])
+        self.assertEqual("corrupt", self.store.get("corrupt")["password"])
+        mock_logging.assert_called_once()
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
@@ -0,0 +1,52 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from Application.Utils.LoggingController import JsonFormatter, log_error_and_method, setup_logging, shutdown_logging
+
+CONTROLLER_PATH = "Application.Utils.LoggingController"
+
+
+class TestLoggingController(unittest.TestCase):
+
+    def test_log_error_and_method_names_caller(self):
+        with self.assertLogs(level=logging.WARNING) as logs:
+            log_error_and_method(KeyError("Facebook"))
+
+        self.assertEqual("KeyError occurred in test_log_error_and_method_names_caller: 'Facebook'",
+                         logs.records[0].getMessage())
+        self.assertEqual("test_log_error_and_method_names_caller", logs.records[0].funcName)
+
+    def test_json_formatter(self):
+        record: logging.LogRecord = logging.LogRecord("root", logging.WARNING, "file.py", 10, "Error in %s",
+                                                      ("find_creds",), None, func="find_creds")
+        entry: dict = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual("WARNING", entry["level"])
+        self.assertEqual("Error in find_creds", entry["message"])
+        self.assertEqual("find_creds", entry["function"])
+        self.assertEqual(10, entry["line"])
+
+    def test_setup_logging_writes_through_queue(self):
+        root: logging.Logger = logging.getLogger()
+        handlers: list[logging.Handler] = list(root.handlers)
+        level: int = root.level
+
+        with tempfile.TemporaryDirectory() as temp_dir, patch(f"{CONTROLLER_PATH}.PARENT_DIR", temp_dir):
+            setup_logging(structured=True)
+            log_error_and_method(KeyError("Facebook"))
+            shutdown_logging()
+
+            for handler in root.handlers[len(handlers):]:
+                handler.close()
+            root.handlers = handlers
+            root.setLevel(level)
+
+            with open(os.path.join(temp_dir, "app.log")) as file:
+                entries: list[dict] = [json.loads(line) for line in file]
+
+        self.assertEqual("test_setup_logging_writes_through_queue", entries[-1]["function"])
+        self.assertIn("KeyError occurred in", entries[-1]["message"])
@@ -0,0 +1,98 @@
+import math
+import os
+import string
+import tempfile
+import unittest
+from collections import Counter
+from itertools import product
+from unittest.mock import MagicMock, patch
+
+from Application.Utils.HelperFunctions import is_password_valid
+from Application.Utils.PasswordGenerator import (PassphrasePolicy, PasswordGenerator, PasswordPolicy, PolicyError,
+                                                 policy_from_dict)
+
+GENERATOR_PATH = "Application.Utils.PasswordGenerator"
+
+
+class TestPasswordGenerator(unittest.TestCase):
+
+    def setUp(self):
+        self.generator: PasswordGenerator = PasswordGenerator()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def write_wordlist(self, lines: list[str]) -> str:
+        path: str = os.path.join(self.temp_dir.name, f"words{len(lines)}.txt")
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines))
+
+        return path
+
+    def test_default_policy_passes_app_validator(self):
+        passwords: list[str] = self.generator.generate(PasswordPolicy(), 2000)
+
+        self.assertEqual(2000, len(passwords))
+        self.assertTrue(all(is_password_valid(password) for password in passwords))
+        self.assertEqual({16}, {len(password) for password in passwords})
+
+    def test_bulk_generation_reads_randomness_once(self):
+        random_bytes = MagicMock(side_effect=os.urandom)
+        passwords: list[str] = PasswordGenerator(random_bytes).generate(PasswordPolicy(length=12), 5000)
+
+        self.assertEqual(5000, len(set(passwords)))
+        random_bytes.assert_called_once()
+
+    def test_custom_policy(self):
+        policy: PasswordPolicy = PasswordPolicy(length=10, uppercase=False, symbols="-_", exclude="0o1l")
+        passwords: list[str] = self.generator.generate(policy, 500)
+
+        self.assertTrue(all(policy.validate(password) for password in passwords))
+        self.assertFalse(set("".join(passwords)) & set(string.ascii_uppercase + "!0o1l"))
+        self.assertTrue(all(set(password) & set("-_") for password in passwords))
+
+    def test_characters_are_uniform(self):
+        policy: PasswordPolicy = PasswordPolicy(length=20, require_each=False, symbols="")
+        counts: Counter = Counter("".join(self.generator.generate(policy, 3100)))
+        expected: float = 3100 * 20 / 62
+
+        # ASSERT: A modulo bias would skew the first 256 % 62 characters by about 25%
+        self.assertLess(max(abs(count - expected) / expected for count in counts.values()), 0.15)
+
+    def test_entropy_counts_required_classes(self):
+        policy: PasswordPolicy = PasswordPolicy(length=4, uppercase=False, symbols="!@",
+                                                exclude=string.ascii_lowercase[2:])
+        allowed: int = sum(policy.validate("".join(chars)) for chars in product(policy.alphabet, repeat=4))
+
+        self.assertAlmostEqual(math.log2(allowed), policy.entropy_bits())
+        self.assertAlmostEqual(4 * math.log2(14), policy._replace(require_each=False).entropy_bits())
+
+    def test_invalid_policies(self):
+        for policy in (PasswordPolicy(length=3), PasswordPolicy(lowercase=False, uppercase=False, digits=False,
+                                                                 symbols=""),
+                       PasswordPolicy(symbols="a!"), PasswordPolicy(symbols=" "), PasswordPolicy(exclude="0123456789")):
+            with self.subTest(policy=policy), self.assertRaises(PolicyError):
+                self.generator.generate(policy)
+
+        with self.assertRaises(PolicyError):
+            policy_from_dict({"length": 12, "colour": "red"})
+
+    def test_passphrases(self):
+        wordlist: str = self.write_wordlist([f"1{index:04}\tword{index}" for index in range(300)] + ["word0"])
+        policy: PassphrasePolicy = policy_from_dict({"passphrase": True, "words": 5, "wordlist": wordlist})
+        passphrases: list[str] = self.generator.generate(policy, 200)
+
+        self.assertTrue(all(policy.validate(passphrase) for passphrase in passphrases))
+        self.assertEqual({5}, {len(passphrase.split("-")) for passphrase in passphrases})
+        self.assertAlmostEqual(5 * math.log2(300), policy.entropy_bits())
+
+    def test_missing_wordlist(self):
+        with self.assertRaises(OSError):
+            self.generator.generate(PassphrasePolicy(wordlist=os.path.join(self.temp_dir.name, "missing.txt")))
+
+    def test_default_wordlist_not_bundled(self):
+        missing: str = os.path.join(self.temp_dir.name, "wordlist.txt")
+
+        with patch(f"{GENERATOR_PATH}.DEFAULT_WORDLIST", missing), \
+                self.assertRaisesRegex(PolicyError, "No word list is bundled"):
+            self.generator.generate(PassphrasePolicy(wordlist=missing))
@@ -0,0 +1,79 @@
+import re
+import unittest
+
+from Application.Utils.PasswordStrength import (StrengthAnalyzer, StrengthReport, analyze, analyze_many,
+                                                missing_requirements)
+
+# The pattern `is_password_valid` used before it moved to `missing_requirements`
+LEGACY_PATTERN = r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*])[A-Za-z\d!@#$%^&*]{8,}$"
+
+
+class TestPasswordStrength(unittest.TestCase):
+
+    def test_missing_requirements(self):
+        self.assertEqual((), missing_requirements("validPassword123!"))
+        self.assertEqual(("length", "uppercase", "digit", "symbol"), missing_requirements("short"))
+        self.assertEqual(("characters",), missing_requirements("Valid Password123!"))
+        self.assertEqual(("characters",), missing_requirements("Válido123!xyz"))
+        self.assertEqual(("length", "lowercase", "uppercase", "digit", "symbol"), missing_requirements(""))
+
+    def test_requirements_match_legacy_pattern(self):
+        passwords: list[str] = ["validPassword123!", "validP1!", "validPa", "valid_password123!", "12345678",
+                                "!@#$%^&*(", "ValidPassword\t123!", "UPPER123!", "abcDEF12&", "x" * 64 + "A1!"]
+
+        for password in passwords:
+            with self.subTest(password=password):
+                self.assertEqual(bool(re.match(LEGACY_PATTERN, password)), not missing_requirements(password))
+                self.assertEqual(not missing_requirements(password), analyze(password).is_valid)
+
+    def test_requirements_reject_what_legacy_pattern_let_through(self):
+        # ASSERT: "$" matched before a final line break and "\d" matched any Unicode digit, so the old pattern
+        # accepted characters outside the allowed set
+        for password, missing in (("validPassword123!\n", ("characters",)),
+                                  ("validPassword١٢٣!", ("digit", "characters"))):
+            with self.subTest(password=password):
+                self.assertTrue(re.match(LEGACY_PATTERN, password))
+                self.assertEqual(missing, missing_requirements(password))
+
+    def test_patterns(self):
+        report: StrengthReport = analyze("xxxP@ssw0rd!qwerty987")
+
+        self.assertEqual(("xxx",), report.repeats)
+        self.assertEqual(("qwerty", "987"), report.sequences)
+        self.assertEqual(("P@ssw0rd",), report.words)
+        self.assertEqual(['Avoid common words like "P@ssw0rd".', 'Avoid sequences like "qwerty".',
+                          'Avoid sequences like "987".', 'Avoid repeated characters like "xxx".'], report.problems)
+        # ASSERT: "jkl" is both an alphabet and a keyboard run but is only reported once, inside the longer one
+        self.assertEqual(("jklmn",), analyze("jklmn").sequences)
+
+    def test_scores(self):
+        weak: StrengthReport = analyze("Password123!")
+        strong: StrengthReport = analyze("xQ7#k2Lp9!vR4&hW")
+
+        self.assertLess(weak.entropy_bits, 40)
+        self.assertLessEqual(weak.score, 2)
+        self.assertEqual(4, strong.score)
+        self.assertEqual(((), (), ()), strong[3:])
+
+    def test_batch_matches_single(self):
+        passwords: list[str] = ["", "", "aaaa", "line\nbreak", "abc", "validPassword123!", "ééé", "x", "zyx"]
+
+        self.assertEqual([analyze(password) for password in passwords], analyze_many(passwords))
+        self.assertEqual([], analyze_many([]))
+        self.assertEqual(("aaaa",), analyze_many(passwords)[2].repeats)
+        self.assertEqual(("ééé",), analyze_many(passwords)[6].repeats)
+
+    def test_characters_outside_latin_1(self):
+        passwords: list[str] = ["日本語", "日日日", "abc日本語xyz", "??日日日日"]
+        reports: list[StrengthReport] = analyze_many(passwords)
+
+        # ASSERT: Distinct characters outside latin-1 are not a repeat even though the class lookup sees "???"
+        self.assertEqual([(), ("日日日",), (), ("日日日日",)], [report.repeats for report in reports])
+        self.assertEqual(("abc", "xyz"), reports[2].sequences)
+        self.assertEqual([analyze(password) for password in passwords], reports)
+
+    def test_custom_words(self):
+        analyzer: StrengthAnalyzer = StrengthAnalyzer(["correct", "horse", "battery", "staple", "12ab"])
+
+        self.assertEqual(("correct", "Horse", "BATTERY"), analyzer.analyze("correctHorseBATTERY").words)
+        self.assertEqual((), analyzer.analyze("12ab").words)
@@ -0,0 +1,68 @@
+import unittest
+
+from Application.Utils.SearchIndex import SiteIndex, trigrams
+
+
+class TestSiteIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index: SiteIndex = SiteIndex(["Facebook", "GitHub", "Gitlab", "Google", "Netflix", "notes.example.com"])
+
+    def test_trigrams_pad_short_strings(self):
+        self.assertEqual({"  a", " a "}, trigrams("a"))
+
+    def test_contains_is_exact(self):
+        self.assertIn("GitHub", self.index)
+        self.assertNotIn("github", self.index)
+
+    def test_prefix_ignores_case(self):
+        self.assertEqual(["GitHub", "Gitlab"], self.index.prefix("git"))
+
+    def test_prefix_limit(self):
+        self.assertEqual(["GitHub"], self.index.prefix("G", limit=1))
+
+    def test_prefix_no_match(self):
+        self.assertEqual([], self.index.prefix("z"))
+
+    def test_fuzzy_ranks_typo(self):
+        self.assertEqual("Facebook", self.index.fuzzy("facebok")[0])
+
+    def test_fuzzy_prefers_substring(self):
+        self.assertEqual("notes.example.com", self.index.fuzzy("example")[0])
+
+    def test_search_prefix_before_fuzzy(self):
+        results: list[str] = self.index.search("net", limit=3)
+
+        self.assertEqual("Netflix", results[0])
+        self.assertIn("notes.example.com", results)
+
+    def test_search_empty_query(self):
+        self.assertEqual([], self.index.search(""))
+
+    def test_add_updates_index(self):
+        self.index.add("Gmail")
+
+        self.assertEqual(["GitHub", "Gitlab", "Gmail"], self.index.prefix("g", limit=3))
+        self.assertEqual(7, len(self.index))
+
+    def test_add_existing_site(self):
+        self.index.add("GitHub")
+
+        self.assertEqual(6, len(self.index))
+
+    def test_add_case_variant(self):
+        self.index.add("github")
+
+        self.assertEqual(["GitHub", "github"], self.index.prefix("github"))
+
+    def test_remove_updates_index(self):
+        self.index.remove("Facebook")
+
+        self.assertEqual([], self.index.prefix("face"))
+        self.assertEqual([], self.index.fuzzy("facebook"))
+        self.assertNotIn("Facebook", self.index)
+
+    def test_remove_missing_site(self):
+        self.index.remove("Twitter")
+
+        self.assertEqual(6, len(self.index))
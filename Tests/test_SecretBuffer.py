@@ -0,0 +1,159 @@
+import base64
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from Application.Utils.SecretBuffer import SecretBuffer, fernet_decrypt_into
+from Application.Utils.VaultSession import VaultSession
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Child process for the memory scan: decrypts one token from stdin, then waits to be scanned
+DECRYPT_SCRIPT = """
+import gc
+import sys
+from Application.Utils.VaultSession import VaultSession
+
+key, token, mode = sys.stdin.readline().split()
+session = VaultSession(key.encode())
+
+if mode == "buffer":
+    with session.decrypt_into(token) as secret:
+        assert len(secret) == 32
+else:
+    password = session.decrypt(token)
+
+gc.collect()
+print("ready", flush=True)
+sys.stdin.read()
+"""
+
+
+def process_memory_contains(pid: int, needle: bytes) -> bool:
+    """
+    Searches every readable memory mapping of a process for a byte string.
+
+    :param pid: The process to scan. It must be a child of this process, or ptrace access must be allowed.
+    :param needle: The bytes to look for.
+    :return: True if the bytes were found anywhere in the process memory.
+    """
+    with open(f"/proc/{pid}/maps", "r") as maps, open(f"/proc/{pid}/mem", "rb", 0) as memory:
+        for line in maps:
+            match = re.match(r"([0-9a-f]+)-([0-9a-f]+) (r)\S* \S+ \S+ \S+\s*(\S*)", line)
+
+            if match is None or match.group(4) in ("[vvar]", "[vsyscall]"):
+                continue
+
+            start, end = int(match.group(1), 16), int(match.group(2), 16)
+
+            try:
+                memory.seek(start)
+                if needle in memory.read(end - start):
+                    return True
+            except (OSError, OverflowError, ValueError):
+                continue
+
+    return False
+
+
+class TestSecretBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.key: bytes = Fernet.generate_key()
+        self.session: VaultSession = VaultSession(self.key)
+
+    def test_decrypt_into_matches_fernet(self):
+        for password in ["", "a", "x" * 15, "y" * 16, "z" * 17, "Pässwörd-🔑", "p" * 1000]:
+            token: str = Fernet(self.key).encrypt(password.encode()).decode()
+
+            with self.session.decrypt_into(token) as secret:
+                self.assertEqual(password, secret.reveal())
+                self.assertEqual(password.encode(), secret.view().tobytes())
+
+    def test_decrypt_into_reuses_buffer(self):
+        secret: SecretBuffer = SecretBuffer()
+        long_token: str = self.session.encrypt("a much longer password than the next one")
+
+        first: SecretBuffer = self.session.decrypt_into(long_token, secret)
+        second: SecretBuffer = self.session.decrypt_into(self.session.encrypt("short"), secret)
+
+        self.assertIs(secret, first)
+        self.assertIs(secret, second)
+        self.assertEqual("short", secret.reveal())
+        # ASSERT: The rest of the previous secret was wiped
+        self.assertEqual(bytes(len(secret._buffer) - 5), bytes(secret._buffer[5:]))
+
+    def test_decrypt_into_rejects_bad_tokens(self):
+        token: str = self.session.encrypt("Password123!")
+        tampered: str = token[:-6] + ("A" if token[-6] != "A" else "B") + token[-5:]
+        other_key: str = Fernet(Fernet.generate_key()).encrypt(b"Password123!").decode()
+
+        for bad_token in [tampered, other_key, "corrupt", "", "gAAAAA=="]:
+            with self.assertRaises(InvalidToken):
+                self.session.decrypt_into(bad_token)
+
+    def test_wipe(self):
+        secret: SecretBuffer = SecretBuffer.from_bytes(b"Password123!")
+        buffer: bytearray = secret._buffer
+        secret.wipe()
+
+        self.assertEqual(bytes(12), bytes(buffer))
+        self.assertEqual(0, len(secret))
+        self.assertEqual("", secret.reveal())
+
+    def test_repr_hides_secret(self):
+        self.assertEqual("SecretBuffer(<12 bytes>)", repr(SecretBuffer.from_bytes(b"Password123!")))
+
+    def test_lock_wipes_raw_key(self):
+        raw_key: bytearray = self.session._raw_key
+        self.session.lock()
+
+        self.assertEqual(bytes(32), bytes(raw_key))
+
+    def test_fernet_decrypt_into_without_session(self):
+        token: str = Fernet(self.key).encrypt(b"Password123!").decode()
+        raw_key: bytearray = bytearray(base64.urlsafe_b64decode(self.key))
+
+        self.assertEqual("Password123!", fernet_decrypt_into(raw_key, token).reveal())
+
+
+@unittest.skipUnless(os.path.exists("/proc/self/mem"), "Needs /proc to scan process memory")
+class TestSecretMemoryScan(unittest.TestCase):
+    """
+    Decrypts a random password in a child process and scans the child's memory for the plaintext afterwards.
+    The plaintext never exists in the child except inside the decryption result.
+    """
+
+    def run_and_scan(self, mode: str) -> bool:
+        password: bytes = os.urandom(16).hex().encode()
+        key: bytes = Fernet.generate_key()
+        token: bytes = Fernet(key).encrypt(password)
+        child = subprocess.Popen([sys.executable, "-c", DECRYPT_SCRIPT], cwd=REPO_ROOT,
+                                 env=dict(os.environ, PYTHONPATH=REPO_ROOT), stdin=subprocess.PIPE,
+                                 stdout=subprocess.PIPE)
+
+        try:
+            child.stdin.write(b"%s %s %s\n" % (key, token, mode.encode()))
+            child.stdin.flush()
+            self.assertEqual(b"ready", child.stdout.readline().strip())
+
+            try:
+                return process_memory_contains(child.pid, password)
+            except PermissionError:
+                self.skipTest("Not allowed to read the memory of a child process")
+
+        finally:
+            child.kill()
+            child.wait()
+            child.stdin.close()
+            child.stdout.close()
+
+    def test_plaintext_string_is_found(self):
+        # ASSERT: Control case, proves the scan can see a decrypted str that is still alive
+        self.assertTrue(self.run_and_scan("str"))
+
+    def test_wiped_buffer_leaves_no_plaintext(self):
+        self.assertFalse(self.run_and_scan("buffer"))
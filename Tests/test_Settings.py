@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from Application.Utils.Settings import Settings, SettingsLoadError
+
+SETTINGS_PATH = "Application.Utils.Settings"
+
+
+class TestSettings(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.temp_dir.name, "Settings.json")
+        self.write_file({"app_password": {"password": "hash"}, "settings": {"autofill": "user"}})
+
+    def write_file(self, data: dict) -> None:
+        with open(self.path, "w") as file:
+            json.dump(data, file)
+
+    def read_file(self) -> dict:
+        with open(self.path, "r") as file:
+            return json.load(file)
+
+    def test_reads_served_from_memory(self):
+        settings: Settings = Settings(self.path)
+
+        with patch("builtins.open") as mock_open_file:
+            self.assertEqual("user", settings.get("settings", "autofill"))
+            self.assertEqual("hash", settings.get("app_password", "password"))
+
+        mock_open_file.assert_not_called()
+
+    def test_get_missing_setting(self):
+        settings: Settings = Settings(self.path)
+
+        self.assertIsNone(settings.get("settings", "theme"))
+        self.assertEqual("light", settings.get("theme", "name", "light"))
+
+    def test_missing_file(self):
+        settings: Settings = Settings(os.path.join(self.temp_dir.name, "Missing.json"))
+
+        self.assertFalse(settings.exists)
+        self.assertIsNone(settings.get("settings", "autofill"))
+
+    @patch(f"{SETTINGS_PATH}.log_error_and_method")
+    def test_corrupt_file(self, mock_logging):
+        with open(self.path, "w") as file:
+            file.write("{not json")
+
+        settings: Settings = Settings(self.path)
+
+        self.assertIsNone(settings.get("settings", "autofill"))
+        mock_logging.assert_called_once()
+
+    @patch(f"{SETTINGS_PATH}.log_error_and_method")
+    def test_corrupt_file_not_overwritten(self, _mock_logging):
+        with open(self.path, "w") as file:
+            file.write("{not json")
+
+        settings: Settings = Settings(self.path, save_delay=0)
+
+        self.assertIsInstance(settings.load_error, ValueError)
+        self.assertRaises(SettingsLoadError, settings.set, "settings", "autofill", "other", immediate=True)
+        self.assertRaises(SettingsLoadError, settings.remove, "app_password", "password")
+        settings.flush()
+
+        with open(self.path, "r") as file:
+            self.assertEqual("{not json", file.read())
+
+    def test_reloads_after_external_change(self):
+        settings: Settings = Settings(self.path)
+        self.write_file({"settings": {"autofill": "other"}})
+        os.utime(self.path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+        self.assertEqual("other", settings.get("settings", "autofill"))
+
+    def test_set_immediate_writes_atomically(self):
+        settings: Settings = Settings(self.path)
+        settings.set("settings", "autofill", "new", immediate=True)
+
+        self.assertEqual({"app_password": {"password": "hash"}, "settings": {"autofill": "new"}}, self.read_file())
+        self.assertEqual(["Settings.json"], os.listdir(self.temp_dir.name))
+
+    def test_remove(self):
+        settings: Settings = Settings(self.path)
+        settings.remove("settings", "autofill", immediate=True)
+        settings.remove("settings", "missing", immediate=True)
+
+        self.assertIsNone(settings.get("settings", "autofill"))
+        self.assertEqual({"app_password": {"password": "hash"}, "settings": {}}, self.read_file())
+
+    def test_debounced_writes_are_coalesced(self):
+        settings: Settings = Settings(self.path, save_delay=60)
+
+        with patch(f"{SETTINGS_PATH}.os.replace", wraps=os.replace) as mock_replace:
+            settings.set("settings", "autofill", "first")
+            settings.set("settings", "autofill", "second")
+            settings.set("settings", "theme", "dark")
+
+            # ASSERT: Nothing is written until the delay elapses or the settings are flushed
+            self.assertEqual("user", self.read_file()["settings"]["autofill"])
+            self.assertEqual("second", settings.get("settings", "autofill"))
+
+            settings.flush()
+
+        mock_replace.assert_called_once()
+        self.assertEqual({"autofill": "second", "theme": "dark"}, self.read_file()["settings"])
+
+    def test_debounced_write_saves_after_delay(self):
+        settings: Settings = Settings(self.path, save_delay=0.01)
+        settings.set("settings", "autofill", "new")
+        settings._timer.join(5)
+
+        self.assertEqual("new", self.read_file()["settings"]["autofill"])
+
+    def test_failed_write_keeps_original_file(self):
+        settings: Settings = Settings(self.path)
+
+        with patch(f"{SETTINGS_PATH}.json.dump", side_effect=TypeError), self.assertRaises(TypeError):
+            settings.set("settings", "autofill", "new", immediate=True)
+
+        self.assertEqual("user", self.read_file()["settings"]["autofill"])
+        self.assertEqual(["Settings.json"], os.listdir(self.temp_dir.name))
+
+    def test_creates_file(self):
+        path: str = os.path.join(self.temp_dir.name, "Data", "Settings.json")
+        settings: Settings = Settings(path)
+        settings.set("app_password", "password", "hash", immediate=True)
+
+        self.assertTrue(settings.exists)
+        self.assertTrue(os.path.exists(path))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
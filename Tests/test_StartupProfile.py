@@ -0,0 +1,46 @@
+import subprocess
+import sys
+import unittest
+
+from Application.Utils.StartupProfile import ImportTime, StartupReport, parse_importtime, format_report, REPO_ROOT
+
+IMPORTTIME_OUTPUT = [
+    "import time: self [us] | cumulative | imported package\n",
+    "import time:       287 |        287 |   _tkinter\n",
+    "import time:      4971 |       5258 | tkinter\n",
+    "Some other warning\n",
+    "import time:       591 |        591 |     Application.Utils.TaskRunner\n",
+]
+
+
+class TestStartupProfile(unittest.TestCase):
+
+    def test_parse_importtime(self):
+        imports: list[ImportTime] = parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual([ImportTime("_tkinter", 287, 287, 1), ImportTime("tkinter", 4971, 5258, 0),
+                          ImportTime("Application.Utils.TaskRunner", 591, 591, 2)], imports)
+
+    def test_format_report_orders_by_cumulative_time(self):
+        report: StartupReport = StartupReport(0.25, parse_importtime(IMPORTTIME_OUTPUT))
+        lines: list[str] = format_report(report, limit=2).splitlines()
+
+        self.assertEqual("Time to first frame: 250.0 ms", lines[0])
+        self.assertEqual("Imports: 3 modules, 5.3 ms", lines[1])
+        self.assertTrue(lines[3].endswith("tkinter"))
+        self.assertTrue(lines[4].endswith("    Application.Utils.TaskRunner"))
+        self.assertEqual(5, len(lines))
+
+    def test_format_report_without_display(self):
+        self.assertIn("n/a", format_report(StartupReport(None, [])).splitlines()[0])
+
+    def test_parent_window_import_is_lazy(self):
+        code: str = ("import sys, Application.Views.ParentWindow; "
+                     "print(' '.join(name for name in sys.modules if name.startswith(("
+                     "'cryptography', 'Application.Views.HomeFrame', 'Application.Views.PasswordFrame', "
+                     "'Application.Views.ResetFrame', 'Application.Views.AuditFrame'))))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True,
+                                check=True)
+
+        # ASSERT: Only the login screen is imported eagerly
+        self.assertEqual("", result.stdout.strip())
@@ -0,0 +1,72 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from Application.Utils.TaskRunner import TaskRunner
+
+
+class TestTaskRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduled: list = []
+        self.busy_changes: list[bool] = []
+        self.progress: list[tuple[int, int]] = []
+        self.runner: TaskRunner = TaskRunner(lambda delay, callback: self.scheduled.append(callback),
+                                             on_busy_change=self.busy_changes.append,
+                                             on_progress=lambda done, total: self.progress.append((done, total)))
+
+    def run_scheduled(self) -> None:
+        while self.scheduled:
+            self.scheduled.pop(0)()
+
+    def test_on_done_receives_result(self):
+        on_done = MagicMock()
+
+        self.assertTrue(self.runner.submit(pow, 2, 10, on_done=on_done))
+        self.run_scheduled()
+
+        on_done.assert_called_once_with(1024)
+        self.assertFalse(self.runner.busy)
+        self.assertEqual([True, False], self.busy_changes)
+
+    def test_on_error_receives_exception(self):
+        on_done = MagicMock()
+        on_error = MagicMock()
+
+        self.runner.submit(int, "not a number", on_done=on_done, on_error=on_error)
+        self.run_scheduled()
+
+        on_done.assert_not_called()
+        self.assertIsInstance(on_error.call_args.args[0], ValueError)
+
+    def test_submit_ignored_while_busy(self):
+        release = threading.Event()
+        on_done = MagicMock()
+
+        self.assertTrue(self.runner.submit(release.wait, on_done=on_done))
+        self.assertFalse(self.runner.submit(pow, 2, 10, on_done=on_done))
+        release.set()
+        self.run_scheduled()
+
+        on_done.assert_called_once_with(True)
+
+    def test_callbacks_run_on_calling_thread(self):
+        threads: list[threading.Thread] = []
+
+        self.runner.submit(threading.current_thread, on_done=lambda worker: threads.append(worker))
+        self.run_scheduled()
+
+        self.assertIsNot(threading.current_thread(), threads[0])
+
+    def test_progress_delivered_on_poll(self):
+        def task(report):
+            report(1, 2)
+            report(2, 2)
+
+        self.runner.submit(task, self.runner.report_progress)
+        self.run_scheduled()
+
+        self.assertEqual((2, 2), self.progress[-1])
+
+    def tearDown(self):
+        self.runner.shutdown()
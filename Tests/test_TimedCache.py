@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch
+
+from Application.Utils.TimedCache import TimedCache
+
+CACHE_PATH = "Application.Utils.TimedCache"
+
+
+class TestTimedCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache: TimedCache[str, str] = TimedCache(ttl=30, max_size=2)
+
+    def test_get_missing_key(self):
+        self.assertIsNone(self.cache.get("Facebook"))
+
+    @patch(f"{CACHE_PATH}.time.monotonic", return_value=100)
+    def test_get_before_expiry(self, mock_monotonic):
+        self.cache.put("Facebook", "password")
+        mock_monotonic.return_value = 129
+
+        self.assertEqual("password", self.cache.get("Facebook"))
+
+    @patch(f"{CACHE_PATH}.time.monotonic", return_value=100)
+    def test_get_after_expiry(self, mock_monotonic):
+        self.cache.put("Facebook", "password")
+        mock_monotonic.return_value = 130
+
+        self.assertIsNone(self.cache.get("Facebook"))
+        self.assertEqual(0, len(self.cache))
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put("a", "1")
+        self.cache.put("b", "2")
+        self.cache.get("a")
+        self.cache.put("c", "3")
+
+        self.assertEqual("1", self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual("3", self.cache.get("c"))
+
+    def test_pop_and_clear(self):
+        self.cache.put("a", "1")
+        self.cache.put("b", "2")
+
+        self.assertEqual("1", self.cache.pop("a"))
+        self.assertIsNone(self.cache.pop("a"))
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+
+    @patch(f"{CACHE_PATH}.time.monotonic", return_value=100)
+    def test_on_evict_receives_dropped_values(self, mock_monotonic):
+        evicted: list[str] = []
+        cache: TimedCache[str, str] = TimedCache(ttl=30, max_size=2, on_evict=evicted.append)
+
+        cache.put("a", "1")
+        cache.put("a", "2")
+        cache.put("b", "3")
+        cache.put("c", "4")
+        mock_monotonic.return_value = 130
+        cache.purge()
+
+        self.assertEqual(["1", "2", "3", "4"], evicted)
+
+    def test_on_evict_on_clear_but_not_pop(self):
+        evicted: list[str] = []
+        cache: TimedCache[str, str] = TimedCache(ttl=30, on_evict=evicted.append)
+        cache.put("a", "1")
+        cache.put("b", "2")
+
+        self.assertEqual("1", cache.pop("a"))
+        cache.clear()
+        self.assertEqual(["2"], evicted)
@@ -0,0 +1,167 @@
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from Application.Utils.KeyDerivation import KdfParams
+from Application.Utils.Settings import Settings
+from Application.Utils.Vault import Vault, VaultKeyError, hash_password
+from Application.Utils.VaultAudit import AuditResult
+
+VAULT_PATH = "Application.Utils.Vault"
+
+
+class TestVault(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patches = [patch(f"{VAULT_PATH}.BCRYPT_ROUNDS", 4),
+                   patch(f"{VAULT_PATH}.calibrate", side_effect=lambda target: KdfParams(10, 8, 1, "c2FsdHNhbHQ="))]
+
+        for active_patch in patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+
+        self.vault: Vault = self.new_vault("main")
+        self.vault.create("ValidPassword123!")
+
+    def new_vault(self, name: str) -> Vault:
+        data_dir: str = os.path.join(self.temp_dir.name, name)
+        vault: Vault = Vault(data_dir, settings=Settings(os.path.join(data_dir, "Settings.json"), save_delay=0))
+        self.addCleanup(vault.close)
+        return vault
+
+    def test_files_live_in_data_dir(self):
+        self.vault.put_many([("site", "user", "pwd")])
+        self.vault.close()
+
+        self.assertEqual({"Creds.db", "Settings.json"},
+                         {name for name in os.listdir(self.vault.data_dir) if not name.startswith("Creds.db-")})
+
+    def test_open_without_key(self):
+        vault: Vault = self.new_vault("keyless")
+        vault.settings.set("app_password", "password", hash_password("ValidPassword123!"), immediate=True)
+        vault.store.put("site", "user", "token")
+
+        # ASSERT: A new key could not decrypt the stored entries, so none is generated
+        with self.assertRaises(VaultKeyError):
+            vault.open("ValidPassword123!")
+
+        self.assertFalse(vault.session.is_unlocked)
+        self.assertIsNone(vault.settings.get("vault", "wrapped_key"))
+
+        vault.store.delete("site")
+        self.assertTrue(vault.open("ValidPassword123!"))
+        self.assertIsNotNone(vault.settings.get("vault", "wrapped_key"))
+
+    def test_put_get_delete_many(self):
+        self.assertEqual(3, self.vault.put_many([("a", "user1", "pwd1"), ("b", "user2", "pwd2"),
+                                                 ("c", "user3", "pwd3")]))
+
+        self.assertEqual({"a": {"username": "user1", "password": "pwd1"},
+                          "c": {"username": "user3", "password": "pwd3"}}, self.vault.get_many(["a", "c", "missing"]))
+        self.assertIn("a", self.vault.index)
+        self.assertEqual(2, self.vault.delete_many(["a", "b", "missing"]))
+        self.assertEqual([("c", {"username": "user3", "password": "pwd3"})], list(self.vault.iter_entries()))
+        self.assertNotIn("a", self.vault.index)
+
+    def test_put_many_stores_ciphertext(self):
+        self.vault.put_many([("a", "user", "Password123!")])
+
+        self.assertNotIn("Password123!", self.vault.store.get("a")["password"])
+        self.assertEqual("Password123!", self.vault.get_secret("a").reveal())
+        self.assertIsNone(self.vault.get_secret("missing"))
+
+    def test_iter_entries_batches_and_skips_corrupt(self):
+        self.vault.put_many((f"site{i}", f"user{i}", f"pwd{i}") for i in range(5))
+        self.vault.put_many([("site5", "user5", "corrupt")], encrypted=True)
+
+        with self.assertLogs(level="WARNING"):
+            entries: list = list(self.vault.iter_entries(batch_size=2))
+
+        self.assertEqual([(f"site{i}", {"username": f"user{i}", "password": f"pwd{i}"}) for i in range(5)], entries)
+
+    def test_audit(self):
+        self.vault.put_many([("a", "user", "Shared#Pass9word"), ("b", "user", "password"),
+                             ("c", "user", "Shared#Pass9word")])
+        progress = MagicMock()
+        result: AuditResult = self.vault.audit(progress)
+
+        self.assertEqual((3, [[("a", "user"), ("c", "user")]]), result[:2])
+        self.assertEqual([("b", "user")], [entry[:2] for entry in result.weak])
+        progress.assert_called_once_with(3, 3)
+
+    def test_several_accounts_per_site(self):
+        self.vault.put_many([("GitHub", "work", "work password"), ("GitHub", "home", "home password")])
+        entry_id: int = self.vault.add_entry("GitHub", "bot", "bot password", tags=["ci"])
+
+        self.assertEqual({"username": "home", "password": "home password"}, self.vault.get_account("GitHub", "home"))
+        self.assertEqual(["bot", "home", "work"], [entry.username for entry in self.vault.find_entries("GitHub")])
+        self.assertEqual("work password", self.vault.get_secret("GitHub", username="work").reveal())
+        self.assertEqual(["GitHub"], self.vault.search("git"))
+
+        # ASSERT: The site stays searchable until its last account is removed
+        self.assertTrue(self.vault.delete_entry(entry_id))
+        self.assertEqual(["GitHub"], self.vault.search("git"))
+        self.assertEqual(2, self.vault.delete_many(["GitHub"]))
+        self.assertEqual([], self.vault.search("git"))
+
+    def test_breach_index(self):
+        source: str = os.path.join(self.temp_dir.name, "breaches.txt")
+        self.vault.put_many([("a", "user", "Shared#Pass9word"), ("b", "user", "xQ7#k2Lp9!vR4&hW")])
+        self.assertIsNone(self.vault.breach_count("password"))
+
+        with open(source, "w") as file:
+            file.write("5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8:3861493\n"
+                       f"{hashlib.sha1(b'Shared#Pass9word').hexdigest()}:2\n")
+
+        self.assertEqual(2, self.vault.import_breaches(source))
+        self.assertEqual(3861493, self.vault.breach_count("password"))
+        self.assertEqual([("a", "user", 2)], self.vault.audit().breached)
+        self.assertIn("Breaches.idx", os.listdir(self.vault.data_dir))
+
+    def test_vaults_are_independent(self):
+        other: Vault = self.new_vault("other")
+        other.create("OtherPassword123!")
+        self.vault.put_many([("shared", "main", "pwd1")])
+        other.put_many([("shared", "other", "pwd2")])
+
+        self.assertEqual("main", self.vault.get_many(["shared"])["shared"]["username"])
+        self.assertEqual("other", other.get_many(["shared"])["shared"]["username"])
+
+        other.lock()
+        self.assertTrue(self.vault.session.is_unlocked)
+        self.assertFalse(other.open("ValidPassword123!"))
+        self.assertTrue(other.open("OtherPassword123!"))
+
+    def test_reopen_from_another_working_directory(self):
+        self.vault.put_many([("site", "user", "pwd")])
+        self.vault.close()
+        reopened: Vault = Vault(os.path.abspath(self.vault.data_dir))
+        self.addCleanup(reopened.close)
+
+        cwd: str = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+
+        self.assertTrue(reopened.open("ValidPassword123!"))
+        self.assertEqual({"site": {"username": "user", "password": "pwd"}}, reopened.get_many(["site"]))
+
+    def test_concurrent_writers(self):
+        def write(worker: int) -> None:
+            for batch in range(5):
+                self.vault.put_many((f"w{worker}-{batch}-{i}", "user", "pwd") for i in range(20))
+
+        self.assertEqual(0, len(self.vault.index))
+        threads: list[threading.Thread] = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(400, len(self.vault.store))
+        self.assertEqual(400, len(self.vault.index))
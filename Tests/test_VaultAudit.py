@@ -0,0 +1,81 @@
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock
+
+from Application.Utils.PasswordStrength import analyze
+from Application.Utils.VaultAudit import AuditResult, BreachedEntry, WeakEntry, audit_entries, describe_issues
+
+STRONG = "xQ7#k2Lp9!vR4&hW"
+
+
+def entries(passwords: dict[str, str]):
+    return ((site, {"username": "user", "password": password}) for site, password in passwords.items())
+
+
+class TestVaultAudit(unittest.TestCase):
+
+    def test_reused_groups(self):
+        passwords: dict[str, str] = {"a": STRONG, "b": "Other#Pass9word", "c": STRONG, "d": "Unique$Pass77wd",
+                                     "e": "Other#Pass9word", "f": STRONG}
+        result: AuditResult = audit_entries(entries(passwords), batch_size=2)
+
+        self.assertEqual(6, result.checked)
+        self.assertEqual([[("a", "user"), ("c", "user"), ("f", "user")], [("b", "user"), ("e", "user")]],
+                         result.reused)
+        self.assertEqual(5, result.reused_entries)
+
+    def test_reused_within_site(self):
+        result: AuditResult = audit_entries([("a", {"username": "home", "password": STRONG}),
+                                             ("a", {"username": "work", "password": STRONG}),
+                                             ("b", {"username": "home", "password": "Other#Pass9word"})])
+
+        # ASSERT: Two accounts on one site sharing a password are reported, each under its own username
+        self.assertEqual([[("a", "home"), ("a", "work")]], result.reused)
+
+    def test_breached_entries(self):
+        breaches = MagicMock()
+        breaches.count_many.side_effect = lambda passwords: [{"password": 9, STRONG: 0}.get(pw, 1) for pw in passwords]
+        result: AuditResult = audit_entries(entries({"a": STRONG, "b": "password", "c": "Other#Pass9word"}),
+                                            breaches=breaches, batch_size=2)
+
+        self.assertEqual([BreachedEntry("b", "user", 9), BreachedEntry("c", "user", 1)], result.breached)
+        self.assertEqual([], audit_entries(entries({"b": "password"})).breached)
+
+    def test_weak_entries(self):
+        result: AuditResult = audit_entries(entries({"a": STRONG, "b": "password", "c": "aaaaaaaa", "d": "Zx9"}))
+
+        self.assertEqual({"b": ("common word",), "c": ("repeated characters",), "d": ("too short",)},
+                         {entry.site: entry.issues for entry in result.weak})
+        self.assertEqual(sorted(entry.entropy_bits for entry in result.weak),
+                         [entry.entropy_bits for entry in result.weak])
+
+    def test_result_holds_no_plaintext(self):
+        passwords: dict[str, str] = {"a": "password", "b": "password", "c": "qwerty123"}
+        result: AuditResult = audit_entries(entries(passwords))
+
+        for password in passwords.values():
+            self.assertNotIn(password, repr(result))
+
+    def test_progress(self):
+        progress = MagicMock()
+        audit_entries(entries({f"site{i}": STRONG for i in range(5)}), total=5, progress=progress, batch_size=2)
+
+        self.assertEqual([(2, 5), (4, 5), (5, 5)], [call.args for call in progress.call_args_list])
+
+    def test_memory_bounded_by_batch(self):
+        def peak_memory(count: int) -> int:
+            tracemalloc.reset_peak()
+            audit_entries((f"site{i:06}", {"username": "user", "password": f"{i:06}" + "x" * 2000})
+                          for i in range(count))
+            return tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+
+        # ASSERT: Four times the plaintext (6 MB more) passes through, but only one batch of it is held at a time
+        self.assertLess(peak_memory(4000) - peak_memory(1000), 2_000_000)
+
+    def test_describe_issues(self):
+        self.assertEqual(("too short", "sequence"), describe_issues(analyze("abc")))
+        self.assertEqual(("few character types",), describe_issues(analyze("40275916")))
+        self.assertIsInstance(audit_entries(entries({"a": "40275916"})).weak[0], WeakEntry)
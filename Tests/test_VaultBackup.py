@@ -0,0 +1,145 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from cryptography.fernet import Fernet
+
+from Application.Utils.CredentialStore import SqliteCredentialStore
+from Application.Utils.VaultBackup import (BackupError, CODEC_ZLIB, FLAG_FINAL, HEADER, LENGTH, MAGIC, write_backup,
+                                           write_chunk, restore_backup)
+from Application.Utils.VaultSession import VaultSession
+
+BACKUP_PATH = "Application.Utils.VaultBackup"
+
+
+@patch(f"{BACKUP_PATH}.CHUNK_ENTRIES", 2)
+class TestVaultBackup(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.session: VaultSession = VaultSession(Fernet.generate_key())
+        self.source: SqliteCredentialStore = SqliteCredentialStore(os.path.join(self.temp_dir.name, "Source.db"))
+        self.target: SqliteCredentialStore = SqliteCredentialStore(os.path.join(self.temp_dir.name, "Target.db"))
+        self.backup_path: str = os.path.join(self.temp_dir.name, "vault.spmb")
+
+        for index in range(5):
+            self.source.put(f"site{index}", f"user{index}", self.session.encrypt(f"pwd{index}"))
+
+    def read_backup(self) -> bytes:
+        with open(self.backup_path, "rb") as file:
+            return file.read()
+
+    def write_raw(self, data: bytes) -> None:
+        with open(self.backup_path, "wb") as file:
+            file.write(data)
+
+    def assert_restore_fails(self):
+        self.target.put("existing", "user", "token")
+
+        with self.assertRaises(BackupError):
+            restore_backup(self.backup_path, self.target, self.session)
+
+        self.assertEqual([("existing", {"username": "user", "password": "token"})], list(self.target.items()))
+
+    def test_round_trip(self):
+        self.assertEqual(5, write_backup(self.backup_path, self.source, self.session))
+        self.assertEqual(5, restore_backup(self.backup_path, self.target, self.session))
+
+        self.assertEqual(list(self.source.items()), list(self.target.items()))
+
+    def test_round_trip_keeps_entry_fields(self):
+        self.source.add_entry("site0", "admin", self.session.encrypt("admin"), tags=["work", "ci"],
+                              notes="Shared login", created=1000.0)
+        write_backup(self.backup_path, self.source, self.session)
+
+        self.assertEqual(6, restore_backup(self.backup_path, self.target, self.session))
+
+        restored = self.target.find(site="site0")
+        self.assertEqual([("admin", ("ci", "work"), "Shared login", 1000.0), ("user0", (), "", restored[1].created)],
+                         [(entry.username, entry.tags, entry.notes, entry.created) for entry in restored])
+        self.assertEqual([entry[1:4] for entry in self.source.entries()],
+                         [entry[1:4] for entry in self.target.entries()])
+
+    def test_restore_version_1_backup(self):
+        lines: list[str] = [json.dumps({"site": site, **creds}) for site, creds in self.source.items()]
+
+        with open(self.backup_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, 1, CODEC_ZLIB))
+            write_chunk(file, self.session, CODEC_ZLIB, 0, 0, "\n".join(lines).encode())
+            write_chunk(file, self.session, CODEC_ZLIB, 1, FLAG_FINAL, json.dumps({"entries": 5}).encode())
+
+        self.assertEqual(5, restore_backup(self.backup_path, self.target, self.session))
+        self.assertEqual(list(self.source.items()), list(self.target.items()))
+
+    def test_empty_vault(self):
+        empty: SqliteCredentialStore = SqliteCredentialStore(os.path.join(self.temp_dir.name, "Empty.db"))
+
+        self.assertEqual(0, write_backup(self.backup_path, empty, self.session))
+        self.assertEqual(0, restore_backup(self.backup_path, self.target, self.session))
+        empty.close()
+
+    def test_backup_hides_site_names(self):
+        write_backup(self.backup_path, self.source, self.session)
+
+        self.assertNotIn(b"site0", self.read_backup())
+
+    def test_no_temp_file_left(self):
+        write_backup(self.backup_path, self.source, self.session)
+
+        self.assertEqual(["Source.db", "Target.db", "vault.spmb"],
+                         sorted(name for name in os.listdir(self.temp_dir.name) if not name.endswith(("-wal", "-shm"))))
+
+    def test_truncated_backup_rolls_back(self):
+        write_backup(self.backup_path, self.source, self.session)
+
+        self.write_raw(self.read_backup()[:-10])
+        self.assert_restore_fails()
+
+    def test_missing_final_chunk_rolls_back(self):
+        write_backup(self.backup_path, self.source, self.session)
+        data: bytes = self.read_backup()
+        offsets: list[int] = []
+        position: int = HEADER.size
+
+        while position < len(data):
+            offsets.append(position)
+            position += LENGTH.size + LENGTH.unpack_from(data, position)[0]
+
+        self.write_raw(data[:offsets[-1]])
+        self.assert_restore_fails()
+
+    def test_tampered_backup_rolls_back(self):
+        write_backup(self.backup_path, self.source, self.session)
+        data: bytearray = bytearray(self.read_backup())
+        data[-20] ^= 1
+
+        self.write_raw(bytes(data))
+        self.assert_restore_fails()
+
+    def test_reordered_chunks_roll_back(self):
+        write_backup(self.backup_path, self.source, self.session)
+        data: bytes = self.read_backup()
+        first_end: int = HEADER.size + LENGTH.size + LENGTH.unpack_from(data, HEADER.size)[0]
+        second_end: int = first_end + LENGTH.size + LENGTH.unpack_from(data, first_end)[0]
+
+        self.write_raw(data[:HEADER.size] + data[first_end:second_end] + data[HEADER.size:first_end]
+                       + data[second_end:])
+        self.assert_restore_fails()
+
+    def test_wrong_key_rolls_back(self):
+        write_backup(self.backup_path, self.source, self.session)
+        self.session = VaultSession(Fernet.generate_key())
+
+        self.assert_restore_fails()
+
+    def test_not_a_backup(self):
+        self.write_raw(b"{}")
+
+        self.assert_restore_fails()
+
+    def tearDown(self):
+        self.source.close()
+        self.target.close()
+        self.temp_dir.cleanup()
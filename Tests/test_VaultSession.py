@@ -0,0 +1,141 @@
+import unittest
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from Application.Utils.VaultSession import VaultSession, VaultLockedError, DecryptBatch, PARALLEL_THRESHOLD
+
+
+class TestVaultSession(unittest.TestCase):
+
+    def setUp(self):
+        self.key: bytes = Fernet.generate_key()
+        self.session: VaultSession = VaultSession(self.key)
+
+    def test_encrypt_decrypt_round_trip(self):
+        encrypted: str = self.session.encrypt("Password123!")
+
+        self.assertNotEqual("Password123!", encrypted)
+        self.assertEqual("Password123!", self.session.decrypt(encrypted))
+
+    def test_decrypt_token_from_same_key(self):
+        encrypted: str = Fernet(self.key).encrypt(b"Password123!").decode()
+
+        self.assertEqual("Password123!", self.session.decrypt(encrypted))
+
+    def test_decrypt_wrong_key(self):
+        encrypted: str = Fernet(Fernet.generate_key()).encrypt(b"Password123!").decode()
+
+        with self.assertRaises(InvalidToken):
+            self.session.decrypt(encrypted)
+
+    def test_decrypt_many_keeps_order(self):
+        passwords: list[str] = ["one", "two", "three"]
+        encrypted: list[str] = [self.session.encrypt(password) for password in passwords]
+
+        self.assertEqual(passwords, self.session.decrypt_many(encrypted))
+
+    def test_decrypt_many_raises_on_corrupt_token(self):
+        encrypted: list[str] = [self.session.encrypt("one"), "corrupt"]
+
+        with self.assertRaises(InvalidToken):
+            self.session.decrypt_many(encrypted)
+
+    def test_decrypt_batch_reports_failures(self):
+        encrypted: list[str] = [self.session.encrypt("one"), "corrupt", self.session.encrypt("three")]
+        batch: DecryptBatch = self.session.decrypt_batch(encrypted)
+
+        self.assertEqual(["one", None, "three"], batch.passwords)
+        self.assertEqual([1], list(batch.failures))
+        self.assertIsInstance(batch.failures[1], InvalidToken)
+
+    def assert_parallel_batch(self, session: VaultSession):
+        passwords: list[str] = [f"password{i}" for i in range(PARALLEL_THRESHOLD + 100)]
+        encrypted: list[str] = [self.session.encrypt(password) for password in passwords]
+        encrypted[PARALLEL_THRESHOLD] = "corrupt"
+        batch: DecryptBatch = session.decrypt_batch(encrypted)
+
+        passwords[PARALLEL_THRESHOLD] = None
+        self.assertEqual(passwords, batch.passwords)
+        self.assertEqual([PARALLEL_THRESHOLD], list(batch.failures))
+
+    def test_decrypt_batch_thread_pool(self):
+        self.assert_parallel_batch(VaultSession(self.key, workers=4))
+
+    def test_decrypt_batch_process_pool(self):
+        self.assert_parallel_batch(VaultSession(self.key, workers=2, process_threshold=PARALLEL_THRESHOLD))
+
+    def test_encrypt_many_parallel(self):
+        passwords: list[str] = [f"password{i}" for i in range(PARALLEL_THRESHOLD + 100)]
+        encrypted: list[str] = VaultSession(self.key, workers=4).encrypt_many(passwords)
+
+        self.assertEqual(passwords, self.session.decrypt_many(encrypted))
+
+    def test_previous_keys_decrypt_old_tokens(self):
+        new_key: bytes = Fernet.generate_key()
+        old_token: str = self.session.encrypt("old")
+        self.session.unlock(new_key, [self.key])
+        new_token: str = self.session.encrypt("new")
+
+        self.assertTrue(self.session.is_rotating)
+        self.assertEqual(["old", "new"], self.session.decrypt_many([old_token, new_token]))
+        self.assertEqual("old", self.session.decrypt_into(old_token).reveal())
+        # ASSERT: New tokens are written under the new key only
+        self.assertEqual(b"new", Fernet(new_key).decrypt(new_token.encode()))
+
+    def test_rotate_many(self):
+        new_key: bytes = Fernet.generate_key()
+        tokens: list[str] = [self.session.encrypt(f"password{i}") for i in range(3)] + ["corrupt"]
+        self.session.unlock(new_key, [self.key])
+        rotated: list[str | None] = self.session.rotate_many(tokens)
+
+        self.assertIsNone(rotated[-1])
+        self.assertEqual([f"password{i}" for i in range(3)], VaultSession(new_key).decrypt_many(rotated[:-1]))
+
+    def test_rotate_many_parallel(self):
+        new_key: bytes = Fernet.generate_key()
+        tokens: list[str] = self.session.encrypt_many(f"password{i}" for i in range(PARALLEL_THRESHOLD + 100))
+        session: VaultSession = VaultSession(new_key, workers=2, process_threshold=PARALLEL_THRESHOLD)
+        session.unlock(new_key, [self.key])
+
+        rotated: list[str | None] = session.rotate_many(tokens)
+
+        self.assertEqual(self.session.decrypt_many(tokens), VaultSession(new_key).decrypt_many(rotated))
+
+    def test_retire_previous_keys(self):
+        old_token: str = self.session.encrypt("old")
+        self.session.unlock(Fernet.generate_key(), [self.key])
+        previous_key: bytearray = self.session._previous_keys[0]
+        self.session.retire_previous_keys()
+
+        self.assertFalse(self.session.is_rotating)
+        self.assertEqual(bytearray(len(previous_key)), previous_key)
+        with self.assertRaises(InvalidToken):
+            self.session.decrypt(old_token)
+        with self.assertRaises(InvalidToken):
+            self.session.decrypt_into(old_token)
+
+    def test_encrypt_decrypt_bytes(self):
+        self.assertEqual(b"\x00data", self.session.decrypt_bytes(self.session.encrypt_bytes(b"\x00data")))
+
+    def test_new_session_is_locked(self):
+        self.assertFalse(VaultSession().is_unlocked)
+
+    def test_lock_wipes_key(self):
+        key_buffer: bytearray = self.session._key
+        self.session.lock()
+
+        self.assertFalse(self.session.is_unlocked)
+        self.assertEqual(bytearray(len(key_buffer)), key_buffer)
+
+    def test_encrypt_when_locked(self):
+        self.session.lock()
+
+        with self.assertRaises(VaultLockedError):
+            self.session.encrypt("Password123!")
+
+    def test_decrypt_when_locked(self):
+        encrypted: str = self.session.encrypt("Password123!")
+        self.session.lock()
+
+        with self.assertRaises(VaultLockedError):
+            self.session.decrypt(encrypted)
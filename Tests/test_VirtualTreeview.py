@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from Application.Utils.CredentialStore import SqliteCredentialStore
+from Application.Utils.VirtualTreeview import ListRowSource, StoreRowSource
+
+
+class TestStoreRowSource(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store: SqliteCredentialStore = SqliteCredentialStore(os.path.join(self.temp_dir.name, "Creds.db"))
+        self.source: StoreRowSource = StoreRowSource(self.store, "****")
+
+    def test_len(self):
+        self.store.put("a", "user1", "token1")
+        self.store.put("b", "user2", "token2")
+
+        self.assertEqual(2, len(self.source))
+
+    def test_rows_hide_encrypted_password(self):
+        for index in range(5):
+            self.store.put(f"site{index}", f"user{index}", f"token{index}")
+
+        expected: list[tuple] = [("site1", "user1", "****"), ("site2", "user2", "****")]
+        self.assertEqual(expected, self.source.rows(1, 3))
+
+    def test_rows_past_end(self):
+        self.store.put("a", "user1", "token1")
+
+        self.assertEqual([("a", "user1", "****")], self.source.rows(0, 20))
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+
+class TestListRowSource(unittest.TestCase):
+
+    def test_rows(self):
+        source: ListRowSource = ListRowSource([("a", 1), ("b", 2), ("c", 3)])
+
+        self.assertEqual(3, len(source))
+        self.assertEqual([("b", 2), ("c", 3)], source.rows(1, 20))
+        self.assertEqual(0, len(ListRowSource()))